@@ -0,0 +1,285 @@
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+
+# Alvo de duração de cada amostra: abaixo disso a resolução do relógio e o
+# custo da própria chamada dominam a medição.
+ALVO_AMOSTRA_NS = 2_000_000
+ORCAMENTO_PADRAO_NS = 200_000_000
+MIN_AMOSTRAS = 5
+MAX_AMOSTRAS = 1000
+
+class Estatisticas:
+    """Resultado de um benchmark (tempos por chamada, em nanossegundos)"""
+    def __init__(self, nome, amostras_ns, loops):
+        ordenadas = sorted(amostras_ns)
+        self.nome = nome
+        self.loops = loops
+        self.amostras = len(ordenadas)
+        self.minimo = ordenadas[0]
+        self.maximo = ordenadas[-1]
+        self.media = statistics.fmean(ordenadas)
+        self.mediana = statistics.median(ordenadas)
+        self.p95 = percentil(ordenadas, 95)
+        self.desvio = statistics.stdev(ordenadas) if len(ordenadas) > 1 else 0.0
+
+    def como_dict(self):
+        """Representação serializável em JSON"""
+        return {
+            "loops": self.loops,
+            "amostras": self.amostras,
+            "min_ns": self.minimo,
+            "mediana_ns": self.mediana,
+            "p95_ns": self.p95,
+            "max_ns": self.maximo,
+            "media_ns": self.media,
+            "desvio_ns": self.desvio,
+        }
+
+    def __repr__(self):
+        return (f"{self.nome}: min {formatar_ns(self.minimo)}, "
+                f"mediana {formatar_ns(self.mediana)}, p95 {formatar_ns(self.p95)}, "
+                f"desvio {formatar_ns(self.desvio)} "
+                f"({self.amostras} amostras x {self.loops} loops)")
+
+def percentil(ordenadas, p):
+    """Percentil com interpolação linear sobre uma lista já ordenada - O(1)"""
+    if len(ordenadas) == 1:
+        return float(ordenadas[0])
+    posicao = (len(ordenadas) - 1) * p / 100
+    baixo = math.floor(posicao)
+    alto = math.ceil(posicao)
+    fracao = posicao - baixo
+    return ordenadas[baixo] + (ordenadas[alto] - ordenadas[baixo]) * fracao
+
+def formatar_ns(ns):
+    """Formata uma duração em ns na unidade mais legível"""
+    for unidade, escala in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= escala:
+            return f"{ns / escala:.3f}{unidade}"
+    return f"{ns:.1f}ns"
+
+def _executar_loops(func, args, loops):
+    """Executa func(*args) `loops` vezes e retorna a duração total em ns"""
+    contador = time.perf_counter_ns
+    intervalo = range(loops)
+    inicio = contador()
+    for _ in intervalo:
+        func(*args)
+    return contador() - inicio
+
+def calibrar_loops(func, args, alvo_ns=ALVO_AMOSTRA_NS):
+    """Escolhe quantas chamadas cabem em uma amostra de ~alvo_ns"""
+    loops = 1
+    while True:
+        duracao = _executar_loops(func, args, loops)
+        if duracao >= alvo_ns:
+            return loops
+        if duracao <= 0:
+            loops *= 10
+            continue
+        # Estima o fator restante com margem, sem crescer mais que 10x por passo
+        loops = max(loops + 1, min(loops * 10, int(loops * alvo_ns * 1.2 / duracao)))
+
+def medir(func, *args, nome=None, aquecimento=1, orcamento_ns=ORCAMENTO_PADRAO_NS,
+          amostras=None, controlar_gc=True):
+    """Mede func(*args) com aquecimento, repetições automáticas e GC desligado
+
+    O número de loops por amostra é calibrado para que cada amostra dure pelo
+    menos ALVO_AMOSTRA_NS; o número de amostras é escolhido para caber em
+    `orcamento_ns` (limitado entre MIN_AMOSTRAS e MAX_AMOSTRAS) quando não
+    informado. Os tempos reportados são por chamada.
+    """
+    nome = nome or getattr(func, "__name__", repr(func))
+
+    for _ in range(aquecimento):
+        func(*args)
+
+    gc_ativo = gc.isenabled()
+    if controlar_gc:
+        gc.collect()
+        gc.disable()
+    try:
+        loops = calibrar_loops(func, args)
+        if amostras is None:
+            por_amostra = max(_executar_loops(func, args, loops), 1)
+            amostras = int(orcamento_ns // por_amostra)
+            amostras = max(MIN_AMOSTRAS, min(MAX_AMOSTRAS, amostras))
+        tempos = [_executar_loops(func, args, loops) / loops for _ in range(amostras)]
+    finally:
+        if controlar_gc and gc_ativo:
+            gc.enable()
+
+    return Estatisticas(nome, tempos, loops)
+
+def metadados():
+    """Informações do ambiente gravadas junto dos resultados"""
+    return {
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def salvar_json(resultados, caminho):
+    """Grava uma lista de Estatisticas em JSON"""
+    dados = {
+        "metadados": metadados(),
+        "resultados": {r.nome: r.como_dict() for r in resultados},
+    }
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, ensure_ascii=False)
+    return dados
+
+def carregar_json(caminho):
+    """Lê resultados gravados por salvar_json"""
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+def comparar_baseline(resultados, baseline, tolerancia=0.10, metrica="mediana_ns"):
+    """Compara resultados com uma baseline salva
+
+    Retorna a lista de regressões (nome, antes, depois, razão) cujo tempo
+    cresceu mais que `tolerancia` (fração). Entradas ausentes em um dos lados
+    são ignoradas.
+    """
+    anteriores = baseline["resultados"]
+    regressoes = []
+    for r in resultados:
+        if r.nome not in anteriores:
+            continue
+        antes = anteriores[r.nome][metrica]
+        depois = r.como_dict()[metrica]
+        if antes > 0 and depois > antes * (1 + tolerancia):
+            regressoes.append((r.nome, antes, depois, depois / antes))
+    return regressoes
+
+def casos_padrao():
+    """Casos (nome, func, args) cobrindo os algoritmos dos dois módulos"""
+    import random
+    from array import array
+    import algoritmos
+    import estruturas_avancadas as ea
+    from busca import IndiceOrdenado
+    from lista_ordenada import ListaOrdenada, executar_fluxo, fluxo_misto
+    from sequencia import BufferCircular
+    import varredura
+    import fatorial
+    import fibonacci
+    import hanoi
+    import ordenacao
+    import permutacoes
+    import subconjuntos
+    from matriz import Matriz, multiplicar
+
+    gerador = random.Random(42)
+    dados = [gerador.randint(1, 1000) for _ in range(1000)]
+    ordenados = sorted(dados)
+    alvo = ordenados[len(ordenados) // 2]
+    inteiros = [gerador.randint(1, 100) for _ in range(10_000)]
+    matriz = [[gerador.random() for _ in range(30)] for _ in range(30)]
+    fluxo = list(fluxo_misto(10_000))
+
+    def fluxo_lista_ordenada():
+        ordenada = ListaOrdenada()
+        return executar_fluxo(fluxo, ordenada.inserir, ordenada.buscar)
+
+    def construir_pela_frente():
+        sequencia = BufferCircular()
+        for valor in dados:
+            algoritmos.inserir_inicio(sequencia, valor)
+        return sequencia
+
+    def fatorial_frio(n):
+        # Sem os pontos de controle, que fariam a medição ser só um acerto de cache
+        fatorial.limpar_pontos_controle()
+        return algoritmos.factorial(n)
+
+    lista_ligada = ea.ListaLigada()
+    for valor in dados:
+        lista_ligada.inserir_inicio(valor)
+
+    return [
+        ("algoritmos.inserir_inicio", lambda: algoritmos.inserir_inicio(dados.copy(), 0), ()),
+        ("algoritmos.inserir_inicio (BufferCircular)", lambda: algoritmos.inserir_inicio(BufferCircular(dados), 0), ()),
+        ("sequencia.BufferCircular (construção pela frente)", construir_pela_frente, ()),
+        ("algoritmos.busca_linear", algoritmos.busca_linear, (dados, -1)),
+        ("varredura.buscar (array)", varredura.buscar, (array("q", dados), -1)),
+        ("varredura.buscar_varios", varredura.buscar_varios, (dados, ordenados[::100] + [-1])),
+        ("algoritmos.busca_binaria", algoritmos.busca_binaria, (ordenados, alvo)),
+        ("algoritmos.fibonacci_recursivo", algoritmos.fibonacci_recursivo, (18,)),
+        ("algoritmos.fibonacci_iterativo", algoritmos.fibonacci_iterativo, (500,)),
+        ("algoritmos.fibonacci_recursivo_memoizado", algoritmos.fibonacci_recursivo_memoizado.frio, (300,)),
+        ("algoritmos.factorial", fatorial_frio, (300,)),
+        ("fatorial.fatorial_arvore", fatorial.fatorial_arvore, (10_000,)),
+        ("algoritmos.permutacoes", algoritmos.permutacoes, ([1, 2, 3, 4, 5, 6],)),
+        ("algoritmos.multiplicar_matrizes", algoritmos.multiplicar_matrizes, (matriz, matriz)),
+        ("estruturas_avancadas.ListaLigada.buscar", lista_ligada.buscar, (-1,)),
+        ("estruturas_avancadas.ListaLigada.percorrer", lista_ligada.percorrer, ()),
+        ("estruturas_avancadas.busca_binaria_iterativa", ea.busca_binaria_iterativa, (ordenados, alvo)),
+        ("estruturas_avancadas.busca_binaria_recursiva", ea.busca_binaria_recursiva, (ordenados, alvo)),
+        ("estruturas_avancadas.fibonacci_com_memoizacao", ea.fibonacci_com_memoizacao.frio, (300,)),
+        ("estruturas_avancadas.torre_hanoi", lambda: list(ea.torre_hanoi(10)), ()),
+        ("hanoi.movimentos_compactos", hanoi.movimentos_compactos, (20,)),
+        ("estruturas_avancadas.bubble_sort", ea.bubble_sort, (dados[:200],)),
+        ("estruturas_avancadas.merge_sort", ea.merge_sort, (dados,)),
+        ("estruturas_avancadas.percorrer_matriz", ea.percorrer_matriz, (matriz,)),
+        ("estruturas_avancadas.multiplicar_matrizes_otimizada", ea.multiplicar_matrizes_otimizada, (matriz, matriz)),
+        ("estruturas_avancadas.gerar_subconjuntos", ea.gerar_subconjuntos, (list(range(10)),)),
+        ("busca.IndiceOrdenado.buscar_varios", IndiceOrdenado(ordenados).buscar_varios, (dados,)),
+        ("lista_ordenada.ListaOrdenada (fluxo misto)", fluxo_lista_ordenada, ()),
+        ("fibonacci.fibonacci", fibonacci.fibonacci, (100_000,)),
+        ("fibonacci.fibonacci_lote", fibonacci.fibonacci_lote, (ordenados,)),
+        ("permutacoes.permutacoes_lazy", lambda: permutacoes.contar(permutacoes.permutacoes_lazy(range(8))), ()),
+        ("subconjuntos.blocos_gray", lambda: sum(len(b) for b in subconjuntos.blocos_gray(16)), ()),
+        ("matriz.multiplicar", multiplicar, (Matriz.de_listas(matriz), Matriz.de_listas(matriz), "python")),
+        ("ordenacao.ordenar_automatico", ordenacao.ordenar_automatico, (inteiros,)),
+        ("sorted", sorted, (dados,)),
+        ("sorted (inteiros)", sorted, (inteiros,)),
+    ]
+
+def executar_suite(casos=None, filtro=None, orcamento_ns=ORCAMENTO_PADRAO_NS):
+    """Mede todos os casos (opcionalmente filtrados por substring do nome)"""
+    resultados = []
+    for nome, func, args in casos or casos_padrao():
+        if filtro and filtro not in nome:
+            continue
+        estatisticas = medir(func, *args, nome=nome, orcamento_ns=orcamento_ns)
+        print(estatisticas)
+        resultados.append(estatisticas)
+    return resultados
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de algoritmos.py e estruturas_avancadas.py")
+    parser.add_argument("--saida", help="grava os resultados em JSON neste caminho")
+    parser.add_argument("--baseline", help="compara com um JSON salvo e falha em caso de regressão")
+    parser.add_argument("--tolerancia", type=float, default=0.10, help="regressão máxima aceita (fração, padrão 0.10)")
+    parser.add_argument("--filtro", help="mede apenas casos cujo nome contém este texto")
+    parser.add_argument("--orcamento-ms", type=float, default=ORCAMENTO_PADRAO_NS / 1e6,
+                        help="tempo aproximado de medição por caso")
+    opcoes = parser.parse_args(argv)
+
+    resultados = executar_suite(filtro=opcoes.filtro, orcamento_ns=int(opcoes.orcamento_ms * 1e6))
+
+    if opcoes.saida:
+        salvar_json(resultados, opcoes.saida)
+        print(f"\nResultados gravados em {opcoes.saida}")
+
+    if opcoes.baseline:
+        regressoes = comparar_baseline(resultados, carregar_json(opcoes.baseline), opcoes.tolerancia)
+        if regressoes:
+            print(f"\n{len(regressoes)} regressão(ões) acima de {opcoes.tolerancia:.0%}:")
+            for nome, antes, depois, razao in regressoes:
+                print(f"  {nome}: {formatar_ns(antes)} -> {formatar_ns(depois)} ({razao:.2f}x)")
+            return 1
+        print("\nNenhuma regressão em relação à baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+import operator
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import islice, repeat
+
+try:
+    import numpy
+except ImportError:  # dependência opcional
+    numpy = None
+
+LADOS = ("esquerda", "direita")
+
+def _ordenada(valores):
+    return all(map(operator.le, valores, islice(valores, 1, None)))
+
+def _eytzinger(valores):
+    """Reorganiza valores ordenados na ordem de Eytzinger (heap em largura, base 1)
+
+    Retorna (arvore, posicoes): arvore[k] tem os filhos em 2k e 2k + 1 e
+    posicoes[k] é a posição de arvore[k] na lista ordenada. posicoes[0] = n
+    representa "depois do último elemento".
+    """
+    n = len(valores)
+    arvore = [None] * (n + 1)
+    posicoes = [n] * (n + 1)
+    # Percurso em ordem (sem recursão) da árvore implícita 1..n
+    pilha = []
+    k = 1
+    i = 0
+    while pilha or k <= n:
+        while k <= n:
+            pilha.append(k)
+            k *= 2
+        k = pilha.pop()
+        arvore[k] = valores[i]
+        posicoes[k] = i
+        i += 1
+        k = 2 * k + 1
+    return arvore, posicoes
+
+class IndiceOrdenado:
+    """Índice de busca construído uma vez sobre uma lista, para muitas consultas
+
+    Os valores são ordenados na construção (se ainda não estiverem) e as
+    posições devolvidas se referem a `self.valores`. `layout` escolhe a
+    organização usada nas consultas individuais: "plano" (bisect, em C) ou
+    "eytzinger" (árvore implícita em largura, cujo caminho de busca percorre
+    memória contígua). `backend` "auto" usa numpy.searchsorted nas consultas
+    em lote quando o NumPy está instalado e os valores são numéricos.
+    """
+    __slots__ = ("valores", "layout", "backend", "_arvore", "_posicoes", "_vetor")
+
+    def __init__(self, valores, layout="plano", backend="auto"):
+        valores = list(valores)
+        if not _ordenada(valores):
+            valores.sort()
+        if layout not in ("plano", "eytzinger"):
+            raise ValueError(f"layout desconhecido: {layout}")
+        if backend not in ("auto", "numpy", "python"):
+            raise ValueError(f"backend desconhecido: {backend}")
+        self.valores = valores
+        self.layout = layout
+        self._arvore = self._posicoes = self._vetor = None
+        if layout == "eytzinger":
+            self._arvore, self._posicoes = _eytzinger(valores)
+        if backend != "python" and numpy is not None:
+            vetor = numpy.asarray(valores)
+            # Listas de objetos arbitrários (ou inteiros enormes) não ganham nada com o NumPy
+            if vetor.dtype != object:
+                self._vetor = vetor
+        if backend == "numpy" and self._vetor is None:
+            raise ImportError("o backend 'numpy' requer o pacote numpy e valores numéricos")
+        self.backend = "numpy" if self._vetor is not None else "python"
+
+    def __len__(self):
+        return len(self.valores)
+
+    def _limite_eytzinger(self, valor, comparar):
+        arvore = self._arvore
+        n = len(arvore) - 1
+        k = 1
+        while k <= n:
+            k = 2 * k + comparar(arvore[k], valor)
+        # Desfaz as descidas à direita do fim do caminho: o último "esquerda"
+        # aponta para o primeiro elemento que satisfaz a busca
+        k >>= (~k & (k + 1)).bit_length()
+        return self._posicoes[k]
+
+    def limite_inferior(self, valor):
+        """Primeira posição i com valores[i] >= valor (lower bound) - O(log n)"""
+        if self._arvore is not None:
+            return self._limite_eytzinger(valor, operator.lt)
+        return bisect_left(self.valores, valor)
+
+    def limite_superior(self, valor):
+        """Primeira posição i com valores[i] > valor (upper bound) - O(log n)"""
+        if self._arvore is not None:
+            return self._limite_eytzinger(valor, operator.le)
+        return bisect_right(self.valores, valor)
+
+    def buscar(self, valor):
+        """Posição da primeira ocorrência de valor, ou -1 - O(log n)"""
+        i = self.limite_inferior(valor)
+        if i < len(self.valores) and self.valores[i] == valor:
+            return i
+        return -1
+
+    def buscar_varios(self, consultas, lado="esquerda"):
+        """Limite inferior ("esquerda") ou superior ("direita") de cada consulta
+
+        Com o NumPy, uma única chamada a numpy.searchsorted - O(m log n) em C.
+        Sem ele, consultas em ordem com mais consultas que valores são
+        respondidas por uma varredura tipo intercalação, que busca cada
+        valor do índice nas consultas - O(n log m + m); nos demais casos,
+        cada consulta é um bisect em C - O(m log n).
+        """
+        if lado not in LADOS:
+            raise ValueError(f"lado deve ser um de {LADOS}")
+        if self._vetor is not None:
+            return numpy.searchsorted(self._vetor, consultas, "left" if lado == "esquerda" else "right").tolist()
+        consultas = consultas if isinstance(consultas, list) else list(consultas)
+        if len(consultas) > len(self.valores) and _ordenada(consultas):
+            return self._varrer(consultas, lado)
+        if self._arvore is not None:
+            buscar = self.limite_inferior if lado == "esquerda" else self.limite_superior
+            return list(map(buscar, consultas))
+        bisect = bisect_left if lado == "esquerda" else bisect_right
+        return list(map(partial(bisect, self.valores), consultas))
+
+    def _varrer(self, consultas, lado):
+        # Para consultas ordenadas, as que têm resposta i formam um trecho
+        # contíguo: as que ficam entre valores[i - 1] e valores[i]. O limite
+        # inferior de x é i para consultas com valores[i - 1] < x <= valores[i]
+        # (por isso bisect_right nas consultas); o superior, para
+        # valores[i - 1] <= x < valores[i] (bisect_left)
+        bisect = bisect_right if lado == "esquerda" else bisect_left
+        resultado = []
+        anterior = 0
+        for i, valor in enumerate(self.valores):
+            fim = bisect(consultas, valor, anterior)
+            resultado.extend(repeat(i, fim - anterior))
+            anterior = fim
+        resultado.extend(repeat(len(self.valores), len(consultas) - anterior))
+        return resultado
+
+    def encontrar_varios(self, consultas):
+        """Posição da primeira ocorrência de cada consulta, ou -1 (como buscar)"""
+        consultas = consultas if isinstance(consultas, list) else list(consultas)
+        valores = self.valores
+        n = len(valores)
+        return [i if i < n and valores[i] == x else -1
+                for i, x in zip(self.buscar_varios(consultas), consultas)]
+
+    def __repr__(self):
+        return f"IndiceOrdenado({len(self.valores)} valores, layout={self.layout!r}, backend={self.backend!r})"
+
+def main():
+    import random
+    from benchmark import medir, formatar_ns
+    from estruturas_avancadas import busca_binaria_iterativa
+
+    print("=== ÍNDICE ORDENADO COM BUSCA EM LOTE ===\n")
+    indice = IndiceOrdenado([7, 1, 3, 3, 9])
+    print(f"{indice}: {indice.valores}")
+    print(f"limites inferiores de [0, 3, 4, 10]: {indice.buscar_varios([0, 3, 4, 10])}")
+    print(f"limites superiores de [0, 3, 4, 10]: {indice.buscar_varios([0, 3, 4, 10], 'direita')}")
+    print(f"posições de [3, 4]: {indice.encontrar_varios([3, 4])}\n")
+
+    gerador = random.Random(42)
+    n, m = 10**6, 200_000
+    valores = sorted(gerador.sample(range(10**8), n))
+    consultas = [gerador.randrange(10**8) for _ in range(m)]
+    print(f"n = {n}, {m} consultas (backend NumPy disponível: {numpy is not None})")
+    um_a_um = medir(lambda: [busca_binaria_iterativa(valores, x) for x in consultas], amostras=3)
+    print(f"  busca_binaria_iterativa por consulta: {formatar_ns(um_a_um.mediana)}")
+    for layout in ("plano", "eytzinger"):
+        indice = IndiceOrdenado(valores, layout, backend="python")
+        lote = medir(indice.encontrar_varios, consultas, amostras=3)
+        individual = medir(lambda: list(map(indice.buscar, consultas)), amostras=3)
+        print(f"  {layout:9} em lote {formatar_ns(lote.mediana):>10}, uma a uma {formatar_ns(individual.mediana):>10}")
+    if numpy is not None:
+        indice = IndiceOrdenado(valores, backend="numpy")
+        print(f"  numpy     em lote {formatar_ns(medir(indice.encontrar_varios, consultas, amostras=3).mediana):>10}")
+
+    print("\nConsultas ordenadas, muito mais consultas que valores:")
+    indice = IndiceOrdenado(gerador.sample(range(10**8), 1000), backend="python")
+    consultas = sorted(gerador.randrange(10**8) for _ in range(10**6))
+    varredura = medir(indice.buscar_varios, consultas, amostras=3)
+    bisects = medir(lambda: list(map(partial(bisect_left, indice.valores), consultas)), amostras=3)
+    print(f"  varredura {formatar_ns(varredura.mediana)}, bisect por consulta {formatar_ns(bisects.mediana)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""Cache persistente (SQLite) dos resultados de benchmark
+
+Cada resultado é guardado sob uma chave que identifica exatamente o que foi
+medido: o hash do código da função (bytecode, constantes e nomes, seguindo
+as funções, classes, constantes e módulos do projeto que ela alcança, então
+uma mudança em ordenacao.merge_sort_buffer ou em ordenacao.MINIMO_CONTAGEM
+invalida estruturas_avancadas.merge_sort), o hash do gerador de entrada, n,
+a semente, o orçamento de medição, a versão do código de medição
+(benchmark.medir) e a versão do interpretador. Enquanto nada disso muda, o
+resultado vem do cache; as linhas antigas ficam como histórico até serem
+removidas pelo limite de tamanho (as menos usadas primeiro).
+
+Só a varredura do executor.py passa pelo cache: benchmark.py,
+complexidade.py, memoria.py e instrumentacao.py medem sempre.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import sys
+import time
+import types
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+CAMINHO_PADRAO = os.path.join(DIRETORIO, "__pycache__", "resultados.sqlite3")
+MAXIMO_PADRAO = 10_000  # resultados guardados antes de remover os menos usados
+
+# Globais não chamáveis que entram no hash pelo valor (repr)
+_CONSTANTES = (int, float, complex, str, bytes, bool, type(None))
+
+_versao_medicao = None
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    chave TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    semente INTEGER,
+    codigo TEXT NOT NULL,
+    python TEXT NOT NULL,
+    estatisticas TEXT NOT NULL,
+    criado REAL NOT NULL,
+    usado REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resultados_nome ON resultados (nome, n, criado);
+CREATE INDEX IF NOT EXISTS resultados_usado ON resultados (usado);
+"""
+
+def versao_python():
+    return f"{platform.python_implementation()} {platform.python_version()}"
+
+def _atualizar_codigo(hash_, codigo):
+    # Bytecode, nomes e constantes (recursivo nos códigos internos); números
+    # de linha e nome do arquivo ficam de fora, então mover a função no
+    # arquivo não invalida o cache
+    hash_.update(codigo.co_code)
+    hash_.update(repr(codigo.co_names).encode())
+    for constante in codigo.co_consts:
+        if isinstance(constante, types.CodeType):
+            _atualizar_codigo(hash_, constante)
+        else:
+            hash_.update(repr(constante).encode())
+
+def _nomes_usados(codigo):
+    nomes = set(codigo.co_names)
+    for constante in codigo.co_consts:
+        if isinstance(constante, types.CodeType):
+            nomes |= _nomes_usados(constante)
+    return nomes
+
+def _constante(valor):
+    # Valores simples (e tuplas deles) entram no hash pelo repr; conjuntos
+    # ficam de fora porque a ordem do repr muda entre processos
+    if isinstance(valor, tuple):
+        return all(_constante(item) for item in valor)
+    return isinstance(valor, _CONSTANTES)
+
+def _do_projeto(modulo):
+    # Só o código deste diretório é percorrido: o da biblioteca padrão é
+    # coberto pela versão do Python na chave
+    arquivo = getattr(modulo, "__file__", None)
+    return arquivo is not None and os.path.dirname(os.path.abspath(arquivo)) == DIRETORIO
+
+def _modulo(objeto):
+    return sys.modules.get(getattr(objeto, "__module__", None) or "")
+
+def impressao_digital(func):
+    """Hash do código de func e de tudo do projeto que ela alcança
+
+    Segue __wrapped__ (functools.wraps), as células de closure e os nomes
+    globais usados: funções, classes (métodos, propriedades e atributos de
+    classe, e as bases), a classe de instâncias (como o CacheLRU de uma
+    função memoizada), os atributos usados de módulos
+    (ordenacao.merge_sort_buffer) e constantes simples pelo valor
+    (MINIMO_CONTAGEM = 4096). Objetos de fora do projeto (builtins,
+    biblioteca padrão) entram pelo nome qualificado.
+    """
+    hash_ = hashlib.sha256()
+    pendentes = [func]
+    vistos = set()
+
+    def seguir(nome, valor, atributos=()):
+        # Valor alcançado por `nome`: constantes pelo repr, o resto vai para a fila
+        if isinstance(valor, (staticmethod, classmethod)):
+            valor = valor.__func__
+        if isinstance(valor, property):
+            for funcao in (valor.fget, valor.fset, valor.fdel):
+                if funcao is not None:
+                    pendentes.append(funcao)
+        elif _constante(valor):
+            hash_.update(f"{nome}={valor!r}".encode())
+        elif isinstance(valor, types.ModuleType):
+            if _do_projeto(valor):
+                for atributo in atributos:
+                    if hasattr(valor, atributo):
+                        seguir(f"{nome}.{atributo}", getattr(valor, atributo))
+        elif isinstance(valor, (types.FunctionType, types.MethodType, type)):
+            pendentes.append(valor)
+        elif _do_projeto(_modulo(type(valor))):
+            pendentes.append(type(valor))  # instância de uma classe do projeto
+        elif callable(valor):
+            pendentes.append(valor)
+
+    while pendentes:
+        objeto = pendentes.pop()
+        if id(objeto) in vistos:
+            continue
+        vistos.add(id(objeto))
+        if isinstance(objeto, types.MethodType):
+            pendentes.append(objeto.__func__)
+            seguir("<self>", objeto.__self__)
+            continue
+        hash_.update(f"{getattr(objeto, '__module__', '')}.{getattr(objeto, '__qualname__', type(objeto).__qualname__)}".encode())
+        if not isinstance(objeto, (types.FunctionType, type)) or not _do_projeto(_modulo(objeto)):
+            continue
+        if isinstance(objeto, type):
+            pendentes.extend(objeto.__bases__)
+            for nome, valor in sorted(vars(objeto).items()):
+                seguir(f"{objeto.__qualname__}.{nome}", valor)
+            continue
+        codigo = objeto.__code__
+        _atualizar_codigo(hash_, codigo)
+        hash_.update(repr(objeto.__defaults__).encode())
+        hash_.update(repr(objeto.__kwdefaults__).encode())
+        nomes = sorted(_nomes_usados(codigo))
+        if hasattr(objeto, "__wrapped__"):
+            pendentes.append(objeto.__wrapped__)
+        for celula in objeto.__closure__ or ():
+            try:
+                conteudo = celula.cell_contents
+            except ValueError:  # célula ainda vazia
+                continue
+            seguir("<closure>", conteudo, nomes)
+        for nome in nomes:
+            if nome in objeto.__globals__:
+                seguir(nome, objeto.__globals__[nome], nomes)
+    return hash_.hexdigest()
+
+def versao_medicao():
+    """Impressão digital de benchmark.medir e do que ele chama (calculada uma vez)"""
+    global _versao_medicao
+    if _versao_medicao is None:
+        from benchmark import medir
+        _versao_medicao = impressao_digital(medir)
+    return _versao_medicao
+
+def chave(codigo_alvo, codigo_gerador, n, semente=None, python=None, limites=None,
+          orcamento_ns=None, medicao=None):
+    """Chave do cache para uma medição (hash de todos os componentes)
+
+    `orcamento_ns` é o tempo de medição por resultado e `medicao` a versão
+    do código que mede (padrão: versao_medicao()). `limites` entra só nas
+    chaves de execuções que estouraram um limite de tempo ou memória: o
+    mesmo estouro só vale para os mesmos limites.
+    """
+    componentes = [codigo_alvo, codigo_gerador, n, semente, python or versao_python(),
+                   orcamento_ns, medicao or versao_medicao()]
+    if limites is not None:
+        componentes.append(list(limites))
+    return hashlib.sha256(json.dumps(componentes).encode()).hexdigest()
+
+class CacheResultados:
+    """Resultados de benchmark em um arquivo SQLite, com limite de linhas
+
+    obter/guardar trabalham com a chave de `chave()`; historico e
+    tendencia consultam todas as versões guardadas de um caso.
+    """
+    def __init__(self, caminho=CAMINHO_PADRAO, maximo=MAXIMO_PADRAO):
+        if maximo is not None and maximo <= 0:
+            raise ValueError("maximo deve ser positivo (ou None para ilimitado)")
+        if caminho != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+        self.caminho = caminho
+        self.maximo = maximo
+        self.acertos = 0
+        self.falhas = 0
+        self._conexao = sqlite3.connect(caminho)
+        self._conexao.executescript(_ESQUEMA)
+
+    def obter(self, chave_):
+        """Estatísticas (dict) guardadas para a chave, ou None"""
+        linha = self._conexao.execute("SELECT estatisticas FROM resultados WHERE chave = ?", (chave_,)).fetchone()
+        if linha is None:
+            self.falhas += 1
+            return None
+        self.acertos += 1
+        with self._conexao:
+            self._conexao.execute("UPDATE resultados SET usado = ? WHERE chave = ?", (time.time(), chave_))
+        return json.loads(linha[0])
+
+    def guardar(self, chave_, nome, n, codigo, estatisticas, semente=None, python=None):
+        """Grava (ou substitui) um resultado e remove os menos usados além do limite"""
+        agora = time.time()
+        with self._conexao:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (chave_, nome, n, semente, codigo, python or versao_python(), json.dumps(estatisticas), agora, agora))
+            if self.maximo is not None:
+                self._conexao.execute(
+                    "DELETE FROM resultados WHERE chave IN "
+                    "(SELECT chave FROM resultados ORDER BY usado DESC LIMIT -1 OFFSET ?)", (self.maximo,))
+
+    def historico(self, nome, n=None):
+        """Todas as medições guardadas de um caso, da mais antiga para a mais nova
+
+        Cada item é um dict com n, data, versão do código (12 primeiros
+        dígitos do hash), Python e as estatísticas (ou, para execuções que
+        estouraram um limite, {"situacao": ..., "mensagem": ...}).
+        """
+        consulta = "SELECT n, criado, codigo, python, semente, estatisticas FROM resultados WHERE nome = ?"
+        parametros = [nome]
+        if n is not None:
+            consulta += " AND n = ?"
+            parametros.append(n)
+        return [{
+            "n": linha[0],
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(linha[1])),
+            "codigo": linha[2][:12],
+            "python": linha[3],
+            "semente": linha[4],
+            "estatisticas": json.loads(linha[5]),
+        } for linha in self._conexao.execute(consulta + " ORDER BY n, criado", parametros)]
+
+    def tendencia(self, nome, n, metrica="mediana_ns"):
+        """[(data, código, valor)] de um caso em um tamanho e a razão última/primeira"""
+        pontos = [(item["data"], item["codigo"], item["estatisticas"][metrica])
+                  for item in self.historico(nome, n) if metrica in item["estatisticas"]]
+        razao = pontos[-1][2] / pontos[0][2] if len(pontos) > 1 and pontos[0][2] else None
+        return pontos, razao
+
+    def casos(self):
+        """{nome: número de resultados guardados}"""
+        return dict(self._conexao.execute("SELECT nome, COUNT(*) FROM resultados GROUP BY nome ORDER BY nome"))
+
+    def limpar(self):
+        with self._conexao:
+            self._conexao.execute("DELETE FROM resultados")
+
+    def fechar(self):
+        self._conexao.close()
+
+    def __len__(self):
+        return self._conexao.execute("SELECT COUNT(*) FROM resultados").fetchone()[0]
+
+    def estatisticas(self):
+        """Contadores desta sessão e tamanho do cache"""
+        total = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "tamanho": len(self),
+            "maximo": self.maximo,
+            "taxa_acerto": self.acertos / total if total else 0.0,
+        }
+
+def main(argv=None):
+    import argparse
+    from benchmark import formatar_ns
+
+    parser = argparse.ArgumentParser(description="Consulta o cache persistente de resultados de benchmark")
+    parser.add_argument("--caminho", default=CAMINHO_PADRAO, help="arquivo SQLite do cache")
+    subcomandos = parser.add_subparsers(dest="comando")
+    subcomandos.add_parser("resumo", help="casos guardados e número de resultados de cada um")
+    historico = subcomandos.add_parser("historico", help="medições guardadas de um caso, por versão do código")
+    historico.add_argument("nome")
+    historico.add_argument("--n", type=int)
+    subcomandos.add_parser("limpar", help="apaga todos os resultados")
+    opcoes = parser.parse_args(argv)
+
+    cache = CacheResultados(opcoes.caminho)
+    try:
+        if opcoes.comando == "limpar":
+            cache.limpar()
+            print(f"Cache {opcoes.caminho} esvaziado")
+        elif opcoes.comando == "historico":
+            tamanhos = sorted({item["n"] for item in cache.historico(opcoes.nome, opcoes.n)})
+            for n in tamanhos:
+                pontos, razao = cache.tendencia(opcoes.nome, n)
+                if not pontos:
+                    continue
+                print(f"{opcoes.nome} n = {n}" + (f" (última/primeira: {razao:.2f}x)" if razao else ""))
+                for data, codigo, valor in pontos:
+                    print(f"    {data}  código {codigo}  {formatar_ns(valor)}")
+        else:
+            print(f"=== CACHE DE RESULTADOS ({opcoes.caminho}) ===\n")
+            for nome, quantidade in cache.casos().items():
+                print(f"  {nome}: {quantidade} resultado(s)")
+            print(f"\n{len(cache)} resultados (máximo {cache.maximo})")
+    finally:
+        cache.fechar()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+import math
+import random
+
+from benchmark import medir
+
+# Modelos candidatos: nome -> g(n). O tempo (ou o espaço, em memoria.py) é
+# ajustado como t(n) ≈ a + b·g(n).
+MODELOS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: float(n) ** 2,
+    "O(n³)": lambda n: float(n) ** 3,
+    "O(2^n)": lambda n: 2.0 ** n,
+    "O(n!)": lambda n: float(math.factorial(n)) if n <= 170 else math.inf,  # 171! não cabe em float
+}
+
+ORDEM = list(MODELOS)
+
+class Ajuste:
+    """Ajuste de um modelo t(n) ≈ a + b·g(n) aos valores medidos (ns ou bytes)"""
+    def __init__(self, modelo, a, b, erro, r2, unidade="ns"):
+        self.modelo = modelo
+        self.a = a
+        self.b = b
+        self.erro = erro  # erro relativo RMS
+        self.r2 = r2
+        self.unidade = unidade
+
+    def prever(self, n):
+        """Valor previsto (na unidade do ajuste) para entrada de tamanho n"""
+        return self.a + self.b * MODELOS[self.modelo](n)
+
+    def __repr__(self):
+        return (f"{self.modelo}: a={self.a:.4g}{self.unidade} b={self.b:.4g}{self.unidade} "
+                f"erro={self.erro:.2%} R²={self.r2:.4f}")
+
+class EstimativaComplexidade:
+    """Resultado de estimar_complexidade"""
+    def __init__(self, nome, tamanhos, tempos, ajustes):
+        self.nome = nome
+        self.tamanhos = tamanhos
+        self.tempos = tempos
+        self.ajustes = sorted(ajustes, key=lambda ajuste: ajuste.erro)
+        self.melhor = self.ajustes[0]
+
+    def __repr__(self):
+        return f"{self.nome}: {self.melhor}"
+
+def ajustar_modelo(modelo, tamanhos, tempos, unidade="ns"):
+    """Mínimos quadrados ponderados por 1/t² (erro relativo) para a + b·g(n)
+
+    `tempos` pode ser qualquer grandeza positiva medida por tamanho (ns,
+    bytes...); `unidade` só aparece na representação. Retorna None quando
+    o modelo não é avaliável nos tamanhos (overflow) ou quando o melhor
+    ajuste exige coeficiente negativo para g(n).
+    """
+    g = MODELOS[modelo]
+    try:
+        xs = [g(n) for n in tamanhos]
+    except OverflowError:
+        return None
+    if any(math.isinf(x) for x in xs):
+        return None
+
+    pesos = [1.0 / (t * t) for t in tempos]
+    if modelo == "O(1)":
+        a = sum(p * t for p, t in zip(pesos, tempos)) / sum(pesos)
+        b = 0.0
+    else:
+        sw = sum(pesos)
+        sx = sum(p * x for p, x in zip(pesos, xs))
+        sy = sum(p * t for p, t in zip(pesos, tempos))
+        sxx = sum(p * x * x for p, x in zip(pesos, xs))
+        sxy = sum(p * x * t for p, x, t in zip(pesos, xs, tempos))
+        det = sw * sxx - sx * sx
+        if det <= 0:
+            return None
+        b = (sw * sxy - sx * sy) / det
+        a = (sy - b * sx) / sw
+        if b <= 0:
+            return None
+        if a < 0:
+            # Intercepto negativo não tem sentido físico: refaz com a = 0
+            a = 0.0
+            b = sxy / sxx
+
+    previstos = [a + b * x for x in xs]
+    erro = math.sqrt(sum(((t - p) / t) ** 2 for t, p in zip(tempos, previstos)) / len(tempos))
+    media = sum(tempos) / len(tempos)
+    total = sum((t - media) ** 2 for t in tempos)
+    residuo = sum((t - p) ** 2 for t, p in zip(tempos, previstos))
+    r2 = 1 - residuo / total if total > 0 else 1.0
+    return Ajuste(modelo, a, b, erro, r2, unidade)
+
+def tamanhos_geometricos(n_min, n_max, fator=2):
+    """Sequência n_min, n_min·fator, ... até n_max (inteiros distintos)"""
+    tamanhos = []
+    n = n_min
+    while n <= n_max:
+        if not tamanhos or int(n) != tamanhos[-1]:
+            tamanhos.append(int(n))
+        n *= fator
+    return tamanhos
+
+def estimar_complexidade(func, gerador, n_min=16, n_max=4096, fator=2, tamanhos=None,
+                         limite_ns=500_000_000, orcamento_ns=50_000_000, nome=None):
+    """Mede func em tamanhos geométricos e ajusta as classes de complexidade
+
+    `gerador(n)` devolve o argumento (ou a tupla de argumentos) para a
+    entrada de tamanho n; a geração não entra na medição. A varredura para
+    quando a mediana de um tamanho ultrapassa `limite_ns`, o que evita travar
+    em algoritmos exponenciais.
+    """
+    nome = nome or getattr(func, "__name__", repr(func))
+    tamanhos = tamanhos or tamanhos_geometricos(n_min, n_max, fator)
+
+    medidos = []
+    tempos = []
+    for n in tamanhos:
+        args = gerador(n)
+        if not isinstance(args, tuple):
+            args = (args,)
+        estatisticas = medir(func, *args, nome=f"{nome}[{n}]", orcamento_ns=orcamento_ns)
+        medidos.append(n)
+        tempos.append(max(estatisticas.mediana, 1e-3))
+        if estatisticas.mediana > limite_ns:
+            break
+
+    if len(medidos) < 3:
+        raise ValueError("São necessários pelo menos 3 tamanhos medidos para o ajuste")
+
+    ajustes = [ajuste for modelo in ORDEM
+               if (ajuste := ajustar_modelo(modelo, medidos, tempos)) is not None]
+    return EstimativaComplexidade(nome, medidos, tempos, ajustes)
+
+def verificar_complexidade(func, gerador, esperado, tolerancia=0, **opcoes):
+    """Confere se a classe estimada não é pior que `esperado`
+
+    `tolerancia` é quantas classes acima da esperada ainda são aceitas.
+    Retorna (ok, estimativa).
+    """
+    estimativa = estimar_complexidade(func, gerador, **opcoes)
+    ok = ORDEM.index(estimativa.melhor.modelo) <= ORDEM.index(esperado) + tolerancia
+    return ok, estimativa
+
+def lista_aleatoria(n, seed=42):
+    """Gerador de entrada: n inteiros aleatórios em [1, 1000]"""
+    gerador = random.Random(seed)
+    return [gerador.randint(1, 1000) for _ in range(n)]
+
+def matriz_aleatoria(n, seed=42):
+    """Gerador de entrada: par de matrizes n×n"""
+    gerador = random.Random(seed)
+    matriz = [[gerador.random() for _ in range(n)] for _ in range(n)]
+    return matriz, matriz
+
+def casos_padrao():
+    """(func, gerador, esperado, opções) conferindo o resumo dos dois módulos"""
+    import algoritmos
+    import estruturas_avancadas as ea
+
+    return [
+        (algoritmos.busca_linear, lambda n: (list(range(n)), -1), "O(n)", {"n_max": 1 << 16}),
+        (ea.busca_binaria_iterativa, lambda n: (list(range(n)), 0), "O(log n)", {"n_max": 1 << 20}),
+        (ea.merge_sort, lista_aleatoria, "O(n log n)", {"n_max": 1 << 13}),
+        (ea.bubble_sort, lista_aleatoria, "O(n²)", {"n_max": 512}),
+        (ea.multiplicar_matrizes_otimizada, matriz_aleatoria, "O(n³)", {"n_max": 64}),
+        (algoritmos.fibonacci_recursivo, lambda n: n, "O(2^n)",
+         {"tamanhos": list(range(10, 23, 2))}),
+    ]
+
+def main():
+    print("=== ESTIMATIVA EMPÍRICA DE COMPLEXIDADE ===\n")
+    falhas = 0
+    for func, gerador, esperado, opcoes in casos_padrao():
+        ok, estimativa = verificar_complexidade(func, gerador, esperado, tolerancia=0, **opcoes)
+        situacao = "OK" if ok else "PIOR QUE O ESPERADO"
+        print(f"{estimativa.nome}: esperado {esperado}, estimado {estimativa.melhor.modelo} [{situacao}]")
+        for ajuste in estimativa.ajustes[:3]:
+            print(f"    {ajuste}")
+        falhas += not ok
+    return 1 if falhas else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
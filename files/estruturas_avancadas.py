@@ -1,36 +1,122 @@
-import time
 import random
 import sys
+import tracemalloc
+from collections import deque
+from benchmark import medir, formatar_ns
+from fibonacci import fibonacci
+from memoizacao import memoizar
+from matriz import Matriz, multiplicar, multiplicar_listas
+from matriz_esparsa import MatrizEsparsa
+from ordenacao import merge_sort_buffer, ordenar_automatico
+from hanoi import MovimentosHanoi
 sys.setrecursionlimit(10000)
 
 class No:
-    """Classe para simular ponteiros em Python"""
+    """Classe para simular ponteiros em Python
+
+    Com __slots__ o nó não carrega um __dict__ por instância: só os dois
+    campos abaixo.
+    """
+    __slots__ = ("valor", "proximo")
+
     def __init__(self, valor):
         self.valor = valor
         self.proximo = None
 
 class ListaLigada:
-    """Lista ligada simples"""
-    def __init__(self):
+    """Lista ligada simples com ponteiro para a cauda e índice opcional
+
+    Com indexada=True, mantém um dicionário valor -> "sequência" de cada
+    ocorrência (posição + deslocamento da cabeça): um int para valores
+    únicos, um deque em ordem crescente para valores repetidos. Inserções
+    no início decrementam o deslocamento, então nenhuma posição precisa ser
+    atualizada e buscar() fica O(1). Os valores precisam ser hasheáveis.
+    """
+    def __init__(self, indexada=False):
         self.head = None
+        self.tail = None
+        self.tamanho = 0
+        self._indice = {} if indexada else None
+        self._base = 0  # sequência da cabeça
     
     def inserir_inicio(self, valor):
         """Inserção no início - O(1)"""
         novo = No(valor)
         novo.proximo = self.head
         self.head = novo
+        if self.tail is None:
+            self.tail = novo
+        self.tamanho += 1
+        if self._indice is not None:
+            self._base -= 1
+            self._indexar(valor, self._base, no_inicio=True)
+    
+    def inserir_fim(self, valor):
+        """Inserção no fim pelo ponteiro da cauda - O(1)"""
+        novo = No(valor)
+        if self.tail is None:
+            self.head = novo
+        else:
+            self.tail.proximo = novo
+        self.tail = novo
+        if self._indice is not None:
+            self._indexar(valor, self._base + self.tamanho, no_inicio=False)
+        self.tamanho += 1
+    
+    def remover_inicio(self):
+        """Remove e retorna o primeiro valor - O(1)"""
+        if self.head is None:
+            raise IndexError("remover_inicio de lista vazia")
+        removido = self.head
+        self.head = removido.proximo
+        if self.head is None:
+            self.tail = None
+        self.tamanho -= 1
+        if self._indice is not None:
+            ocorrencias = self._indice[removido.valor]
+            if isinstance(ocorrencias, deque) and len(ocorrencias) > 1:
+                ocorrencias.popleft()
+            else:
+                del self._indice[removido.valor]
+            self._base += 1
+        return removido.valor
+    
+    def _indexar(self, valor, sequencia, no_inicio):
+        ocorrencias = self._indice.get(valor)
+        if ocorrencias is None:
+            self._indice[valor] = sequencia
+            return
+        if not isinstance(ocorrencias, deque):
+            ocorrencias = self._indice[valor] = deque((ocorrencias,))
+        if no_inicio:
+            ocorrencias.appendleft(sequencia)
+        else:
+            ocorrencias.append(sequencia)
     
-    def percorrer(self):
-        """Percorrer toda lista - O(n)"""
-        elementos = []
+    def __iter__(self):
+        """Percorre os valores sob demanda, sem criar lista - O(n)"""
         atual = self.head
         while atual is not None:
-            elementos.append(atual.valor)
+            yield atual.valor
             atual = atual.proximo
-        return elementos
+    
+    def __len__(self):
+        return self.tamanho
+    
+    def percorrer(self):
+        """Percorrer toda lista - O(n)"""
+        return list(self)
     
     def buscar(self, valor):
-        """Buscar elemento - O(n)"""
+        """Buscar elemento - O(1) com índice, O(n) sem"""
+        if self._indice is not None:
+            ocorrencias = self._indice.get(valor)
+            if ocorrencias is None:
+                return -1
+            if isinstance(ocorrencias, deque):
+                return ocorrencias[0] - self._base
+            return ocorrencias - self._base
+        
         atual = self.head
         posicao = 0
         
@@ -41,6 +127,15 @@ class ListaLigada:
             posicao += 1
         
         return -1
+    
+    def posicoes(self, valor):
+        """Todas as posições de valor - O(k) com índice, O(n) sem"""
+        if self._indice is not None:
+            ocorrencias = self._indice.get(valor, ())
+            if not isinstance(ocorrencias, (deque, tuple)):
+                ocorrencias = (ocorrencias,)
+            return [sequencia - self._base for sequencia in ocorrencias]
+        return [i for i, elemento in enumerate(self) if elemento == valor]
 
 def busca_binaria_iterativa(lista, valor):
     """Busca binária iterativa - O(log n)"""
@@ -76,32 +171,32 @@ def busca_binaria_recursiva(lista, valor, inicio=0, fim=None):
     else:
         return busca_binaria_recursiva(lista, valor, meio + 1, fim)
 
-def fibonacci_com_memoizacao(n, memo={}):
-    """Fibonacci com memoização - O(n)"""
-    if n in memo:
-        return memo[n]
-    
+@memoizar(maximo=1024)
+def fibonacci_com_memoizacao(n):
+    """Fibonacci com memoização (cache LRU limitado) - O(n) no primeiro cálculo, O(1) depois
+
+    O antigo parâmetro `memo` (um dicionário padrão compartilhado por todas
+    as chamadas e que crescia sem limite) foi removido: o cache agora é
+    fibonacci_com_memoizacao.cache, que guarda cada subproblema da
+    recursão, e fibonacci_com_memoizacao.frio(n) mede com ele vazio. Quem
+    passava o próprio dicionário deve usar cache.limpar() / cache.escopo()
+    para controlar o estado. Com o cache frio, n > ~490 estoura o limite
+    de recursão padrão (dois frames por nível); para n grande use
+    fibonacci.fibonacci.
+    """
     if n <= 1:
         return n
     
-    memo[n] = fibonacci_com_memoizacao(n-1, memo) + fibonacci_com_memoizacao(n-2, memo)
-    return memo[n]
+    return fibonacci_com_memoizacao(n - 1) + fibonacci_com_memoizacao(n - 2)
 
 def torre_hanoi(n, origem='A', destino='C', auxiliar='B'):
-    """Torre de Hanói - O(2^n)"""
-    movimentos = []
+    """Torre de Hanói - O(2^n) movimentos
     
-    def mover(n, origem, destino, auxiliar):
-        if n == 1:
-            movimentos.append(f"Mover disco 1 de {origem} para {destino}")
-            return
-        
-        mover(n-1, origem, auxiliar, destino)
-        movimentos.append(f"Mover disco {n} de {origem} para {destino}")
-        mover(n-1, auxiliar, destino, origem)
-    
-    mover(n, origem, destino, auxiliar)
-    return movimentos
+    Retorna uma sequência preguiçosa (hanoi.MovimentosHanoi) com os textos
+    dos 2^n - 1 movimentos: len, índices, fatias e iteração funcionam como
+    na lista, mas cada texto é montado só quando acessado, em O(1).
+    """
+    return MovimentosHanoi(n, (origem, destino, auxiliar))
 
 def bubble_sort(lista):
     """Bubble Sort - O(n²)"""
@@ -118,22 +213,26 @@ def bubble_sort(lista):
     return lista_copia, comparacoes
 
 def merge_sort(lista):
-    """Merge Sort - O(n log n)"""
-    if len(lista) <= 1:
-        return lista
-    
-    meio = len(lista) // 2
-    esquerda = merge_sort(lista[:meio])
-    direita = merge_sort(lista[meio:])
-    
-    return merge(esquerda, direita)
+    """Merge Sort - O(n log n)
+
+    Usa ordenacao.merge_sort_buffer: um único buffer auxiliar em vez de
+    fatias por nível, e inserção binária nos trechos pequenos. Veja também
+    merge_sort_iterativo (sem recursão) e merge_sort_paralelo.
+    """
+    return merge_sort_buffer(lista)
 
 def merge(esquerda, direita):
-    """Função auxiliar para merge sort"""
+    """Função auxiliar para merge sort
+
+    Para intercalar mais de duas sequências, ou iteradores/geradores sem
+    materializá-los, use ordenacao.intercalar.
+    """
     resultado = []
     i = j = 0
+    tamanho_esquerda = len(esquerda)
+    tamanho_direita = len(direita)
     
-    while i < len(esquerda) and j < len(direita):
+    while i < tamanho_esquerda and j < tamanho_direita:
         if esquerda[i] <= direita[j]:
             resultado.append(esquerda[i])
             i += 1
@@ -147,7 +246,13 @@ def merge(esquerda, direita):
     return resultado
 
 def percorrer_matriz(matriz):
-    """Percorrer matriz - O(n²)"""
+    """Percorrer matriz - O(n²)
+
+    Para uma MatrizEsparsa retorna só os valores não nulos - O(nnz).
+    """
+    if isinstance(matriz, MatrizEsparsa):
+        return matriz.percorrer()
+    
     linhas = len(matriz)
     colunas = len(matriz[0])
     elementos = []
@@ -159,38 +264,33 @@ def percorrer_matriz(matriz):
     return elementos
 
 def multiplicar_matrizes_otimizada(A, B):
-    """Multiplicação de matrizes com verificação - O(n³)"""
+    """Multiplicação de matrizes com verificação - O(n³)
+
+    Aceita listas de listas (retorna listas, preservando o tipo dos
+    elementos) ou Matriz (retorna Matriz). Em ambos os casos B é transposto
+    uma vez e cada elemento é um produto interno linha × coluna. Se algum
+    operando for MatrizEsparsa, o custo acompanha o número de não nulos.
+    """
+    if isinstance(A, MatrizEsparsa) or isinstance(B, MatrizEsparsa):
+        return A @ B
+    
     if len(A[0]) != len(B):
         raise ValueError("Dimensões incompatíveis para multiplicação")
     
-    linhas_A = len(A)
-    colunas_A = len(A[0])
-    colunas_B = len(B[0])
+    if isinstance(A, Matriz) or isinstance(B, Matriz):
+        return multiplicar(A, B)
     
-    resultado = [[0] * colunas_B for _ in range(linhas_A)]
-    
-    for i in range(linhas_A):
-        for j in range(colunas_B):
-            for k in range(colunas_A):
-                resultado[i][j] += A[i][k] * B[k][j]
-    
-    return resultado
+    return multiplicar_listas(A, B)
 
 def gerar_subconjuntos(conjunto):
-    """Gerar todos subconjuntos - O(2^n)"""
-    if not conjunto:
-        return [[]]
-    
-    primeiro = conjunto[0]
-    resto = conjunto[1:]
-    
-    subconjuntos_resto = gerar_subconjuntos(resto)
-    
-    novos_subconjuntos = []
-    for subconjunto in subconjuntos_resto:
-        novos_subconjuntos.append([primeiro] + subconjunto)
-    
-    return subconjuntos_resto + novos_subconjuntos
+    """Gerar todos subconjuntos - O(2^n)
+
+    Cada subconjunto corresponde a uma máscara k de n bits; a ordem é a da
+    versão recursiva (o primeiro elemento é o bit mais significativo). Para
+    percorrer sem materializar a lista, veja o módulo subconjuntos.
+    """
+    n = len(conjunto)
+    return [[conjunto[i] for i in range(n) if k >> (n - 1 - i) & 1] for k in range(1 << n)]
 
 def análise_performance():
     """Análise comparativa de performance"""
@@ -209,35 +309,55 @@ def análise_performance():
         valor_busca = dados_ordenados[n//2]  # Buscar um valor no meio
         
         # Busca linear - O(n)
-        inicio = time.time()
         pos_linear = dados_ordenados.index(valor_busca)
-        tempo_linear = time.time() - inicio
+        tempo_linear = medir(dados_ordenados.index, valor_busca, nome="busca linear")
         
         # Busca binária - O(log n)
-        inicio = time.time()
         pos_binaria = busca_binaria_iterativa(dados_ordenados, valor_busca)
-        tempo_binaria = time.time() - inicio
+        tempo_binaria = medir(busca_binaria_iterativa, dados_ordenados, valor_busca)
         
         # Ordenação Python (Timsort) - O(n log n)
-        inicio = time.time()
-        dados_ordenados_python = sorted(dados_desordenados)
-        tempo_sort_python = time.time() - inicio
+        tempo_sort_python = medir(sorted, dados_desordenados)
         
         # Merge Sort - O(n log n)
-        inicio = time.time()
-        dados_merge_sort = merge_sort(dados_desordenados.copy())
-        tempo_merge_sort = time.time() - inicio
+        tempo_merge_sort = medir(merge_sort, dados_desordenados)
         
-        print(f"Busca linear:     {tempo_linear:.8f}s")
-        print(f"Busca binária:    {tempo_binaria:.8f}s")
-        print(f"Sort Python:      {tempo_sort_python:.6f}s")
-        print(f"Merge Sort:       {tempo_merge_sort:.6f}s")
+        print(f"Busca linear:     {formatar_ns(tempo_linear.mediana)} (p95 {formatar_ns(tempo_linear.p95)})")
+        print(f"Busca binária:    {formatar_ns(tempo_binaria.mediana)} (p95 {formatar_ns(tempo_binaria.p95)})")
+        print(f"Sort Python:      {formatar_ns(tempo_sort_python.mediana)} (p95 {formatar_ns(tempo_sort_python.p95)})")
+        # Ordenação automática (contagem para inteiros de intervalo pequeno)
+        _, metodo = ordenar_automatico(dados_desordenados)
+        tempo_automatico = medir(ordenar_automatico, dados_desordenados)
         
-        if tempo_binaria > 0:
-            print(f"Speedup busca:    {tempo_linear/tempo_binaria:.1f}x")
+        print(f"Merge Sort:       {formatar_ns(tempo_merge_sort.mediana)} (p95 {formatar_ns(tempo_merge_sort.p95)})")
+        print(f"Sort automático:  {formatar_ns(tempo_automatico.mediana)} (p95 {formatar_ns(tempo_automatico.p95)}, método: {metodo})")
+        print(f"Speedup busca:    {tempo_linear.mediana/tempo_binaria.mediana:.1f}x")
         
         print()
 
+# Tamanho da análise da lista ligada na demonstração completa; a medição com
+# 10^6 elementos fica em `python3 estruturas_avancadas.py --lista-ligada 1000000`
+N_LISTA_LIGADA_DEMO = 10**4
+
+def análise_lista_ligada(n=10**6):
+    """Memória por nó e latência de busca da ListaLigada com n elementos"""
+    print(f"=== LISTA LIGADA COM {n} ELEMENTOS ===")
+    
+    for indexada in (False, True):
+        tracemalloc.start()
+        lista = ListaLigada(indexada=indexada)
+        for valor in range(n):
+            lista.inserir_fim(valor)
+        memoria, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        alvo = n - 1  # pior caso da busca sequencial
+        tempo = medir(lista.buscar, alvo, orcamento_ns=20_000_000)
+        rotulo = "com índice" if indexada else "sem índice"
+        print(f"{rotulo}: {memoria / n:.1f} bytes/elemento, buscar({alvo}) em {formatar_ns(tempo.mediana)}")
+        del lista
+    print()
+
 def demonstrar_complexidades():
     """Demonstração das diferentes complexidades"""
     print("=== DEMONSTRAÇÃO DE COMPLEXIDADES ===\n")
@@ -253,6 +373,13 @@ def demonstrar_complexidades():
     
     print(f"Lista: {lista.percorrer()}")
     print(f"Busca por 20: posição {lista.buscar(20)}")
+    
+    indexada = ListaLigada(indexada=True)
+    for valor in (10, 20, 30, 20):
+        indexada.inserir_fim(valor)
+    indexada.inserir_inicio(5)
+    print(f"Lista indexada: {indexada.percorrer()}")
+    print(f"Busca O(1) por 20: posição {indexada.buscar(20)}, todas as posições: {indexada.posicoes(20)}")
     print()
     
     # 2. Busca Binária
@@ -277,26 +404,18 @@ def demonstrar_complexidades():
     
     n = 30
     
-    # Fibonacci com memoização
-    inicio = time.time()
+    # Fibonacci com memoização: frio (cache vazio a cada chamada) e quente
     fib_memo = fibonacci_com_memoizacao(n)
-    tempo_memo = time.time() - inicio
-    
-    # Fibonacci iterativo (da implementação anterior)
-    def fib_iter(n):
-        if n <= 1: return n
-        a, b = 0, 1
-        for _ in range(2, n + 1):
-            a, b = b, a + b
-        return b
+    tempo_memo_frio = medir(fibonacci_com_memoizacao.frio, n)
+    tempo_memo = medir(fibonacci_com_memoizacao, n)
     
-    inicio = time.time()
-    fib_iterativo = fib_iter(n)
-    tempo_iter = time.time() - inicio
+    # Fibonacci por fast doubling - O(log n)
+    fib_iterativo = fibonacci(n)
+    tempo_iter = medir(fibonacci, n)
     
     print(f"Fibonacci({n}):")
-    print(f"Com memoização: {fib_memo} ({tempo_memo:.6f}s)")
-    print(f"Iterativo:      {fib_iterativo} ({tempo_iter:.6f}s)")
+    print(f"Com memoização: {fib_memo} (frio {formatar_ns(tempo_memo_frio.mediana)}, quente {formatar_ns(tempo_memo.mediana)})")
+    print(f"Fast doubling:  {fib_iterativo} ({formatar_ns(tempo_iter.mediana)})")
     print()
     
     # 4. Torre de Hanói
@@ -366,16 +485,28 @@ def demonstrar_complexidades():
         print(f"  {i}: {sub}")
     print()
 
-def main():
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Análise de complexidade das estruturas avançadas")
+    parser.add_argument("--lista-ligada", type=int, metavar="N",
+                        help="só mede a ListaLigada com N elementos (ex.: 1000000)")
+    opcoes = parser.parse_args(argv)
+    if opcoes.lista_ligada:
+        análise_lista_ligada(opcoes.lista_ligada)
+        return
+
     print("=== ANÁLISE AVANÇADA DE COMPLEXIDADE - PYTHON ===\n")
     
     demonstrar_complexidades()
     análise_performance()
+    análise_lista_ligada(N_LISTA_LIGADA_DEMO)
     
     print("=== RESUMO DAS COMPLEXIDADES ===")
-    print("O(1)      - Inserção lista ligada, acesso array")
+    print("O(1)      - Inserção lista ligada (início/fim), busca com índice, acesso array")
     print("O(log n)  - Busca binária")
-    print("O(n)      - Busca linear, fibonacci iterativo/memoizado")
+    print("O(log n)  - Fibonacci (fast doubling)")
+    print("O(n)      - Busca linear, Fibonacci memoizado (cache frio)")
     print("O(n log n)- Merge sort, sort do Python")
     print("O(n²)     - Bubble sort, percorrer matriz")
     print("O(n³)     - Multiplicação de matrizes")
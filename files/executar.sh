@@ -9,3 +9,28 @@ echo "================================="
 # Executar arquivos Python
 python3 algoritmos.py
 python3 estruturas_avancadas.py
+
+echo "================================="
+echo "Comparando C e Python (ctypes):"
+echo "================================="
+
+python3 ponte_c.py
+
+echo "================================="
+echo "Perfil de memória:"
+echo "================================="
+
+python3 memoria.py
+
+echo "================================="
+echo "Contagem de operações:"
+echo "================================="
+
+python3 instrumentacao.py
+
+echo "================================="
+echo "Execução isolada por processo:"
+echo "================================="
+
+# Células sem mudança no código saem do cache (cache_resultados.py)
+python3 executor.py --limite-s 5
@@ -0,0 +1,317 @@
+"""Execução isolada dos benchmarks: cada (algoritmo, n) em um processo novo
+
+Cada célula roda em um processo próprio (por padrão iniciado com "spawn",
+um interpretador limpo), então caches como o de fibonacci_com_memoizacao,
+o estado do GC e a memória de uma medição não vazam para a seguinte. O
+processo pai só importa este módulo: nunca executa os algoritmos. Cada
+célula tem limite de tempo (o processo é morto quando estoura) e de
+memória (RLIMIT_AS no filho, onde houver o módulo resource); células
+independentes rodam em paralelo e os resultados saem conforme terminam.
+"""
+
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:  # dependência opcional (só em sistemas Unix)
+    resource = None
+
+LIMITE_TEMPO_PADRAO = 10.0  # segundos por célula
+LIMITE_MEMORIA_PADRAO = 1 << 30  # bytes de espaço de endereçamento por célula
+ORCAMENTO_CELULA_NS = 100_000_000
+
+class Celula:
+    """Uma medição: alvo(*gerador(n)), com alvo e gerador como "modulo:nome"
+
+    Funções referenciadas pelo nome (e não pelo objeto) para que o processo
+    filho as importe do zero. Com `semente`, a entrada é gerador(n, semente).
+    """
+    __slots__ = ("nome", "alvo", "gerador", "n", "semente")
+
+    def __init__(self, nome, alvo, gerador, n, semente=None):
+        self.nome = nome
+        self.alvo = alvo
+        self.gerador = gerador
+        self.n = n
+        self.semente = semente
+
+    def __repr__(self):
+        return f"{self.nome}[n={self.n}]"
+
+class Resultado:
+    """Resultado de uma célula
+
+    situacao: "ok", "tempo esgotado", "memória", "erro" ou "pulado" (não
+    executada porque um n menor do mesmo algoritmo estourou um limite).
+    estatisticas: Estatisticas.como_dict() quando "ok".
+    """
+    def __init__(self, celula, situacao, estatisticas=None, duracao=0.0, mensagem=None):
+        self.celula = celula
+        self.situacao = situacao
+        self.estatisticas = estatisticas
+        self.duracao = duracao
+        self.mensagem = mensagem
+
+    def como_dict(self):
+        """Representação serializável em JSON (uma linha do arquivo de saída)"""
+        return {
+            "nome": self.celula.nome,
+            "n": self.celula.n,
+            "situacao": self.situacao,
+            "estatisticas": self.estatisticas,
+            "duracao_s": self.duracao,
+            "mensagem": self.mensagem,
+        }
+
+    def __repr__(self):
+        from benchmark import formatar_ns
+
+        texto = f"[{self.situacao}] {self.celula}"
+        if self.estatisticas:
+            texto += (f": mediana {formatar_ns(self.estatisticas['mediana_ns'])}, "
+                      f"p95 {formatar_ns(self.estatisticas['p95_ns'])}")
+        if self.mensagem:
+            texto += f": {self.mensagem}"
+        return texto + f" ({self.duracao:.2f}s)"
+
+def _resolver(referencia):
+    """'modulo:nome.atributo' -> objeto"""
+    modulo, _, caminho = referencia.partition(":")
+    objeto = importlib.import_module(modulo)
+    for parte in caminho.split("."):
+        objeto = getattr(objeto, parte)
+    return objeto
+
+def _executar_celula(conexao, celula, orcamento_ns, limite_memoria):
+    # Corpo do processo filho: mede a célula e envia o resultado pelo pipe
+    try:
+        if limite_memoria and resource is not None:
+            resource.setrlimit(resource.RLIMIT_AS, (limite_memoria, limite_memoria))
+        from benchmark import medir
+
+        func = _resolver(celula.alvo)
+        gerador = _resolver(celula.gerador)
+        args = gerador(celula.n) if celula.semente is None else gerador(celula.n, celula.semente)
+        if not isinstance(args, tuple):
+            args = (args,)
+        estatisticas = medir(func, *args, nome=repr(celula), orcamento_ns=orcamento_ns)
+        conexao.send(("ok", estatisticas.como_dict(), None))
+    except MemoryError:
+        conexao.send(("memória", None, "limite de memória excedido"))
+    except Exception as erro:
+        conexao.send(("erro", None, f"{type(erro).__name__}: {erro}"))
+    finally:
+        conexao.close()
+
+def _proxima(pendentes, ocupados):
+    """Remove e retorna a célula de menor n do primeiro caso sem célula em execução (ou None)"""
+    escolhida = None
+    for celula in pendentes:
+        if celula.nome in ocupados:
+            continue
+        if escolhida is None or (celula.nome == escolhida.nome and celula.n < escolhida.n):
+            escolhida = celula
+    if escolhida is not None:
+        pendentes.remove(escolhida)
+    return escolhida
+
+def executar(celulas, trabalhadores=None, limite_tempo=LIMITE_TEMPO_PADRAO,
+             limite_memoria=LIMITE_MEMORIA_PADRAO, orcamento_ns=ORCAMENTO_CELULA_NS,
+             contexto="spawn", pular_maiores=True, cache=None):
+    """Executa as células em processos isolados e gera os Resultado conforme terminam
+
+    Até `trabalhadores` processos (padrão: número de CPUs) rodam ao mesmo
+    tempo, no máximo um por algoritmo: os tamanhos de um algoritmo rodam
+    em ordem crescente de n, cada um só depois que o anterior termina.
+    Uma célula que passa de `limite_tempo` segundos é morta; uma que passa
+    de `limite_memoria` bytes termina com MemoryError. Com `pular_maiores`,
+    depois que um algoritmo estoura um limite em n, as células do mesmo
+    algoritmo com n maior são puladas (algoritmos exponenciais param
+    sozinhos). `contexto` é o método de início do multiprocessing ("spawn"
+    isola por completo; "fork" é mais rápido mas herda o estado do processo
+    pai). Com `cache` (um cache_resultados.CacheResultados), células cujo
+    código, gerador, n, semente, orçamento, código de medição e Python não
+    mudaram saem do cache sem processo novo, e as medidas com sucesso são
+    gravadas nele.
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    ctx = multiprocessing.get_context(contexto)
+    pendentes = deque(celulas)
+    ativos = {}  # conexão -> (processo, célula, início)
+    ocupados = set()  # nomes com uma célula em execução
+    cortes = {}  # nome -> menor n que estourou um limite
+    limites = [limite_tempo, limite_memoria]
+
+    while pendentes or ativos:
+        while len(ativos) < trabalhadores:
+            celula = _proxima(pendentes, ocupados)
+            if celula is None:
+                break
+            if pular_maiores and celula.nome in cortes and celula.n > cortes[celula.nome]:
+                yield Resultado(celula, "pulado", mensagem=f"n = {cortes[celula.nome]} já estourou o limite")
+                continue
+            if cache is not None:
+                anterior = _do_cache(cache, celula, orcamento_ns, limites)
+                if anterior is not None:
+                    if anterior.situacao != "ok":
+                        cortes[celula.nome] = min(celula.n, cortes.get(celula.nome, celula.n))
+                    yield anterior
+                    continue
+            leitura, escrita = ctx.Pipe(duplex=False)
+            processo = ctx.Process(target=_executar_celula, args=(escrita, celula, orcamento_ns, limite_memoria),
+                                   daemon=True)
+            processo.start()
+            escrita.close()
+            ativos[leitura] = (processo, celula, time.perf_counter())
+            ocupados.add(celula.nome)
+        if not ativos:
+            continue
+
+        prazo = min(inicio for _, _, inicio in ativos.values()) + limite_tempo
+        esperar = [processo.sentinel for processo, _, _ in ativos.values()] + list(ativos)
+        prontos = set(wait(esperar, timeout=max(0.0, prazo - time.perf_counter())))
+        agora = time.perf_counter()
+        for leitura, (processo, celula, inicio) in list(ativos.items()):
+            if leitura in prontos or processo.sentinel in prontos:
+                try:
+                    situacao, estatisticas, mensagem = leitura.recv()
+                except EOFError:
+                    # O filho morreu sem responder (ex.: morto pelo sistema por falta de memória)
+                    processo.join()
+                    situacao, estatisticas = "erro", None
+                    mensagem = f"processo terminou com código {processo.exitcode}"
+            elif agora - inicio >= limite_tempo:
+                processo.kill()
+                situacao, estatisticas, mensagem = "tempo esgotado", None, f"limite de {limite_tempo:g}s"
+            else:
+                continue
+            processo.join()
+            leitura.close()
+            del ativos[leitura]
+            ocupados.discard(celula.nome)
+            if cache is not None and situacao in ("ok", "tempo esgotado", "memória"):
+                # Estouros também são guardados, sob uma chave que inclui os limites
+                chave, codigo = _chave(celula, orcamento_ns, None if situacao == "ok" else limites)
+                registro = estatisticas if situacao == "ok" else {"situacao": situacao, "mensagem": mensagem}
+                cache.guardar(chave, celula.nome, celula.n, codigo, registro, celula.semente)
+            if situacao in ("tempo esgotado", "memória"):
+                cortes[celula.nome] = min(celula.n, cortes.get(celula.nome, celula.n))
+            yield Resultado(celula, situacao, estatisticas, agora - inicio, mensagem)
+
+def _versao_medicao():
+    # benchmark.medir e o corpo do processo filho (que o chama)
+    from cache_resultados import impressao_digital, versao_medicao
+
+    return versao_medicao() + impressao_digital(_executar_celula)
+
+def _chave(celula, orcamento_ns, limites=None):
+    """(chave do cache, hash do código do alvo) de uma célula"""
+    from cache_resultados import chave, impressao_digital
+
+    codigo = impressao_digital(_resolver(celula.alvo))
+    return chave(codigo, impressao_digital(_resolver(celula.gerador)), celula.n, celula.semente,
+                 limites=limites, orcamento_ns=orcamento_ns, medicao=_versao_medicao()), codigo
+
+def _do_cache(cache, celula, orcamento_ns, limites):
+    """Resultado guardado da célula (medição ou estouro com os mesmos limites), ou None"""
+    estatisticas = cache.obter(_chave(celula, orcamento_ns)[0])
+    if estatisticas is not None:
+        return Resultado(celula, "ok", estatisticas, mensagem="do cache")
+    estouro = cache.obter(_chave(celula, orcamento_ns, limites)[0])
+    if estouro is not None:
+        return Resultado(celula, estouro["situacao"], mensagem=f"{estouro['mensagem']} (do cache)")
+    return None
+
+def _inteiro(n):
+    return n
+
+def _intervalo(n):
+    return list(range(n))
+
+def _busca_ausente(n):
+    return list(range(n)), -1
+
+def _matrizes(n):
+    from complexidade import matriz_aleatoria
+    return matriz_aleatoria(n)
+
+def casos_padrao():
+    """(nome, alvo, gerador, tamanhos[, semente]): os casos de análise_performance e os exponenciais"""
+    aleatoria = "complexidade:lista_aleatoria"
+    return [
+        ("busca_linear", "algoritmos:busca_linear", "executor:_busca_ausente", [100, 1000, 5000, 10**5]),
+        ("busca_binaria_iterativa", "estruturas_avancadas:busca_binaria_iterativa", "executor:_busca_ausente",
+         [100, 1000, 5000, 10**5]),
+        ("sorted", "builtins:sorted", aleatoria, [100, 1000, 5000, 10**5], 42),
+        ("merge_sort", "estruturas_avancadas:merge_sort", aleatoria, [100, 1000, 5000, 10**5], 42),
+        ("bubble_sort", "estruturas_avancadas:bubble_sort", aleatoria, [100, 1000, 5000], 42),
+        ("multiplicar_matrizes", "algoritmos:multiplicar_matrizes", "executor:_matrizes", [16, 64, 128]),
+        ("fibonacci_recursivo", "algoritmos:fibonacci_recursivo", "executor:_inteiro", [20, 25, 30, 35, 40]),
+        # Recursão memoizada com o cache vazio: n fica abaixo de ~490, o limite
+        # de recursão padrão com dois frames por nível
+        ("fibonacci_com_memoizacao (frio)", "estruturas_avancadas:fibonacci_com_memoizacao.frio",
+         "executor:_inteiro", [30, 100, 200, 400]),
+        ("permutacoes", "algoritmos:permutacoes", "executor:_intervalo", [6, 8, 10, 11, 12]),
+        ("gerar_subconjuntos", "estruturas_avancadas:gerar_subconjuntos", "executor:_intervalo", [10, 16, 20, 24]),
+    ]
+
+def celulas_padrao(filtro=None):
+    """Uma Celula por (caso, n), em ordem crescente de n dentro de cada caso"""
+    return [Celula(nome, alvo, gerador, n, *semente)
+            for nome, alvo, gerador, tamanhos, *semente in casos_padrao()
+            if not filtro or filtro in nome
+            for n in sorted(tamanhos)]
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Executa cada (algoritmo, n) em um processo isolado com limites")
+    parser.add_argument("--trabalhadores", type=int, help="processos simultâneos (padrão: número de CPUs)")
+    parser.add_argument("--limite-s", type=float, default=LIMITE_TEMPO_PADRAO, help="tempo máximo por célula")
+    parser.add_argument("--limite-mib", type=float, default=LIMITE_MEMORIA_PADRAO / 2**20,
+                        help="memória máxima por célula (MiB)")
+    parser.add_argument("--orcamento-ms", type=float, default=ORCAMENTO_CELULA_NS / 1e6,
+                        help="tempo aproximado de medição por célula")
+    parser.add_argument("--filtro", help="executa apenas casos cujo nome contém este texto")
+    parser.add_argument("--saida", help="acrescenta cada resultado, ao terminar, como uma linha JSON neste arquivo")
+    parser.add_argument("--cache", default=None, help="arquivo do cache de resultados (padrão: o de cache_resultados)")
+    parser.add_argument("--sem-cache", action="store_true", help="mede todas as células, sem ler nem gravar o cache")
+    parser.add_argument("--contexto", default="spawn", choices=multiprocessing.get_all_start_methods(),
+                        help="método de início dos processos")
+    opcoes = parser.parse_args(argv)
+
+    print("=== EXECUÇÃO ISOLADA POR PROCESSO ===\n")
+    cache = None
+    if not opcoes.sem_cache:
+        from cache_resultados import CacheResultados, CAMINHO_PADRAO
+        cache = CacheResultados(opcoes.cache or CAMINHO_PADRAO)
+    inicio = time.perf_counter()
+    saida = open(opcoes.saida, "a", encoding="utf-8") if opcoes.saida else None
+    contagem = {}
+    try:
+        for resultado in executar(celulas_padrao(opcoes.filtro), opcoes.trabalhadores, opcoes.limite_s,
+                                  int(opcoes.limite_mib * 2**20), int(opcoes.orcamento_ms * 1e6), opcoes.contexto,
+                                  cache=cache):
+            print(resultado, flush=True)
+            contagem[resultado.situacao] = contagem.get(resultado.situacao, 0) + 1
+            if saida:
+                saida.write(json.dumps(resultado.como_dict(), ensure_ascii=False) + "\n")
+                saida.flush()
+    finally:
+        if saida:
+            saida.close()
+        if cache is not None:
+            cache.fechar()
+    resumo = ", ".join(f"{quantidade} {situacao}" for situacao, quantidade in contagem.items())
+    print(f"\n{resumo} em {time.perf_counter() - inicio:.1f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
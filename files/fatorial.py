@@ -0,0 +1,138 @@
+"""Fatorial de inteiros grandes por árvore de produtos (binary splitting)
+
+Multiplicar termo a termo (n · (n−1)!) faz cada multiplicação envolver um
+número gigante e um pequeno: o custo total cresce com o quadrado do tamanho
+do resultado. Aqui os fatores são multiplicados em pares, depois os pares
+em pares e assim por diante (árvore de produtos), de modo que as
+multiplicações caras são entre números de tamanho parecido, onde o
+Karatsuba do CPython rende.
+
+Além disso, as potências de 2 são separadas (como no math.factorial):
+
+    n! = 2^(n − popcount(n)) · Π_k P_k^(k+1)
+
+em que P_k é o produto dos ímpares em (n >> (k+1), n >> k]. Tudo é
+iterativo, sem limite de recursão. Usa gmpy2 quando estiver instalado.
+"""
+
+from memoizacao import CacheLRU
+
+try:
+    import gmpy2
+except ImportError:  # dependência opcional
+    gmpy2 = None
+
+# Resultados guardados como pontos de partida para chamadas seguintes,
+# limitados pelo tamanho total em bytes (10^6! ocupa ~2,3 MB, 10^7! ~27 MB)
+MAX_BYTES_PONTOS_CONTROLE = 64 * 2**20
+
+def _bytes(valor):
+    return (valor.bit_length() + 7) // 8
+
+_pontos_controle = CacheLRU(None, peso=_bytes, peso_maximo=MAX_BYTES_PONTOS_CONTROLE)
+
+def _validar(n):
+    if not isinstance(n, int):
+        raise TypeError(f"n deve ser inteiro, não {type(n).__name__}")
+    if n < 0:
+        raise ValueError("n deve ser não negativo")
+
+def produto(valores):
+    """Produto de uma lista de inteiros por árvore de produtos - iterativo"""
+    valores = list(valores)
+    if not valores:
+        return 1
+    while len(valores) > 1:
+        pares = [a * b for a, b in zip(valores[::2], valores[1::2])]
+        if len(valores) & 1:
+            pares.append(valores[-1])
+        valores = pares
+    return valores[0]
+
+def produto_intervalo(inicio, fim, passo=1):
+    """Produto de range(inicio, fim, passo) por árvore de produtos"""
+    return produto(range(inicio, fim, passo))
+
+def _fatorial_impar(n):
+    # Parte ímpar de n!: Π_k P_k^(k+1), acumulada de cima para baixo como no
+    # math.factorial (interno = P_K · ... · P_k; externo = Π interno)
+    interno = externo = 1
+    for k in range(n.bit_length() - 1, -1, -1):
+        inferior = (n >> (k + 1)) + 1 | 1
+        superior = (n >> k) + 1
+        interno *= produto_intervalo(inferior, superior, 2)
+        externo *= interno
+    return externo
+
+def fatorial_arvore(n):
+    """n! por árvore de produtos com as potências de 2 separadas, sem cache"""
+    _validar(n)
+    return _fatorial_impar(n) << (n - bin(n).count("1"))
+
+def fatorial(n):
+    """n! exato, reaproveitando pontos de controle de chamadas anteriores
+
+    Se já foi calculado m! com n/2 <= m <= n, calcula só m! · (m+1)···n;
+    senão, usa fatorial_arvore (ou gmpy2.fac). O resultado vira um novo
+    ponto de controle (cache LRU limitado a MAX_BYTES_PONTOS_CONTROLE bytes no
+    total).
+    """
+    _validar(n)
+    if n < 2:
+        return 1
+    valor = _pontos_controle.obter(n, None)
+    if valor is not None:
+        return valor
+    base = max((m for m in _pontos_controle.chaves() if 2 * m >= n and m < n), default=None)
+    if base is not None:
+        valor = _pontos_controle.obter(base, None)
+    if base is not None and valor is not None:
+        valor *= produto_intervalo(base + 1, n + 1)
+    elif gmpy2 is not None:
+        valor = int(gmpy2.fac(n))
+    else:
+        valor = fatorial_arvore(n)
+    _pontos_controle.guardar(n, valor)
+    return valor
+
+def limpar_pontos_controle():
+    _pontos_controle.limpar()
+
+def fatorial_sequencial(n):
+    """n! multiplicando termo a termo (referência) - O(n) multiplicações desbalanceadas"""
+    _validar(n)
+    resultado = 1
+    for i in range(2, n + 1):
+        resultado *= i
+    return resultado
+
+def main():
+    import math
+    import time
+
+    print("=== FATORIAL POR ÁRVORE DE PRODUTOS ===\n")
+    print(f"20! = {fatorial(20)}")
+    print(f"Backend gmpy2 disponível: {gmpy2 is not None}\n")
+
+    for n in (10**4, 10**5, 10**6):
+        linha = f"n = {n}:"
+        funcoes = [("math.factorial", math.factorial), ("árvore", fatorial_arvore)]
+        if n <= 10**5:
+            funcoes.append(("termo a termo", fatorial_sequencial))
+        resultados = []
+        for nome, funcao in funcoes:
+            inicio = time.perf_counter()
+            resultados.append(funcao(n))
+            linha += f" {nome} {time.perf_counter() - inicio:.3f}s,"
+        assert all(valor == resultados[0] for valor in resultados)
+        print(linha.rstrip(","))
+
+    print("\nChamadas repetidas com pontos de controle:")
+    limpar_pontos_controle()
+    for n in (10**6, 10**6 + 1000, 10**6 + 1000, 9 * 10**5):
+        inicio = time.perf_counter()
+        fatorial(n)
+        print(f"  fatorial({n}): {time.perf_counter() - inicio:.3f}s")
+
+if __name__ == "__main__":
+    main()
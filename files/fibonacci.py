@@ -0,0 +1,125 @@
+"""Fibonacci em O(log n) operações aritméticas (fast doubling)
+
+Identidades usadas, a partir de (F(k), F(k+1)):
+    F(2k)   = F(k) · (2·F(k+1) − F(k))
+    F(2k+1) = F(k)² + F(k+1)²
+
+Percorrendo os bits de n do mais significativo para o menos significativo,
+são feitas ~log2(n) etapas de 3 multiplicações. Para n grande o custo é
+dominado pela multiplicação de inteiros grandes (Karatsuba no CPython), por
+isso o gmpy2 é usado quando estiver instalado.
+"""
+
+try:
+    import gmpy2
+except ImportError:  # dependência opcional
+    gmpy2 = None
+
+# Abaixo desta distância, avançar um par (F(k), F(k+1)) por somas sucessivas
+# é mais barato que aplicar a fórmula de adição
+_PASSO_LINEAR = 16
+
+def _validar(n):
+    if n < 0:
+        raise ValueError("n deve ser não negativo")
+
+def fibonacci_par(n, m=None):
+    """Retorna (F(n), F(n+1)), opcionalmente módulo m - O(log n) multiplicações"""
+    _validar(n)
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+        if m is not None:
+            a %= m
+            b %= m
+    if m is not None:
+        return a % m, b % m
+    return a, b
+
+def fibonacci(n):
+    """F(n) por fast doubling - O(log n) multiplicações"""
+    _validar(n)
+    if gmpy2 is not None:
+        return int(gmpy2.fib(n))
+    return fibonacci_par(n)[0]
+
+def fibonacci_mod(n, m):
+    """F(n) mod m para n arbitrariamente grande - O(log n)"""
+    if m <= 0:
+        raise ValueError("m deve ser positivo")
+    return fibonacci_par(n, m)[0]
+
+def fibonacci_matricial(n):
+    """F(n) por exponenciação da matriz [[1, 1], [1, 0]] - O(log n) multiplicações"""
+    _validar(n)
+    # Matriz simétrica representada por (a, b, c) = [[a, b], [b, c]]
+    resultado = (1, 0, 1)
+    base = (1, 1, 0)
+    while n:
+        if n & 1:
+            a, b, c = resultado
+            x, y, z = base
+            resultado = (a * x + b * y, a * y + b * z, b * y + c * z)
+        x, y, z = base
+        base = (x * x + y * y, x * y + y * z, y * y + z * z)
+        n >>= 1
+    return resultado[1]
+
+def _avancar(par, distancia, m=None):
+    """Leva (F(k), F(k+1)) a (F(k+d), F(k+d+1)) sem recomeçar do zero"""
+    a, b = par
+    if distancia <= _PASSO_LINEAR:
+        for _ in range(distancia):
+            a, b = b, a + b
+            if m is not None:
+                b %= m
+        return a, b
+    fd, fd1 = fibonacci_par(distancia, m)
+    # F(k+d) = F(k)·F(d+1) + (F(k+1) − F(k))·F(d) ; F(k+d+1) = F(k+1)·F(d+1) + F(k)·F(d)
+    novo_a = a * fd1 + (b - a) * fd
+    novo_b = b * fd1 + a * fd
+    if m is not None:
+        return novo_a % m, novo_b % m
+    return novo_a, novo_b
+
+def fibonacci_lote(ns, m=None):
+    """F(n) para cada n em ns (mesma ordem), opcionalmente módulo m
+
+    Os índices são processados em ordem crescente e cada resultado é obtido
+    avançando o par anterior pela diferença entre índices consecutivos, de
+    modo que consultas próximas custam O(log Δ) em vez de O(log n).
+    """
+    ns = list(ns)
+    for n in ns:
+        _validar(n)
+    resultados = {}
+    atual = 0
+    par = (0, 1)
+    for n in sorted(set(ns)):
+        par = _avancar(par, n - atual, m)
+        atual = n
+        resultados[n] = par[0]
+    return [resultados[n] for n in ns]
+
+def main():
+    import time
+
+    print("=== FIBONACCI EM O(log n) ===\n")
+    print(f"F(0..15): {fibonacci_lote(range(16))}")
+    print(f"F(100) = {fibonacci(100)}")
+    print(f"F(100) matricial = {fibonacci_matricial(100)}")
+    print(f"F(10^18) mod 1_000_000_007 = {fibonacci_mod(10**18, 1_000_000_007)}")
+
+    for n in (10**5, 10**6, 10**7):
+        inicio = time.perf_counter()
+        valor = fibonacci(n)
+        duracao = time.perf_counter() - inicio
+        print(f"F({n}): {valor.bit_length()} bits em {duracao * 1000:.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+from collections.abc import Sequence
+
+# Hastes numeradas como nos parâmetros de torre_hanoi: 0 = origem,
+# 1 = destino, 2 = auxiliar. Um movimento é a tupla (disco, de, para).
+ORIGEM, DESTINO, AUXILIAR = 0, 1, 2
+
+# Codificação compacta de um movimento em um byte: (disco - 1) << 3 | tipo,
+# em que tipo indexa o par (de, para) em PARES. Cabe até 32 discos
+PARES = ((0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1))
+_TIPO = {par: tipo for tipo, par in enumerate(PARES)}
+MAX_DISCOS_COMPACTO = 32
+
+def _hastes(n):
+    # A fórmula de bits abaixo leva a torre para a haste 1 quando n é par e
+    # para a haste 2 quando n é ímpar; com n ímpar, troca 1 e 2
+    return (0, 2, 1) if n & 1 else (0, 1, 2)
+
+def total_movimentos(n):
+    return (1 << n) - 1
+
+def movimento(n, k):
+    """k-ésimo movimento (1 <= k <= 2^n - 1) como (disco, de, para) - O(1) operações de bits
+
+    O disco é 1 + número de zeros à direita de k; as hastes saem de
+    (k & (k - 1)) mod 3 e ((k | (k - 1)) + 1) mod 3, sem enumerar os
+    movimentos anteriores.
+    """
+    if not 1 <= k <= total_movimentos(n):
+        raise IndexError(f"movimento {k} fora de 1..{total_movimentos(n)}")
+    hastes = _hastes(n)
+    return (k & -k).bit_length(), hastes[(k & (k - 1)) % 3], hastes[((k | (k - 1)) + 1) % 3]
+
+def movimentos(n):
+    """Gera os 2^n - 1 movimentos como tuplas (disco, de, para), sem recursão
+
+    O(1) de memória e O(1) amortizado por movimento.
+    """
+    hastes = _hastes(n)
+    for k in range(1, 1 << n):
+        yield (k & -k).bit_length(), hastes[(k & (k - 1)) % 3], hastes[((k | (k - 1)) + 1) % 3]
+
+def estado_apos(n, k):
+    """Discos em cada haste (de baixo para cima) depois de k movimentos - O(n)
+
+    O disco d já se moveu (k + 2^(d-1)) >> d vezes e sempre gira no mesmo
+    sentido (um sentido para d ímpar, o outro para d par), então sua
+    haste sai direto dessa contagem.
+    """
+    if not 0 <= k <= total_movimentos(n):
+        raise IndexError(f"k fora de 0..{total_movimentos(n)}")
+    hastes = _hastes(n)
+    estado = ([], [], [])
+    for disco in range(n, 0, -1):
+        vezes = (k + (1 << (disco - 1))) >> disco
+        sentido = 1 if disco % 2 == 0 else -1
+        estado[hastes[(sentido * vezes) % 3]].append(disco)
+    return estado
+
+def codificar(disco, de, para):
+    return (disco - 1) << 3 | _TIPO[de, para]
+
+def decodificar(codigo):
+    """Código de um byte -> (disco, de, para)"""
+    de, para = PARES[codigo & 7]
+    return (codigo >> 3) + 1, de, para
+
+def _tabela(troca):
+    # Tabela de bytes.translate que aplica uma troca de hastes a cada código
+    tabela = bytearray(range(256))
+    for codigo in range(MAX_DISCOS_COMPACTO << 3):
+        if codigo & 7 < len(PARES):
+            disco, de, para = decodificar(codigo)
+            tabela[codigo] = codificar(disco, troca[de], troca[para])
+    return bytes(tabela)
+
+# S(n) = S(n-1) com destino e auxiliar trocados + (n: origem -> destino)
+#        + S(n-1) com origem e auxiliar trocados
+_TROCA_DESTINO_AUXILIAR = _tabela((0, 2, 1))
+_TROCA_ORIGEM_AUXILIAR = _tabela((2, 1, 0))
+
+def movimentos_compactos(n):
+    """Todos os movimentos em um bytes de 2^n - 1 bytes (um por movimento) - O(2^n) em C
+
+    Cada nível é montado a partir do anterior com duas chamadas a
+    bytes.translate (renomeando as hastes) e uma concatenação, sem laço
+    Python por movimento. Use decodificar() para ler um byte.
+    """
+    if n > MAX_DISCOS_COMPACTO:
+        raise ValueError(f"a codificação compacta suporta no máximo {MAX_DISCOS_COMPACTO} discos")
+    sequencia = b""
+    for disco in range(1, n + 1):
+        sequencia = (sequencia.translate(_TROCA_DESTINO_AUXILIAR)
+                     + bytes((codificar(disco, ORIGEM, DESTINO),))
+                     + sequencia.translate(_TROCA_ORIGEM_AUXILIAR))
+    return sequencia
+
+def formatar(mov, nomes=("A", "C", "B")):
+    """Texto de um movimento; `nomes` = (origem, destino, auxiliar)"""
+    disco, de, para = mov
+    return f"Mover disco {disco} de {nomes[de]} para {nomes[para]}"
+
+class MovimentosHanoi(Sequence):
+    """Sequência preguiçosa dos textos dos movimentos
+
+    Funciona como a lista de strings de antes (len, índice, fatias,
+    iteração), mas cada texto só é montado quando acessado: m[i] custa O(1)
+    operações de bits e nada é guardado.
+    """
+    __slots__ = ("n", "nomes")
+
+    def __init__(self, n, nomes=("A", "C", "B")):
+        self.n = n
+        self.nomes = nomes
+
+    def __len__(self):
+        return total_movimentos(self.n)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("movimento fora da sequência")
+        return formatar(movimento(self.n, indice + 1), self.nomes)
+
+    def __iter__(self):
+        nomes = self.nomes
+        for mov in movimentos(self.n):
+            yield formatar(mov, nomes)
+
+    def __repr__(self):
+        return f"MovimentosHanoi(n={self.n}, {len(self)} movimentos)"
+
+def main():
+    import time
+    import tracemalloc
+
+    print("=== TORRE DE HANÓI SEM RECURSÃO ===\n")
+    n = 3
+    for k, mov in enumerate(movimentos(n), 1):
+        print(f"  {k}. {mov} {formatar(mov)}")
+    print(f"Estado após 3 movimentos: {estado_apos(n, 3)}\n")
+
+    n = 64
+    k = 10**18
+    print(f"n = {n}: movimento {k} = {movimento(n, k)}")
+    print(f"Estado após {k} movimentos: {[len(haste) for haste in estado_apos(n, k)]} discos por haste\n")
+
+    for n in (20, 25):
+        inicio = time.perf_counter()
+        for _ in movimentos(n):
+            pass
+        gerador = time.perf_counter() - inicio
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        compacto = movimentos_compactos(n)
+        tempo_compacto = time.perf_counter() - inicio
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"n = {n}: {len(compacto)} movimentos, gerador de tuplas {gerador:.2f}s, "
+              f"bytes compactos {tempo_compacto:.3f}s (pico {pico / 2**20:.0f} MiB)")
+
+if __name__ == "__main__":
+    main()
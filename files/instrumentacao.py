@@ -0,0 +1,367 @@
+"""Contagem de operações e árvore de chamadas dos algoritmos
+
+Nada aqui altera os algoritmos: fora de `instrumentar` não há gancho
+nenhum (custo zero). Dentro dele, um gancho de sys.setprofile conta as
+chamadas, a profundidade máxima de recursão e o tempo próprio de cada
+pilha de chamadas das funções Python dos módulos escolhidos (inclusive
+funções internas, como o `ordenar` de ordenacao.merge_sort_buffer).
+Comparações e escritas são contadas pelos próprios dados: `elementos`
+embrulha cada valor em um Comparavel (que conta toda comparação, mesmo as
+feitas em C por sorted ou bisect) dentro de uma ListaInstrumentada (que
+conta as atribuições por índice ou fatia).
+"""
+
+import operator
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Módulos instrumentados por padrão (os dois módulos de algoritmos e os
+# auxiliares para onde eles delegam)
+MODULOS_PADRAO = ("algoritmos", "estruturas_avancadas", "ordenacao", "fibonacci", "fatorial",
+                  "memoizacao", "permutacoes", "matriz", "hanoi")
+
+class Contadores:
+    """Contagens acumuladas enquanto a instrumentação está ativa
+
+    chamadas: Counter nome -> chamadas (geradores contam uma por retomada)
+    profundidade: nome -> maior número de chamadas simultâneas da função
+    pilha_maxima: maior profundidade da pilha instrumentada
+    pilhas: Counter (nome, ..., nome) -> tempo próprio em ns da pilha
+    chamadas_pilha: Counter (nome, ..., nome) -> chamadas com essa pilha
+    alocacoes: nome -> blocos alocados e não liberados (se pedido)
+    comparacoes, escritas: operações sobre os dados de `elementos`
+    (escritas é None quando o algoritmo copiou a entrada para uma list
+    comum, onde as escritas não podem ser vistas)
+    """
+    def __init__(self):
+        self.chamadas = Counter()
+        self.profundidade = {}
+        self.pilha_maxima = 0
+        self.pilhas = Counter()
+        self.chamadas_pilha = Counter()
+        self.alocacoes = Counter()
+        self.comparacoes = 0
+        self.escritas = 0
+
+    @property
+    def total_chamadas(self):
+        return sum(self.chamadas.values())
+
+    def tempo_proprio(self):
+        """Counter nome -> tempo próprio (ns) somado em todas as pilhas"""
+        tempos = Counter()
+        for pilha, ns in self.pilhas.items():
+            tempos[pilha[-1]] += ns
+        return tempos
+
+    def pilhas_colapsadas(self, metrica="tempo"):
+        """Linhas 'a;b;c valor' no formato do flamegraph.pl / speedscope
+
+        `metrica` "tempo" usa o tempo próprio em µs; "chamadas" conta cada
+        pilha uma vez por chamada.
+        """
+        linhas = []
+        for pilha, valor in sorted(self.pilhas.items()):
+            if metrica == "tempo":
+                valor = max(1, round(valor / 1000))
+            elif metrica == "chamadas":
+                valor = self.chamadas_pilha[pilha]
+            else:
+                raise ValueError(f"métrica desconhecida: {metrica}")
+            linhas.append(f"{';'.join(pilha)} {valor}")
+        return linhas
+
+    def exportar_pilhas(self, caminho, metrica="tempo"):
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write("\n".join(self.pilhas_colapsadas(metrica)) + "\n")
+
+    def como_dict(self):
+        """Representação serializável em JSON"""
+        return {
+            "chamadas": dict(self.chamadas),
+            "profundidade": dict(self.profundidade),
+            "pilha_maxima": self.pilha_maxima,
+            "comparacoes": self.comparacoes,
+            "escritas": self.escritas,
+            "alocacoes": dict(self.alocacoes),
+        }
+
+class _Gancho:
+    """Função de sys.setprofile que mantém a pilha das funções instrumentadas"""
+    def __init__(self, contadores, arquivos, alocacoes):
+        self.contadores = contadores
+        self.arquivos = arquivos
+        self.alocacoes = alocacoes
+        self.nomes = {}  # código -> nome qualificado
+        self.pilha = []  # [frame, nome, início, tempo dos filhos, blocos no início]
+        self.caminho = []
+        self.ativas = Counter()
+
+    def __call__(self, frame, evento, argumento):
+        if evento == "call":
+            codigo = frame.f_code
+            nome = self.nomes.get(codigo)
+            if nome is None:
+                if codigo.co_filename not in self.arquivos:
+                    return
+                nome = self.nomes[codigo] = f"{frame.f_globals.get('__name__', '?')}.{codigo.co_qualname}"
+            contadores = self.contadores
+            contadores.chamadas[nome] += 1
+            ativas = self.ativas[nome] = self.ativas[nome] + 1
+            if ativas > contadores.profundidade.get(nome, 0):
+                contadores.profundidade[nome] = ativas
+            self.caminho.append(nome)
+            if len(self.caminho) > contadores.pilha_maxima:
+                contadores.pilha_maxima = len(self.caminho)
+            blocos = sys.getallocatedblocks() if self.alocacoes else 0
+            self.pilha.append([frame, nome, time.perf_counter_ns(), 0, blocos])
+        elif evento == "return" and self.pilha and self.pilha[-1][0] is frame:
+            agora = time.perf_counter_ns()
+            _, nome, inicio, filhos, blocos = self.pilha.pop()
+            total = agora - inicio
+            contadores = self.contadores
+            chave = tuple(self.caminho)
+            contadores.pilhas[chave] += total - filhos
+            contadores.chamadas_pilha[chave] += 1
+            if self.alocacoes:
+                contadores.alocacoes[nome] += sys.getallocatedblocks() - blocos
+            if self.pilha:
+                self.pilha[-1][3] += total
+            self.caminho.pop()
+            self.ativas[nome] -= 1
+
+def _arquivos(modulos):
+    arquivos = set()
+    for modulo in modulos:
+        if isinstance(modulo, str):
+            modulo = sys.modules.get(modulo) or __import__(modulo)
+        arquivos.add(modulo.__file__)
+    return arquivos
+
+@contextmanager
+def instrumentar(modulos=MODULOS_PADRAO, alocacoes=False, contadores=None):
+    """Bloco com chamadas, profundidade e tempo por pilha contados
+
+    `modulos` são nomes ou objetos de módulo cujas funções são
+    instrumentadas. Com `alocacoes`, cada chamada soma a variação de
+    sys.getallocatedblocks (blocos alocados e não liberados, inclusive os
+    das funções chamadas). Produz o objeto Contadores; só a thread atual é
+    instrumentada. O gancho anterior de sys.setprofile é restaurado na saída.
+    """
+    contadores = contadores or Contadores()
+    anterior = sys.getprofile()
+    sys.setprofile(_Gancho(contadores, _arquivos(modulos), alocacoes))
+    try:
+        yield contadores
+    finally:
+        sys.setprofile(anterior)
+
+class Comparavel:
+    """Valor que conta as comparações feitas com ele"""
+    __slots__ = ("valor", "contadores")
+
+    def __init__(self, valor, contadores):
+        self.valor = valor
+        self.contadores = contadores
+
+    def _comparar(self, outro, operador):
+        self.contadores.comparacoes += 1
+        return operador(self.valor, outro.valor if isinstance(outro, Comparavel) else outro)
+
+    def __lt__(self, outro):
+        return self._comparar(outro, operator.lt)
+
+    def __le__(self, outro):
+        return self._comparar(outro, operator.le)
+
+    def __gt__(self, outro):
+        return self._comparar(outro, operator.gt)
+
+    def __ge__(self, outro):
+        return self._comparar(outro, operator.ge)
+
+    def __eq__(self, outro):
+        return self._comparar(outro, operator.eq)
+
+    def __ne__(self, outro):
+        return self._comparar(outro, operator.ne)
+
+    def __hash__(self):
+        return hash(self.valor)
+
+    def __repr__(self):
+        return repr(self.valor)
+
+class ListaInstrumentada(list):
+    """Lista que conta as escritas (atribuições por índice ou fatia)
+
+    Uma troca a[i], a[j] = a[j], a[i] são duas escritas. copy() e fatias
+    continuam instrumentadas; list(lista) devolve uma list comum, então
+    algoritmos que copiam assim só têm as comparações contadas (perfilar
+    marca as escritas deles como desconhecidas).
+    """
+    def __init__(self, valores=(), contadores=None):
+        super().__init__(valores)
+        self.contadores = contadores
+
+    def __setitem__(self, indice, valor):
+        if isinstance(indice, slice):
+            valor = list(valor)
+            self.contadores.escritas += len(valor)
+        else:
+            self.contadores.escritas += 1
+        super().__setitem__(indice, valor)
+
+    def __getitem__(self, indice):
+        resultado = super().__getitem__(indice)
+        if isinstance(indice, slice):
+            return ListaInstrumentada(resultado, self.contadores)
+        return resultado
+
+    def copy(self):
+        return ListaInstrumentada(self, self.contadores)
+
+def elementos(valores, contadores):
+    """ListaInstrumentada de Comparavel com os valores (entrada instrumentada)"""
+    return ListaInstrumentada((Comparavel(valor, contadores) for valor in valores), contadores)
+
+def _copiou(resultado):
+    # Resultado em uma list comum (ou em uma tupla que começa por uma, como
+    # em bubble_sort) = a entrada foi copiada por fora da ListaInstrumentada
+    if isinstance(resultado, tuple) and resultado:
+        resultado = resultado[0]
+    return type(resultado) is list and bool(resultado)
+
+def valores(dados):
+    """Desfaz `elementos`: valores originais (recursivo em listas e tuplas)"""
+    if isinstance(dados, Comparavel):
+        return dados.valor
+    if isinstance(dados, tuple):
+        return tuple(valores(item) for item in dados)
+    if isinstance(dados, list):
+        return [valores(item) for item in dados]
+    return dados
+
+class Perfil:
+    """Contagens de uma execução instrumentada junto do tempo medido sem instrumentação"""
+    def __init__(self, nome, contadores, tempo):
+        self.nome = nome
+        self.contadores = contadores
+        self.tempo = tempo
+
+    def por_operacao(self):
+        """ns (do tempo sem instrumentação) por chamada e por comparação"""
+        contadores = self.contadores
+        mediana = self.tempo.mediana
+        return {
+            "ns_por_chamada": mediana / contadores.total_chamadas if contadores.total_chamadas else None,
+            "ns_por_comparacao": mediana / contadores.comparacoes if contadores.comparacoes else None,
+        }
+
+    def quentes(self, quantidade=5):
+        """Funções com mais tempo próprio: [(nome, fração do total, chamadas)]"""
+        tempos = self.contadores.tempo_proprio()
+        total = sum(tempos.values()) or 1
+        return [(nome, ns / total, self.contadores.chamadas[nome])
+                for nome, ns in tempos.most_common(quantidade)]
+
+    def como_dict(self):
+        return {**self.contadores.como_dict(), **self.por_operacao(), "mediana_ns": self.tempo.mediana}
+
+    def __repr__(self):
+        from benchmark import formatar_ns
+
+        c = self.contadores
+        escritas = "n/d" if c.escritas is None else c.escritas
+        texto = (f"{self.nome}: {c.total_chamadas} chamadas, pilha máxima {c.pilha_maxima}, "
+                 f"{c.comparacoes} comparações, {escritas} escritas, tempo {formatar_ns(self.tempo.mediana)}")
+        por_operacao = self.por_operacao()
+        if por_operacao["ns_por_comparacao"]:
+            texto += f" ({por_operacao['ns_por_comparacao']:.1f}ns/comparação)"
+        return texto
+
+def perfilar(func, *args, nome=None, contar_elementos=False, modulos=MODULOS_PADRAO,
+             alocacoes=False, orcamento_ns=50_000_000):
+    """Executa func(*args) uma vez instrumentada e mede o tempo sem instrumentação
+
+    Com `contar_elementos`, o primeiro argumento (uma sequência) é trocado
+    por `elementos(...)` na execução instrumentada, para contar comparações
+    e escritas; se nenhuma escrita foi vista e o resultado é uma list
+    comum, a entrada foi copiada (list(), sorted) e as escritas ficam None
+    ("n/d"), não 0. O tempo vem de benchmark.medir com os argumentos
+    originais, então as contagens podem ser divididas por ele sem o custo
+    do gancho.
+    """
+    from benchmark import medir
+
+    nome = nome or getattr(func, "__name__", repr(func))
+    contadores = Contadores()
+    instrumentados = args
+    if contar_elementos:
+        instrumentados = (elementos(args[0], contadores), *args[1:])
+    with instrumentar(modulos, alocacoes, contadores):
+        resultado = func(*instrumentados)
+    if contar_elementos and contadores.escritas == 0 and _copiou(resultado):
+        contadores.escritas = None
+    tempo = medir(func, *args, nome=nome, orcamento_ns=orcamento_ns)
+    return Perfil(nome, contadores, tempo)
+
+def casos_padrao():
+    """(nome, func, args, contar_elementos) dos dois módulos"""
+    import random
+    import algoritmos
+    import estruturas_avancadas as ea
+
+    gerador = random.Random(42)
+    dados = [gerador.randint(1, 1000) for _ in range(2000)]
+    ordenados = sorted(dados)
+    return [
+        ("algoritmos.fibonacci_recursivo", algoritmos.fibonacci_recursivo, (20,), False),
+        ("algoritmos.fibonacci_recursivo_memoizado", algoritmos.fibonacci_recursivo_memoizado.frio, (200,), False),
+        ("algoritmos.busca_binaria", algoritmos.busca_binaria, (ordenados, -1), True),
+        ("estruturas_avancadas.busca_binaria_recursiva", ea.busca_binaria_recursiva, (ordenados, -1), True),
+        ("estruturas_avancadas.bubble_sort", ea.bubble_sort, (dados[:300],), True),
+        ("estruturas_avancadas.merge_sort", ea.merge_sort, (dados,), True),
+        ("sorted", sorted, (dados,), True),
+        ("estruturas_avancadas.gerar_subconjuntos", ea.gerar_subconjuntos, (list(range(12)),), False),
+    ]
+
+def main(argv=None):
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Conta chamadas, profundidade, comparações e escritas dos algoritmos")
+    parser.add_argument("--filtro", help="perfila apenas casos cujo nome contém este texto")
+    parser.add_argument("--pilhas", help="grava as pilhas colapsadas (flamegraph) de todos os casos neste arquivo")
+    parser.add_argument("--saida", help="grava as contagens em JSON neste caminho")
+    parser.add_argument("--alocacoes", action="store_true", help="conta também os blocos alocados por função")
+    opcoes = parser.parse_args(argv)
+
+    print("=== INSTRUMENTAÇÃO: CHAMADAS E OPERAÇÕES ===\n")
+    perfis = []
+    linhas_pilhas = []
+    for nome, func, args, contar in casos_padrao():
+        if opcoes.filtro and opcoes.filtro not in nome:
+            continue
+        perfil = perfilar(func, *args, nome=nome, contar_elementos=contar, alocacoes=opcoes.alocacoes)
+        perfis.append(perfil)
+        print(perfil)
+        for funcao, fracao, chamadas in perfil.quentes(3):
+            profundidade = perfil.contadores.profundidade[funcao]
+            print(f"    {fracao:6.1%} {funcao} ({chamadas} chamadas, profundidade {profundidade})")
+        linhas_pilhas += [f"{nome};{linha}" for linha in perfil.contadores.pilhas_colapsadas()]
+
+    if opcoes.pilhas:
+        with open(opcoes.pilhas, "w", encoding="utf-8") as arquivo:
+            arquivo.write("\n".join(linhas_pilhas) + "\n")
+        print(f"\nPilhas colapsadas gravadas em {opcoes.pilhas}")
+    if opcoes.saida:
+        with open(opcoes.saida, "w", encoding="utf-8") as arquivo:
+            json.dump({perfil.nome: perfil.como_dict() for perfil in perfis}, arquivo, indent=2, ensure_ascii=False)
+        print(f"Contagens gravadas em {opcoes.saida}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+from bisect import bisect_left, bisect_right, insort_right
+from itertools import chain, islice
+
+# Tamanho alvo de cada sublista. Inserir em uma lista de ~1000 elementos
+# (memmove em C) é mais barato que manter nós de uma árvore em Python;
+# uma sublista é dividida ao passar de 2 * CARGA elementos
+CARGA = 1000
+
+class ListaOrdenada:
+    """Coleção ordenada dinâmica: uma B-tree rasa de sublistas ordenadas
+
+    Os valores ficam em sublistas de até 2 * CARGA elementos, com o máximo
+    de cada uma em `_maximos` (o "nó interno" da árvore) para localizar a
+    sublista por bisect. Uma árvore de Fenwick sobre os tamanhos das
+    sublistas dá o posto (rank) e o acesso por posição em O(log n). Como nas
+    buscas binárias, as buscas retornam a posição ou -1.
+    """
+    __slots__ = ("_listas", "_maximos", "_fenwick", "_tamanho")
+
+    def __init__(self, valores=()):
+        valores = sorted(valores)
+        self._listas = [valores[i:i + CARGA] for i in range(0, len(valores), CARGA)]
+        self._maximos = [lista[-1] for lista in self._listas]
+        self._tamanho = len(valores)
+        self._fenwick = None
+
+    def _construir_fenwick(self):
+        # Construção em O(k): cada nó repassa sua soma ao pai
+        arvore = [0]
+        arvore.extend(map(len, self._listas))
+        k = len(self._listas)
+        for i in range(1, k + 1):
+            pai = i + (i & -i)
+            if pai <= k:
+                arvore[pai] += arvore[i]
+        self._fenwick = arvore
+        return arvore
+
+    def _somar(self, j, delta):
+        """Atualiza o tamanho da sublista j na árvore de Fenwick - O(log k)"""
+        arvore = self._fenwick
+        if arvore is None:
+            return
+        k = len(arvore) - 1
+        i = j + 1
+        while i <= k:
+            arvore[i] += delta
+            i += i & -i
+
+    def _prefixo(self, j):
+        """Número de elementos nas sublistas anteriores à j - O(log k)"""
+        arvore = self._fenwick or self._construir_fenwick()
+        total = 0
+        while j:
+            total += arvore[j]
+            j &= j - 1
+        return total
+
+    def _localizar(self, posicao):
+        """(sublista, deslocamento) do elemento na posição dada - O(log k)"""
+        arvore = self._fenwick or self._construir_fenwick()
+        k = len(arvore) - 1
+        j = 0
+        passo = 1 << k.bit_length()
+        while passo:
+            proximo = j + passo
+            if proximo <= k and arvore[proximo] <= posicao:
+                posicao -= arvore[proximo]
+                j = proximo
+            passo >>= 1
+        return j, posicao
+
+    def inserir(self, valor):
+        """Insere mantendo a ordem (depois dos iguais) - O(log n) + O(CARGA) em C"""
+        listas, maximos = self._listas, self._maximos
+        self._tamanho += 1
+        if not listas:
+            listas.append([valor])
+            maximos.append(valor)
+            self._fenwick = None
+            return
+        j = bisect_right(maximos, valor)
+        if j == len(maximos):
+            j -= 1
+            listas[j].append(valor)
+            maximos[j] = valor
+        else:
+            insort_right(listas[j], valor)
+        lista = listas[j]
+        if len(lista) > 2 * CARGA:
+            listas.insert(j + 1, lista[CARGA:])
+            maximos.insert(j + 1, lista[-1])
+            del lista[CARGA:]
+            maximos[j] = lista[-1]
+            # Divisões acontecem a cada ~CARGA inserções: reconstruir é amortizado O(1)
+            self._fenwick = None
+        else:
+            self._somar(j, 1)
+
+    def remover(self, valor):
+        """Remove a primeira ocorrência de valor e retorna sua posição, ou -1 - O(log n)"""
+        listas, maximos = self._listas, self._maximos
+        j = bisect_left(maximos, valor)
+        if j == len(maximos):
+            return -1
+        lista = listas[j]
+        i = bisect_left(lista, valor)
+        if lista[i] != valor:
+            return -1
+        posicao = self._prefixo(j) + i
+        del lista[i]
+        self._tamanho -= 1
+        if lista:
+            maximos[j] = lista[-1]
+            self._somar(j, -1)
+        else:
+            del listas[j]
+            del maximos[j]
+            self._fenwick = None
+        return posicao
+
+    def limite_inferior(self, valor):
+        """Quantidade de elementos < valor (posto / lower bound) - O(log n)"""
+        j = bisect_left(self._maximos, valor)
+        if j == len(self._maximos):
+            return self._tamanho
+        return self._prefixo(j) + bisect_left(self._listas[j], valor)
+
+    def limite_superior(self, valor):
+        """Quantidade de elementos <= valor (upper bound) - O(log n)"""
+        j = bisect_right(self._maximos, valor)
+        if j == len(self._maximos):
+            return self._tamanho
+        return self._prefixo(j) + bisect_right(self._listas[j], valor)
+
+    def buscar(self, valor):
+        """Posição da primeira ocorrência de valor, ou -1 - O(log n)"""
+        j = bisect_left(self._maximos, valor)
+        if j == len(self._maximos):
+            return -1
+        lista = self._listas[j]
+        i = bisect_left(lista, valor)
+        if lista[i] != valor:
+            return -1
+        return self._prefixo(j) + i
+
+    def __contains__(self, valor):
+        j = bisect_left(self._maximos, valor)
+        if j == len(self._maximos):
+            return False
+        lista = self._listas[j]
+        return lista[bisect_left(lista, valor)] == valor
+
+    def __getitem__(self, posicao):
+        """Elemento na posição dada (k-ésimo menor) - O(log n)"""
+        if posicao < 0:
+            posicao += self._tamanho
+        if not 0 <= posicao < self._tamanho:
+            raise IndexError("posição fora da lista")
+        j, i = self._localizar(posicao)
+        return self._listas[j][i]
+
+    def intervalo(self, minimo, maximo):
+        """Percorre os valores com minimo <= valor <= maximo, em ordem - O(log n + k)"""
+        listas, maximos = self._listas, self._maximos
+        j = bisect_left(maximos, minimo)
+        if j == len(maximos):
+            return
+        i = bisect_left(listas[j], minimo)
+        for lista in islice(listas, j, None):
+            if lista[-1] <= maximo:
+                yield from islice(lista, i, None)
+            else:
+                yield from islice(lista, i, bisect_right(lista, maximo))
+                return
+            i = 0
+
+    def __iter__(self):
+        return chain.from_iterable(self._listas)
+
+    def __len__(self):
+        return self._tamanho
+
+    def __repr__(self):
+        return f"ListaOrdenada({list(self)!r})"
+
+def fluxo_misto(operacoes, proporcao_insercao=0.5, maximo=10**9, seed=42):
+    """Fluxo reprodutível de ("inserir" | "buscar", valor), intercalados ao acaso"""
+    import random
+
+    gerador = random.Random(seed)
+    inseridos = []
+    for _ in range(operacoes):
+        if not inseridos or gerador.random() < proporcao_insercao:
+            valor = gerador.randint(0, maximo)
+            inseridos.append(valor)
+            yield "inserir", valor
+        elif gerador.random() < 0.5:
+            # Metade das buscas acerta um valor já inserido, metade é aleatória
+            yield "buscar", inseridos[gerador.randrange(len(inseridos))]
+        else:
+            yield "buscar", gerador.randint(0, maximo)
+
+def executar_fluxo(fluxo, inserir, buscar):
+    """Aplica o fluxo e retorna quantas buscas encontraram o valor"""
+    encontrados = 0
+    for operacao, valor in fluxo:
+        if operacao == "inserir":
+            inserir(valor)
+        elif buscar(valor) != -1:
+            encontrados += 1
+    return encontrados
+
+def main():
+    import time
+    from estruturas_avancadas import busca_binaria_iterativa
+
+    print("=== LISTA ORDENADA DINÂMICA ===\n")
+    exemplo = ListaOrdenada([5, 1, 4])
+    exemplo.inserir(3)
+    print(f"{exemplo}: buscar(4) = {exemplo.buscar(4)}, buscar(2) = {exemplo.buscar(2)}, "
+          f"posto de 4 = {exemplo.limite_inferior(4)}, [1] = {exemplo[1]}, "
+          f"intervalo(2, 4) = {list(exemplo.intervalo(2, 4))}\n")
+
+    print("Fluxos intercalados de inserções e buscas (50%/50%):")
+    for operacoes in (10**4, 10**5, 10**6):
+        fluxo = list(fluxo_misto(operacoes))
+        ordenada = ListaOrdenada()
+        inicio = time.perf_counter()
+        encontrados = executar_fluxo(fluxo, ordenada.inserir, ordenada.buscar)
+        tempo = time.perf_counter() - inicio
+        linha = f"  {operacoes:>8} operações: ListaOrdenada {tempo:.3f}s"
+
+        if operacoes <= 10**5:
+            # list + bisect.insort: deslocamento O(n) por inserção (em C)
+            lista = []
+            inicio = time.perf_counter()
+            assert executar_fluxo(fluxo, lambda valor: insort_right(lista, valor),
+                                  lambda valor: busca_binaria_iterativa(lista, valor)) == encontrados
+            linha += f", list + insort {time.perf_counter() - inicio:.3f}s"
+        if operacoes <= 10**4:
+            # Reordenar a lista inteira depois de cada inserção
+            lista = []
+            def inserir_e_reordenar(valor):
+                lista.append(valor)
+                lista.sort()
+            inicio = time.perf_counter()
+            assert executar_fluxo(fluxo, inserir_e_reordenar,
+                                  lambda valor: busca_binaria_iterativa(lista, valor)) == encontrados
+            linha += f", sorted() a cada inserção {time.perf_counter() - inicio:.3f}s"
+        print(linha)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+import multiprocessing
+import operator
+from array import array
+from multiprocessing import shared_memory, util
+
+try:
+    import numpy
+except ImportError:  # dependência opcional
+    numpy = None
+
+class Matriz:
+    """Matriz densa de floats em um único buffer contíguo (array('d'), por linhas)
+
+    `m[i]` devolve uma memoryview gravável da linha i, então o código que usa
+    listas de listas (len(m), len(m[0]), m[i][j]) funciona sem mudanças;
+    `m[i, j]` acessa um elemento diretamente.
+    """
+    __slots__ = ("linhas", "colunas", "dados")
+
+    def __init__(self, linhas, colunas, dados=None):
+        if dados is None:
+            dados = array("d", bytes(8 * linhas * colunas))
+        elif not isinstance(dados, array) or dados.typecode != "d":
+            dados = array("d", dados)
+        if len(dados) != linhas * colunas:
+            raise ValueError("o buffer não tem linhas × colunas elementos")
+        self.linhas = linhas
+        self.colunas = colunas
+        self.dados = dados
+
+    @classmethod
+    def de_listas(cls, listas):
+        """Converte uma lista de listas - O(n²)"""
+        linhas = len(listas)
+        colunas = len(listas[0]) if linhas else 0
+        dados = array("d")
+        for linha in listas:
+            if len(linha) != colunas:
+                raise ValueError("todas as linhas devem ter o mesmo tamanho")
+            dados.extend(linha)
+        return cls(linhas, colunas, dados)
+
+    @classmethod
+    def identidade(cls, n):
+        """Matriz identidade n×n"""
+        m = cls(n, n)
+        for i in range(n):
+            m.dados[i * n + i] = 1.0
+        return m
+
+    def para_listas(self):
+        """Converte para lista de listas - O(n²)"""
+        c = self.colunas
+        return [self.dados[i * c:(i + 1) * c].tolist() for i in range(self.linhas)]
+
+    def linha(self, i):
+        """Cópia da linha i como tupla (iteração mais rápida que o buffer)"""
+        c = self.colunas
+        return tuple(self.dados[i * c:(i + 1) * c])
+
+    def coluna(self, j):
+        """Cópia da coluna j como tupla"""
+        return tuple(self.dados[j::self.colunas])
+
+    @property
+    def formato(self):
+        return self.linhas, self.colunas
+
+    def __len__(self):
+        return self.linhas
+
+    def _posicao(self, i, j):
+        # Posição de (i, j) no buffer; índices negativos contam do fim, como
+        # em listas de listas, e nada "vaza" para a linha vizinha
+        if not 0 <= i < self.linhas:
+            if not -self.linhas <= i < 0:
+                raise IndexError("linha fora da matriz")
+            i += self.linhas
+        if not 0 <= j < self.colunas:
+            if not -self.colunas <= j < 0:
+                raise IndexError("coluna fora da matriz")
+            j += self.colunas
+        return i * self.colunas + j
+
+    def __getitem__(self, indice):
+        if isinstance(indice, tuple):
+            return self.dados[self._posicao(*indice)]
+        if not 0 <= indice < self.linhas:
+            if -self.linhas <= indice < 0:
+                indice += self.linhas
+            else:
+                raise IndexError("linha fora da matriz")
+        c = self.colunas
+        return memoryview(self.dados)[indice * c:(indice + 1) * c]
+
+    def __setitem__(self, indice, valor):
+        self.dados[self._posicao(*indice)] = valor
+
+    def __iter__(self):
+        for i in range(self.linhas):
+            yield self[i]
+
+    def __eq__(self, outra):
+        if isinstance(outra, Matriz):
+            return self.formato == outra.formato and self.dados == outra.dados
+        return NotImplemented
+
+    def __matmul__(self, outra):
+        if not isinstance(outra, (Matriz, list)):
+            return NotImplemented
+        return multiplicar(self, outra)
+
+    def __repr__(self):
+        return f"Matriz({self.para_listas()!r})"
+
+def _como_matriz(m):
+    return m if isinstance(m, Matriz) else Matriz.de_listas(m)
+
+def _multiplicar_python(A, B, bloco):
+    """Kernel em Python puro, acumulando uma linha do resultado por vez
+
+    B é transposto uma vez em tuplas de colunas, e cada elemento do
+    resultado vira um produto interno sum(map(mul, linha, coluna)), que
+    roda em C sem acessos indexados no laço interno. Com `bloco`, as
+    colunas são processadas em faixas de `bloco` colunas, mantendo o
+    conjunto de trabalho (faixa de colunas de B + linha de A) pequeno.
+    """
+    mul = operator.mul
+    linhas = [A.linha(i) for i in range(A.linhas)]
+    colunas = [B.coluna(j) for j in range(B.colunas)]
+    resultado = Matriz(A.linhas, B.colunas)
+    dados = resultado.dados
+    largura = B.colunas
+    bloco = bloco or largura or 1
+    for j0 in range(0, largura, bloco):
+        faixa = colunas[j0:j0 + bloco]
+        j1 = j0 + len(faixa)
+        for i, linha in enumerate(linhas):
+            # Acumulador local da linha: uma única gravação no buffer por faixa
+            acumulador = [sum(map(mul, linha, coluna)) for coluna in faixa]
+            dados[i * largura + j0:i * largura + j1] = array("d", acumulador)
+    return resultado
+
+def _multiplicar_numpy(A, B):
+    a = numpy.frombuffer(A.dados, dtype=numpy.float64).reshape(A.linhas, A.colunas)
+    b = numpy.frombuffer(B.dados, dtype=numpy.float64).reshape(B.linhas, B.colunas)
+    dados = array("d")
+    dados.frombytes((a @ b).tobytes())
+    return Matriz(A.linhas, B.colunas, dados)
+
+def _visao(segmento, tamanho):
+    """memoryview de `tamanho` doubles (o SO pode arredondar o segmento para cima)"""
+    return segmento.buf[:8 * tamanho].cast("d")
+
+# Estado de cada processo trabalhador do produto paralelo (definido pelo
+# initializer do Pool): segmentos abertos e visões sobre eles (A, B
+# transposto e o resultado); as linhas de A e as colunas de B são fatias
+# dessas visões, sem copiar os operandos
+_trabalhador = None
+
+def _iniciar_trabalhador(nome_a, nome_b, nome_c, linhas, internas, colunas):
+    global _trabalhador
+    segmentos = [shared_memory.SharedMemory(name=nome) for nome in (nome_a, nome_b, nome_c)]
+    tamanhos = (linhas * internas, internas * colunas, linhas * colunas)
+    a, b, c = (_visao(segmento, tamanho) for segmento, tamanho in zip(segmentos, tamanhos))
+    colunas_b = [b[j * internas:(j + 1) * internas] for j in range(colunas)]
+    _trabalhador = (segmentos, [a, b, c], colunas_b, internas, colunas)
+    # Fecha os segmentos quando o processo termina normalmente (pool.close + join)
+    util.Finalize(None, _encerrar_trabalhador, exitpriority=10)
+
+def _encerrar_trabalhador():
+    global _trabalhador
+    segmentos, visoes, colunas_b, _, _ = _trabalhador
+    _trabalhador = None
+    # As visões precisam ser liberadas antes de fechar os segmentos
+    for visao in colunas_b + visoes:
+        visao.release()
+    for segmento in segmentos:
+        segmento.close()
+
+def _multiplicar_faixa(faixa):
+    """Calcula as linhas [i0, i1) do resultado direto no buffer compartilhado"""
+    i0, i1 = faixa
+    _, (a, _, c), colunas_b, internas, colunas = _trabalhador
+    mul = operator.mul
+    for i in range(i0, i1):
+        # Só a linha corrente vira tupla (O(n) por linha); as colunas de B
+        # são lidas direto da memória compartilhada
+        linha = tuple(a[i * internas:(i + 1) * internas])
+        c[i * colunas:(i + 1) * colunas] = array("d", [sum(map(mul, linha, coluna)) for coluna in colunas_b])
+    return faixa
+
+def multiplicar_paralelo(A, B, processos=None, linhas_por_tarefa=None):
+    """Produto A × B dividindo as linhas do resultado entre processos - O(n³ / p)
+
+    A, B e o resultado ficam em segmentos de multiprocessing.shared_memory:
+    os operandos não são serializados por tarefa nem copiados nos
+    processos (B é gravado transposto, então cada coluna é uma fatia
+    contígua do segmento) e cada processo grava suas linhas diretamente no
+    resultado. Retorna uma Matriz.
+    """
+    A = _como_matriz(A)
+    B = _como_matriz(B)
+    if A.colunas != B.linhas:
+        raise ValueError("Dimensões incompatíveis para multiplicação")
+    processos = processos or multiprocessing.cpu_count()
+    linhas_por_tarefa = linhas_por_tarefa or max(1, A.linhas // (processos * 4))
+
+    tamanhos = (len(A.dados), len(B.dados), A.linhas * B.colunas)
+    segmentos = [shared_memory.SharedMemory(create=True, size=max(8 * tamanho, 8)) for tamanho in tamanhos]
+    visoes = [_visao(segmento, tamanho) for segmento, tamanho in zip(segmentos, tamanhos)]
+    try:
+        visoes[0][:] = A.dados
+        # B vai transposto: cada coluna vira um trecho contíguo do segmento
+        visoes[1][:] = array("d", [x for j in range(B.colunas) for x in B.dados[j::B.colunas]])
+        faixas = [(i, min(i + linhas_por_tarefa, A.linhas)) for i in range(0, A.linhas, linhas_por_tarefa)]
+        argumentos = tuple(segmento.name for segmento in segmentos) + (A.linhas, A.colunas, B.colunas)
+        with multiprocessing.Pool(processos, initializer=_iniciar_trabalhador, initargs=argumentos) as pool:
+            for _ in pool.imap_unordered(_multiplicar_faixa, faixas):
+                pass
+            # Encerramento normal (e não terminate) para os trabalhadores fecharem os segmentos
+            pool.close()
+            pool.join()
+        dados = array("d", visoes[2])
+    finally:
+        # As visões precisam ser liberadas antes de fechar os segmentos
+        for visao in visoes:
+            visao.release()
+        for segmento in segmentos:
+            segmento.close()
+            segmento.unlink()
+    return Matriz(A.linhas, B.colunas, dados)
+
+def multiplicar(A, B, backend="auto", bloco=None, processos=None):
+    """Produto A × B como Matriz - O(n³)
+
+    A e B podem ser Matriz ou listas de listas. `backend`: "auto" (NumPy se
+    instalado, senão Python), "numpy", "python" ou "paralelo" (veja
+    multiplicar_paralelo; `processos` define o número de processos).
+    """
+    if backend == "paralelo":
+        return multiplicar_paralelo(A, B, processos)
+    A = _como_matriz(A)
+    B = _como_matriz(B)
+    if A.colunas != B.linhas:
+        raise ValueError("Dimensões incompatíveis para multiplicação")
+    if backend == "numpy" or (backend == "auto" and numpy is not None):
+        if numpy is None:
+            raise ImportError("o backend 'numpy' requer o pacote numpy")
+        return _multiplicar_numpy(A, B)
+    if backend not in ("auto", "python"):
+        raise ValueError(f"backend desconhecido: {backend}")
+    return _multiplicar_python(A, B, bloco)
+
+def multiplicar_listas(A, B):
+    """Produto de listas de listas preservando o tipo dos elementos - O(n³)
+
+    Mesmo kernel de _multiplicar_python (B transposto + produto interno em C),
+    sem conversão para float. Linhas de tamanhos diferentes (que o zip
+    truncaria em silêncio) geram ValueError.
+    """
+    for matriz in (A, B):
+        if matriz and any(len(linha) != len(matriz[0]) for linha in matriz):
+            raise ValueError("todas as linhas devem ter o mesmo tamanho")
+    if A and len(A[0]) != len(B):
+        raise ValueError("Dimensões incompatíveis para multiplicação")
+    mul = operator.mul
+    colunas = list(zip(*B))
+    return [[sum(map(mul, linha, coluna)) for coluna in colunas] for linha in A]
+
+def main():
+    import random
+    import algoritmos
+    from benchmark import medir, formatar_ns
+
+    print("=== MATRIZ DENSA EM BUFFER CONTÍGUO ===\n")
+    A = Matriz.de_listas([[1, 2], [3, 4]])
+    B = Matriz.de_listas([[5, 6], [7, 8]])
+    print(f"A @ B = {A @ B}")
+    print(f"Backend NumPy disponível: {numpy is not None}\n")
+
+    gerador = random.Random(42)
+    for n in (64, 128, 256):
+        listas = [[gerador.random() for _ in range(n)] for _ in range(n)]
+        m = Matriz.de_listas(listas)
+        ingenuo = medir(algoritmos.multiplicar_matrizes, listas, listas, amostras=3)
+        otimizado = medir(multiplicar, m, m, "python", amostras=3)
+        linha = f"n={n}: ingênuo {formatar_ns(ingenuo.mediana)}, Matriz {formatar_ns(otimizado.mediana)}"
+        linha += f" ({ingenuo.mediana / otimizado.mediana:.1f}x)"
+        if numpy is not None:
+            vetorizado = medir(multiplicar, m, m, "numpy")
+            linha += f", NumPy {formatar_ns(vetorizado.mediana)}"
+        print(linha)
+
+    print("\nEscalonamento do produto paralelo (n=256):")
+    listas = [[gerador.random() for _ in range(256)] for _ in range(256)]
+    m = Matriz.de_listas(listas)
+    serial = medir(multiplicar, m, m, "python", amostras=3)
+    print(f"  serial:        {formatar_ns(serial.mediana)}")
+    for processos in sorted({1, 2, 4, multiprocessing.cpu_count()}):
+        paralelo = medir(multiplicar_paralelo, m, m, processos, amostras=3)
+        print(f"  {processos:2d} processo(s): {formatar_ns(paralelo.mediana)} ({serial.mediana / paralelo.mediana:.2f}x)")
+
+if __name__ == "__main__":
+    main()
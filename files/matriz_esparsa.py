@@ -0,0 +1,230 @@
+from array import array
+
+class MatrizEsparsa:
+    """Matriz esparsa em formato CSR (compressed sparse row)
+
+    Guarda só os elementos não nulos: `valores[p]` está na coluna
+    `indices[p]`, e os não nulos da linha i ocupam as posições
+    inicio_linha[i] <= p < inicio_linha[i + 1]. Os valores ficam em uma
+    lista para preservar o tipo (int/float) na conversão de volta.
+    """
+    __slots__ = ("linhas", "colunas", "inicio_linha", "indices", "valores")
+
+    def __init__(self, linhas, colunas, inicio_linha, indices, valores):
+        if len(inicio_linha) != linhas + 1 or len(indices) != len(valores):
+            raise ValueError("estrutura CSR inconsistente")
+        self.linhas = linhas
+        self.colunas = colunas
+        self.inicio_linha = inicio_linha
+        self.indices = indices
+        self.valores = valores
+
+    @classmethod
+    def de_listas(cls, listas):
+        """Converte uma lista de listas (ou Matriz) - O(n²)"""
+        linhas = len(listas)
+        colunas = len(listas[0]) if linhas else 0
+        inicio_linha = array("q", [0])
+        indices = array("q")
+        valores = []
+        for linha in listas:
+            for j, valor in enumerate(linha):
+                if valor:
+                    indices.append(j)
+                    valores.append(valor)
+            inicio_linha.append(len(valores))
+        return cls(linhas, colunas, inicio_linha, indices, valores)
+
+    @classmethod
+    def de_coo(cls, linhas, colunas, triplas):
+        """Constrói a partir de triplas (i, j, valor) em formato COO - O(nnz log nnz)
+
+        Triplas repetidas para a mesma posição são somadas; zeros são descartados.
+        """
+        acumulado = {}
+        for i, j, valor in triplas:
+            if not (0 <= i < linhas and 0 <= j < colunas):
+                raise IndexError(f"posição ({i}, {j}) fora da matriz")
+            acumulado[i, j] = acumulado.get((i, j), 0) + valor
+        inicio_linha = array("q", bytes(8 * (linhas + 1)))
+        indices = array("q")
+        valores = []
+        for (i, j), valor in sorted(acumulado.items()):
+            if valor:
+                inicio_linha[i + 1] += 1
+                indices.append(j)
+                valores.append(valor)
+        for i in range(linhas):
+            inicio_linha[i + 1] += inicio_linha[i]
+        return cls(linhas, colunas, inicio_linha, indices, valores)
+
+    def para_listas(self):
+        """Converte para lista de listas (zeros explícitos) - O(n² + nnz)"""
+        resultado = [[0] * self.colunas for _ in range(self.linhas)]
+        for i, j, valor in self.nao_nulos():
+            resultado[i][j] = valor
+        return resultado
+
+    def para_coo(self):
+        """Lista de triplas (i, j, valor) - O(nnz)"""
+        return list(self.nao_nulos())
+
+    def nao_nulos(self):
+        """Percorre só os elementos não nulos, linha a linha - O(n + nnz)"""
+        inicio_linha, indices, valores = self.inicio_linha, self.indices, self.valores
+        for i in range(self.linhas):
+            for p in range(inicio_linha[i], inicio_linha[i + 1]):
+                yield i, indices[p], valores[p]
+
+    def percorrer(self):
+        """Valores não nulos em ordem de linha (equivalente esparso de percorrer_matriz)"""
+        return list(self.valores)
+
+    @property
+    def nnz(self):
+        return len(self.valores)
+
+    @property
+    def densidade(self):
+        total = self.linhas * self.colunas
+        return self.nnz / total if total else 0.0
+
+    @property
+    def formato(self):
+        return self.linhas, self.colunas
+
+    def transposta(self):
+        """Transposta em CSR por contagem de colunas - O(linhas + colunas + nnz)
+
+        Conta os não nulos de cada coluna, acumula as contagens nos inícios
+        das linhas da transposta e distribui cada elemento na sua posição.
+        Como as linhas são percorridas em ordem, cada linha da transposta
+        já sai ordenada por coluna, sem sort.
+        """
+        inicio_linha = array("q", bytes(8 * (self.colunas + 1)))
+        for j in self.indices:
+            inicio_linha[j + 1] += 1
+        for j in range(self.colunas):
+            inicio_linha[j + 1] += inicio_linha[j]
+        proxima = array("q", inicio_linha[:-1])
+        indices = array("q", bytes(8 * self.nnz))
+        valores = [0] * self.nnz
+        for i, j, valor in self.nao_nulos():
+            p = proxima[j]
+            indices[p] = i
+            valores[p] = valor
+            proxima[j] = p + 1
+        return MatrizEsparsa(self.colunas, self.linhas, inicio_linha, indices, valores)
+
+    def multiplicar_densa(self, B):
+        """Esparsa × densa (lista de listas ou Matriz) - O(nnz · colunas de B)
+
+        Cada não nulo A[i][k] soma A[i][k] · B[k] à linha i do resultado.
+        """
+        if self.colunas != len(B):
+            raise ValueError("Dimensões incompatíveis para multiplicação")
+        colunas_b = len(B[0]) if len(B) else 0
+        inicio_linha, indices, valores = self.inicio_linha, self.indices, self.valores
+        resultado = []
+        for i in range(self.linhas):
+            acumulador = [0] * colunas_b
+            for p in range(inicio_linha[i], inicio_linha[i + 1]):
+                a = valores[p]
+                linha_b = B[indices[p]]
+                acumulador = [x + a * y for x, y in zip(acumulador, linha_b)]
+            resultado.append(acumulador)
+        return resultado
+
+    def multiplicar_esparsa(self, B):
+        """Esparsa × esparsa pelo algoritmo de Gustavson - O(operações não nulas)
+
+        Para cada linha i, combina as linhas de B indicadas pelos não nulos
+        de A[i] em um acumulador esparso (dicionário coluna -> valor).
+        """
+        if self.colunas != B.linhas:
+            raise ValueError("Dimensões incompatíveis para multiplicação")
+        inicio_linha = array("q", [0])
+        indices = array("q")
+        valores = []
+        for i in range(self.linhas):
+            acumulador = {}
+            for p in range(self.inicio_linha[i], self.inicio_linha[i + 1]):
+                a = self.valores[p]
+                k = self.indices[p]
+                for q in range(B.inicio_linha[k], B.inicio_linha[k + 1]):
+                    j = B.indices[q]
+                    acumulador[j] = acumulador.get(j, 0) + a * B.valores[q]
+            for j in sorted(acumulador):
+                if acumulador[j]:
+                    indices.append(j)
+                    valores.append(acumulador[j])
+            inicio_linha.append(len(valores))
+        return MatrizEsparsa(self.linhas, B.colunas, inicio_linha, indices, valores)
+
+    def __matmul__(self, outra):
+        if isinstance(outra, MatrizEsparsa):
+            return self.multiplicar_esparsa(outra)
+        return self.multiplicar_densa(outra)
+
+    def __rmatmul__(self, outra):
+        return densa_vezes_esparsa(outra, self)
+
+    def __eq__(self, outra):
+        if isinstance(outra, MatrizEsparsa):
+            return self.formato == outra.formato and self.para_coo() == outra.para_coo()
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MatrizEsparsa({self.linhas}x{self.colunas}, nnz={self.nnz})"
+
+def densa_vezes_esparsa(A, B):
+    """Densa (lista de listas ou Matriz) × esparsa - O(n · nnz(B))
+
+    Cada elemento não nulo A[i][k] soma A[i][k] · B[k] (linha esparsa) à
+    linha i do resultado, que é devolvido como lista de listas.
+    """
+    if len(A) and len(A[0]) != B.linhas:
+        raise ValueError("Dimensões incompatíveis para multiplicação")
+    resultado = []
+    for linha_a in A:
+        acumulador = [0] * B.colunas
+        for k, a in enumerate(linha_a):
+            if a:
+                for q in range(B.inicio_linha[k], B.inicio_linha[k + 1]):
+                    acumulador[B.indices[q]] += a * B.valores[q]
+        resultado.append(acumulador)
+    return resultado
+
+def matriz_aleatoria_esparsa(n, densidade, seed=42):
+    """Lista de listas n×n com a fração `densidade` de elementos não nulos"""
+    import random
+
+    gerador = random.Random(seed)
+    return [[gerador.random() if gerador.random() < densidade else 0 for _ in range(n)] for _ in range(n)]
+
+def main():
+    from benchmark import medir, formatar_ns
+    from estruturas_avancadas import multiplicar_matrizes_otimizada, percorrer_matriz
+
+    print("=== MATRIZ ESPARSA (CSR) ===\n")
+    A = MatrizEsparsa.de_listas([[0, 0, 3], [4, 0, 0], [0, 0, 0]])
+    print(f"{A}: não nulos {A.para_coo()}")
+    print(f"A × A = {(A @ A).para_listas()}\n")
+
+    n = 200
+    print(f"Comparação densa × esparsa (n={n}):")
+    for densidade in (0.01, 0.05, 0.2, 0.5):
+        listas = matriz_aleatoria_esparsa(n, densidade)
+        esparsa = MatrizEsparsa.de_listas(listas)
+        percorrer_densa = medir(percorrer_matriz, listas)
+        percorrer_esparsa = medir(lambda: sum(1 for _ in esparsa.nao_nulos()))
+        densa = medir(multiplicar_matrizes_otimizada, listas, listas, amostras=3)
+        esparsa_densa = medir(esparsa.multiplicar_densa, listas, amostras=3)
+        esparsa_esparsa = medir(esparsa.multiplicar_esparsa, esparsa, amostras=3)
+        print(f"  densidade {densidade:.0%} (nnz={esparsa.nnz}):")
+        print(f"    percorrer: densa {formatar_ns(percorrer_densa.mediana)}, esparsa {formatar_ns(percorrer_esparsa.mediana)}")
+        print(f"    produto:   densa {formatar_ns(densa.mediana)}, esparsa×densa {formatar_ns(esparsa_densa.mediana)}, "
+              f"esparsa×esparsa {formatar_ns(esparsa_esparsa.mediana)}")
+
+if __name__ == "__main__":
+    main()
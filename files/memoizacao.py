@@ -0,0 +1,149 @@
+import functools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+class CacheLRU:
+    """Cache LRU limitado, thread-safe e instrumentado
+
+    As operações no dicionário são feitas sob um lock; a função memoizada é
+    executada fora dele, então duas threads podem calcular a mesma chave ao
+    mesmo tempo (o último resultado gravado prevalece).
+
+    Com `peso` (função valor -> número, ex. bytes) e `peso_maximo`, o
+    limite passa a valer também para a soma dos pesos guardados: as menos
+    recentes saem até a soma caber. Um valor sozinho mais pesado que o
+    limite não é guardado (e não tira nenhum outro do cache).
+    """
+    def __init__(self, maximo=128, peso=None, peso_maximo=None):
+        if maximo is not None and maximo <= 0:
+            raise ValueError("maximo deve ser positivo (ou None para ilimitado)")
+        if (peso is None) != (peso_maximo is None):
+            raise ValueError("peso e peso_maximo devem ser informados juntos")
+        if peso_maximo is not None and peso_maximo <= 0:
+            raise ValueError("peso_maximo deve ser positivo")
+        self.maximo = maximo
+        self.peso = peso
+        self.peso_maximo = peso_maximo
+        self.peso_total = 0
+        self._pesos = {}
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def obter(self, chave, ausente):
+        """Valor da chave (marcada como recente) ou `ausente` - O(1)"""
+        with self._lock:
+            try:
+                valor = self._dados[chave]
+            except KeyError:
+                self.falhas += 1
+                return ausente
+            self._dados.move_to_end(chave)
+            self.acertos += 1
+            return valor
+
+    def guardar(self, chave, valor):
+        """Grava a chave, removendo a menos recente se exceder o limite - O(1)"""
+        peso = self.peso(valor) if self.peso is not None else 0
+        with self._lock:
+            if peso > (self.peso_maximo or 0):
+                return
+            self._dados[chave] = valor
+            self._dados.move_to_end(chave)
+            if self.maximo is not None and len(self._dados) > self.maximo:
+                self._remover_mais_antiga()
+            if self.peso is not None:
+                self.peso_total += peso - self._pesos.get(chave, 0)
+                self._pesos[chave] = peso
+                while self.peso_total > self.peso_maximo:
+                    self._remover_mais_antiga()
+
+    def _remover_mais_antiga(self):
+        chave, _ = self._dados.popitem(last=False)
+        self.peso_total -= self._pesos.pop(chave, 0)
+        self.remocoes += 1
+
+    def limpar(self, zerar_contadores=False):
+        """Esvazia o cache (e opcionalmente os contadores)"""
+        with self._lock:
+            self._dados.clear()
+            self._pesos.clear()
+            self.peso_total = 0
+            if zerar_contadores:
+                self.acertos = self.falhas = self.remocoes = 0
+
+    def chaves(self):
+        """Cópia das chaves, da menos para a mais recente (não altera a ordem LRU)"""
+        with self._lock:
+            return list(self._dados)
+
+    def __len__(self):
+        return len(self._dados)
+
+    def __contains__(self, chave):
+        return chave in self._dados
+
+    def estatisticas(self):
+        """Contadores atuais em um dicionário"""
+        with self._lock:
+            total = self.acertos + self.falhas
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "remocoes": self.remocoes,
+                "tamanho": len(self._dados),
+                "maximo": self.maximo,
+                "peso_total": self.peso_total,
+                "peso_maximo": self.peso_maximo,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+            }
+
+    @contextmanager
+    def escopo(self):
+        """Bloco com cache vazio na entrada e na saída (execuções "frias")"""
+        self.limpar()
+        try:
+            yield self
+        finally:
+            self.limpar()
+
+_AUSENTE = object()
+
+def memoizar(maximo=128):
+    """Decorador de memoização com cache LRU limitado
+
+    A função decorada ganha os atributos:
+        cache            - a instância de CacheLRU
+        limpar_cache()   - esvazia o cache
+        frio(*args)      - chama com o cache vazio (medição sem acertos)
+
+    Os argumentos precisam ser hasheáveis. Funções recursivas devem chamar
+    a si mesmas pelo nome global para que as chamadas internas também usem
+    o cache. Cada nível de recursão passa pelo envoltório, então ocupa dois
+    frames: com o limite padrão (sys.getrecursionlimit() = 1000), uma cadeia
+    fria de recursão chega a ~490 níveis antes do RecursionError.
+    """
+    def decorador(func):
+        cache = CacheLRU(maximo)
+
+        @functools.wraps(func)
+        def envoltorio(*args, **kwargs):
+            chave = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            valor = cache.obter(chave, _AUSENTE)
+            if valor is _AUSENTE:
+                valor = func(*args, **kwargs)
+                cache.guardar(chave, valor)
+            return valor
+
+        def frio(*args, **kwargs):
+            cache.limpar()
+            return envoltorio(*args, **kwargs)
+
+        envoltorio.cache = cache
+        envoltorio.limpar_cache = cache.limpar
+        envoltorio.frio = frio
+        return envoltorio
+    return decorador
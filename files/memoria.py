@@ -0,0 +1,223 @@
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+
+from benchmark import salvar_json
+from complexidade import EstimativaComplexidade, ORDEM, ajustar_modelo, tamanhos_geometricos
+
+# Intervalo entre amostras do RSS (segundos) durante a chamada medida
+INTERVALO_RSS = 0.001
+
+# Para a varredura de tamanhos quando o pico passa disto (evita OOM)
+LIMITE_PADRAO_BYTES = 512 * 2**20
+
+class EstatisticasMemoria:
+    """Resultado de medir_memoria (bytes alocados por uma chamada)
+
+    pico: maior memória alocada (tracemalloc) acima do início da chamada
+    retido: memória que continua alocada depois dela (resultado, caches)
+    blocos: blocos de memória retidos (número de alocações vivas no fim)
+    rss_pico: maior crescimento do RSS do processo observado na amostragem
+    """
+    def __init__(self, nome, n, pico, retido, blocos, rss_pico=None):
+        self.nome = nome
+        self.n = n
+        self.pico = pico
+        self.retido = retido
+        self.blocos = blocos
+        self.rss_pico = rss_pico
+
+    @property
+    def bytes_por_elemento(self):
+        return self.pico / self.n if self.n else None
+
+    def como_dict(self):
+        """Representação serializável em JSON"""
+        return {
+            "n": self.n,
+            "pico_bytes": self.pico,
+            "retido_bytes": self.retido,
+            "blocos": self.blocos,
+            "bytes_por_elemento": self.bytes_por_elemento,
+            "rss_pico_bytes": self.rss_pico,
+        }
+
+    def __repr__(self):
+        texto = f"{self.nome}: pico {formatar_bytes(self.pico)}, retido {formatar_bytes(self.retido)}, {self.blocos} blocos"
+        if self.n:
+            texto += f", {self.bytes_por_elemento:.1f} B/elemento"
+        if self.rss_pico is not None:
+            texto += f", RSS +{formatar_bytes(self.rss_pico)}"
+        return texto
+
+def formatar_bytes(quantidade):
+    """Formata uma quantidade de bytes na unidade mais legível"""
+    for unidade, escala in (("GiB", 2**30), ("MiB", 2**20), ("KiB", 2**10)):
+        if abs(quantidade) >= escala:
+            return f"{quantidade / escala:.2f}{unidade}"
+    return f"{quantidade}B"
+
+def rss_atual():
+    """Memória residente do processo em bytes, ou None se não disponível
+
+    Lê /proc/self/statm (Linux). Em outros sistemas só existe o pico
+    (resource.getrusage), que não serve para medir uma chamada isolada.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as arquivo:
+            paginas = int(arquivo.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return paginas * os.sysconf("SC_PAGE_SIZE")
+
+class _AmostradorRSS(threading.Thread):
+    """Thread que amostra o RSS até ser parada e guarda o maior valor"""
+    def __init__(self, intervalo):
+        super().__init__(daemon=True)
+        self.intervalo = intervalo
+        self.maximo = rss_atual()
+        self._parar = threading.Event()
+
+    def run(self):
+        while not self._parar.wait(self.intervalo):
+            self.maximo = max(self.maximo, rss_atual())
+
+    def parar(self):
+        self._parar.set()
+        self.join()
+        self.maximo = max(self.maximo, rss_atual())
+        return self.maximo
+
+def medir_memoria(func, *args, nome=None, n=None, aquecimento=1, rss=True, intervalo=INTERVALO_RSS):
+    """Mede a memória alocada por uma chamada func(*args)
+
+    O pico e a memória retida vêm do tracemalloc (só alocações feitas
+    durante a chamada: a entrada, já criada, não conta); os blocos retidos
+    vêm de um snapshot. Com `rss`, uma chamada extra (sem tracemalloc) é
+    feita enquanto uma thread amostra o RSS do processo a cada `intervalo`
+    segundos. `n` é o tamanho da entrada, para o cálculo
+    de bytes por elemento. O aquecimento evita contar alocações únicas
+    (imports tardios, caches de módulo); funções memoizadas devem ser
+    medidas pela versão .frio.
+    """
+    nome = nome or getattr(func, "__name__", repr(func))
+    for _ in range(aquecimento):
+        func(*args)
+
+    rss_pico = None
+    if rss and rss_atual() is not None:
+        # Chamada separada: o tracemalloc infla o RSS e a thread de
+        # amostragem apareceria nas alocações rastreadas
+        gc.collect()
+        amostrador = _AmostradorRSS(intervalo)
+        rss_inicial = amostrador.maximo
+        amostrador.start()
+        try:
+            func(*args)
+        finally:
+            rss_pico = amostrador.parar() - rss_inicial
+
+    gc.collect()
+    ja_ativo = tracemalloc.is_tracing()
+    if not ja_ativo:
+        tracemalloc.start()
+    try:
+        blocos_antes = len(tracemalloc.take_snapshot().traces)
+        inicio, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        resultado = func(*args)
+        atual, pico = tracemalloc.get_traced_memory()
+        blocos = len(tracemalloc.take_snapshot().traces) - blocos_antes
+        del resultado
+    finally:
+        if not ja_ativo:
+            tracemalloc.stop()
+    return EstatisticasMemoria(nome, n, pico - inicio, atual - inicio, max(blocos, 0), rss_pico)
+
+def estimar_espaco(func, gerador, n_min=16, n_max=4096, fator=2, tamanhos=None,
+                   limite_bytes=LIMITE_PADRAO_BYTES, nome=None, rss=False):
+    """Mede o pico de memória em tamanhos geométricos e ajusta as classes
+
+    Como complexidade.estimar_complexidade, mas sobre bytes: retorna
+    (EstimativaComplexidade, [EstatisticasMemoria]). A varredura para
+    quando o pico de um tamanho ultrapassa `limite_bytes`.
+    """
+    nome = nome or getattr(func, "__name__", repr(func))
+    tamanhos = tamanhos or tamanhos_geometricos(n_min, n_max, fator)
+
+    medicoes = []
+    for n in tamanhos:
+        args = gerador(n)
+        if not isinstance(args, tuple):
+            args = (args,)
+        medicao = medir_memoria(func, *args, nome=f"{nome}[{n}]", n=n, aquecimento=0, rss=rss)
+        medicoes.append(medicao)
+        if medicao.pico > limite_bytes:
+            break
+
+    if len(medicoes) < 3:
+        raise ValueError("São necessários pelo menos 3 tamanhos medidos para o ajuste")
+
+    medidos = [m.n for m in medicoes]
+    # Um pico nulo (nada alocado) vira 1 byte para o ajuste por erro relativo
+    picos = [max(m.pico, 1) for m in medicoes]
+    ajustes = [ajuste for modelo in ORDEM
+               if (ajuste := ajustar_modelo(modelo, medidos, picos, unidade="B")) is not None]
+    return EstimativaComplexidade(nome, medidos, picos, ajustes), medicoes
+
+def casos_padrao():
+    """(func, gerador, esperado, opções) com os algoritmos que mais alocam"""
+    import algoritmos
+    import estruturas_avancadas as ea
+    import hanoi
+    from complexidade import lista_aleatoria
+    from permutacoes import permutacoes_lazy
+
+    return [
+        (algoritmos.permutacoes, lambda n: list(range(n)), "O(n!)", {"tamanhos": list(range(3, 10))}),
+        (lambda lista: sum(1 for _ in permutacoes_lazy(lista)), lambda n: list(range(n)), "O(n)",
+         {"tamanhos": list(range(3, 10)), "nome": "permutacoes_lazy"}),
+        (ea.gerar_subconjuntos, lambda n: list(range(n)), "O(2^n)", {"tamanhos": list(range(6, 17))}),
+        (ea.torre_hanoi, lambda n: n, "O(1)", {"tamanhos": list(range(8, 25, 2))}),
+        (lambda n: list(ea.torre_hanoi(n)), lambda n: n, "O(2^n)",
+         {"tamanhos": list(range(8, 17)), "nome": "list(torre_hanoi)"}),
+        (hanoi.movimentos_compactos, lambda n: n, "O(2^n)", {"tamanhos": list(range(10, 25, 2))}),
+        (ea.merge_sort, lista_aleatoria, "O(n)", {"n_max": 1 << 16}),
+        (algoritmos.fibonacci_recursivo_memoizado.frio, lambda n: n, "O(n)",
+         {"tamanhos": [25, 50, 100, 200, 400], "nome": "fibonacci_recursivo_memoizado (cache)"}),
+    ]
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Perfil de memória (pico, retido, blocos, RSS) por algoritmo e tamanho")
+    parser.add_argument("--saida", help="grava as medições em JSON neste caminho")
+    parser.add_argument("--filtro", help="mede apenas casos cujo nome contém este texto")
+    parser.add_argument("--rss", action="store_true", help="amostra também o RSS do processo")
+    opcoes = parser.parse_args(argv)
+
+    print("=== PERFIL DE ESPAÇO ===\n")
+    todas = []
+    falhas = 0
+    for func, gerador, esperado, extras in casos_padrao():
+        nome = extras.get("nome") or func.__name__
+        if opcoes.filtro and opcoes.filtro not in nome:
+            continue
+        estimativa, medicoes = estimar_espaco(func, gerador, rss=opcoes.rss, **extras)
+        todas.extend(medicoes)
+        ok = ORDEM.index(estimativa.melhor.modelo) <= ORDEM.index(esperado)
+        falhas += not ok
+        print(f"{nome}: esperado {esperado}, estimado {estimativa.melhor.modelo} [{'OK' if ok else 'PIOR QUE O ESPERADO'}]")
+        for medicao in (medicoes[0], medicoes[-1]):
+            print(f"    {medicao}")
+        print(f"    {estimativa.melhor}")
+
+    if opcoes.saida:
+        salvar_json(todas, opcoes.saida)
+        print(f"\nMedições gravadas em {opcoes.saida}")
+    return 1 if falhas else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
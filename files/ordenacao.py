@@ -0,0 +1,301 @@
+import heapq
+import multiprocessing
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import repeat
+
+# Limiares do despacho automático de ordenar_automatico, medidos no CPython
+# 3.11: a contagem ganha do Timsort a partir de alguns milhares de elementos
+# quando o intervalo de valores é pequeno em relação a n: em k = n/10 leva
+# ~0,6–0,7x o tempo do Timsort (empata com n = 4096), empata perto de
+# k = n/5 e perde a partir de k ~ n/2. O radix LSD em Python puro
+# não ganhou do Timsort em nenhum tamanho medido, então só é usado quando
+# pedido explicitamente.
+MINIMO_CONTAGEM = 4096
+RAZAO_INTERVALO_CONTAGEM = 0.1
+AMOSTRA_INTERVALO = 64
+BITS_RADIX = 8
+
+# Abaixo deste tamanho os trechos são ordenados por inserção binária. Com
+# 10^4–10^5 inteiros, 64 fica ~5% abaixo de 32 e de 16; acima disso o
+# deslocamento O(k²) passa a pesar e o ganho some
+CORTE_INSERCAO = 64
+
+def _insercao(lista, inicio, fim):
+    """Ordena lista[inicio:fim] no lugar por inserção binária (estável) - O(k²) movimentos
+
+    A posição vem de bisect_right (busca em C, o lado direito mantém a
+    estabilidade) e o deslocamento é uma atribuição de fatia; elementos já
+    em ordem em relação ao anterior não fazem busca nenhuma.
+    """
+    for i in range(inicio + 1, fim):
+        valor = lista[i]
+        if lista[i - 1] <= valor:
+            continue
+        posicao = bisect_right(lista, valor, inicio, i)
+        lista[posicao + 1:i + 1] = lista[posicao:i]
+        lista[posicao] = valor
+
+def _intercalar(origem, destino, inicio, meio, fim):
+    """Intercala origem[inicio:meio] e origem[meio:fim] em destino[inicio:fim]
+
+    Estável: em caso de empate o elemento da esquerda vem primeiro (<=),
+    como em estruturas_avancadas.merge. Quando as metades já estão em ordem,
+    copia o trecho inteiro de uma vez.
+    """
+    if origem[meio - 1] <= origem[meio]:
+        destino[inicio:fim] = origem[inicio:fim]
+        return
+    i, j, k = inicio, meio, inicio
+    while i < meio and j < fim:
+        a = origem[i]
+        b = origem[j]
+        if a <= b:
+            destino[k] = a
+            i += 1
+        else:
+            destino[k] = b
+            j += 1
+        k += 1
+    if i < meio:
+        destino[k:fim] = origem[i:meio]
+    else:
+        destino[k:fim] = origem[j:fim]
+
+def merge_sort_buffer(lista, corte=CORTE_INSERCAO):
+    """Merge sort de cima para baixo com um único buffer auxiliar - O(n log n)
+
+    Retorna uma nova lista ordenada (a entrada não é alterada). Em vez de
+    fatiar a lista a cada nível, os papéis de lista e buffer se alternam
+    entre os níveis da recursão (ping-pong), então só há duas listas de
+    tamanho n no total. A profundidade da recursão é log2(n / corte).
+    """
+    dados = list(lista)
+    if len(dados) <= corte:
+        _insercao(dados, 0, len(dados))
+        return dados
+    auxiliar = dados[:]
+
+    def ordenar(origem, destino, inicio, fim):
+        # Ordena origem[inicio:fim] deixando o resultado em destino
+        if fim - inicio <= corte:
+            _insercao(destino, inicio, fim)
+            return
+        meio = (inicio + fim) // 2
+        ordenar(destino, origem, inicio, meio)
+        ordenar(destino, origem, meio, fim)
+        _intercalar(origem, destino, inicio, meio, fim)
+
+    ordenar(auxiliar, dados, 0, len(dados))
+    return dados
+
+def merge_sort_iterativo(lista, corte=CORTE_INSERCAO):
+    """Merge sort de baixo para cima (sem recursão) com buffer único - O(n log n)
+
+    Primeiro ordena trechos de `corte` elementos por inserção, depois
+    intercala trechos de largura 1·corte, 2·corte, 4·corte... alternando
+    lista e buffer a cada passada.
+    """
+    origem = list(lista)
+    n = len(origem)
+    corte = max(1, corte)
+    for inicio in range(0, n, corte):
+        _insercao(origem, inicio, min(inicio + corte, n))
+    destino = origem[:]
+    largura = corte
+    while largura < n:
+        for inicio in range(0, n, 2 * largura):
+            meio = min(inicio + largura, n)
+            fim = min(inicio + 2 * largura, n)
+            if meio < fim:
+                _intercalar(origem, destino, inicio, meio, fim)
+            else:
+                destino[inicio:fim] = origem[inicio:fim]
+        origem, destino = destino, origem
+        largura *= 2
+    return origem
+
+def intercalar(*iteraveis, chave=None):
+    """Intercala qualquer número de iteráveis já ordenados, sob demanda - O(total · log k)
+
+    Aceita listas, geradores, leitores de arquivo etc. e só mantém em
+    memória o elemento corrente de cada fonte (O(k)). Estável: em caso de
+    empate sai primeiro o elemento da fonte de menor índice, o mesmo
+    critério (<=) de estruturas_avancadas.merge. `chave` funciona como em
+    sorted().
+    """
+    heap = []
+    for indice, iteravel in enumerate(iteraveis):
+        iterador = iter(iteravel)
+        for valor in iterador:
+            # O índice da fonte desempata sem nunca comparar os valores em si
+            heap.append((valor if chave is None else chave(valor), indice, valor, iterador))
+            break
+    heapq.heapify(heap)
+
+    while len(heap) > 1:
+        _, indice, valor, iterador = heap[0]
+        yield valor
+        for valor in iterador:
+            heapq.heapreplace(heap, (valor if chave is None else chave(valor), indice, valor, iterador))
+            break
+        else:
+            heapq.heappop(heap)
+
+    if heap:
+        # Resta uma única fonte: repassa o restante sem tocar no heap
+        _, _, valor, iterador = heap[0]
+        yield valor
+        yield from iterador
+
+def _expandir_contagens(contagens, minimo, maximo):
+    resultado = []
+    for valor in range(minimo, maximo + 1):
+        quantidade = contagens.get(valor)
+        if quantidade:
+            resultado.extend(repeat(valor, quantidade))
+    return resultado
+
+def ordenar_contagem(dados, minimo=None, maximo=None):
+    """Counting sort para inteiros - O(n + k), k = maximo - minimo + 1
+
+    A contagem usa collections.Counter (laço em C); a saída percorre o
+    intervalo de valores uma vez, repetindo cada valor pelo seu número de
+    ocorrências.
+    """
+    if not dados:
+        return []
+    contagens = Counter(dados)
+    minimo = min(contagens) if minimo is None else minimo
+    maximo = max(contagens) if maximo is None else maximo
+    return _expandir_contagens(contagens, minimo, maximo)
+
+def ordenar_radix(dados, minimo=None, maximo=None, bits=BITS_RADIX):
+    """Radix sort LSD para inteiros com buffers array('Q') - O(n · log(k) / bits)
+
+    Os valores são deslocados por `minimo` (aceita negativos) e distribuídos
+    em 2^bits baldes por passada, do dígito menos significativo ao mais
+    significativo. Estável em cada passada. Requer maximo - minimo < 2^64.
+    """
+    if not dados:
+        return []
+    minimo = min(dados) if minimo is None else minimo
+    maximo = max(dados) if maximo is None else maximo
+    if maximo - minimo >= 1 << 64:
+        raise ValueError("intervalo de valores grande demais para o radix de 64 bits")
+    buffer = array("Q", [valor - minimo for valor in dados])
+    mascara = (1 << bits) - 1
+    deslocamento = 0
+    while (maximo - minimo) >> deslocamento:
+        baldes = [array("Q") for _ in range(1 << bits)]
+        for valor in buffer:
+            baldes[(valor >> deslocamento) & mascara].append(valor)
+        buffer = array("Q")
+        for balde in baldes:
+            buffer.extend(balde)
+        deslocamento += bits
+    return [valor + minimo for valor in buffer]
+
+def escolher_metodo(dados):
+    """Escolhe o método de ordenação para `dados` e devolve (método, contagens)
+
+    O método é "contagem" para inteiros com intervalo pequeno em relação a
+    n, e "timsort" nos demais casos. `contagens` é o Counter já calculado
+    quando a contagem é escolhida (None caso contrário), para não contar
+    duas vezes.
+    """
+    n = len(dados)
+    if n < MINIMO_CONTAGEM:
+        return "timsort", None
+    limite = n * RAZAO_INTERVALO_CONTAGEM
+    # Uma amostra descarta cedo (sem percorrer tudo) os casos comuns: o
+    # intervalo dela é um limite inferior do intervalo total
+    amostra = dados[:AMOSTRA_INTERVALO]
+    if not all(type(valor) is int for valor in amostra) or max(amostra) - min(amostra) + 1 > limite:
+        return "timsort", None
+    # A verificação completa de tipo também evita que 1, 1.0 e True caiam
+    # na mesma chave do Counter (set/map percorrem a lista em C)
+    if set(map(type, dados)) != {int}:
+        return "timsort", None
+    contagens = Counter(dados)
+    if max(contagens) - min(contagens) + 1 > limite:
+        return "timsort", None
+    return "contagem", contagens
+
+def ordenar_automatico(dados, metodo=None):
+    """Ordena escolhendo o método pelo tipo e intervalo dos dados
+
+    Retorna (lista ordenada, método usado), como bubble_sort retorna
+    (lista, comparações). `metodo` força "contagem", "radix" ou "timsort".
+    """
+    dados = list(dados)
+    if metodo is None:
+        metodo, contagens = escolher_metodo(dados)
+        if contagens is not None:
+            return _expandir_contagens(contagens, min(contagens), max(contagens)), metodo
+    if metodo == "contagem":
+        return ordenar_contagem(dados), metodo
+    if metodo == "radix":
+        return ordenar_radix(dados), metodo
+    if metodo == "timsort":
+        return sorted(dados), metodo
+    raise ValueError(f"método de ordenação desconhecido: {metodo}")
+
+def _ordenar_bloco(bloco):
+    return merge_sort_iterativo(bloco)
+
+def merge_sort_paralelo(lista, processos=None, minimo_por_processo=50_000):
+    """Ordena blocos em um pool de processos e intercala os resultados - O(n log n)
+
+    Listas pequenas (menos de `minimo_por_processo` elementos por processo)
+    são ordenadas no próprio processo, onde o custo de serialização não
+    compensa.
+    """
+    dados = list(lista)
+    processos = processos or multiprocessing.cpu_count()
+    processos = min(processos, len(dados) // minimo_por_processo)
+    if processos <= 1:
+        return merge_sort_iterativo(dados)
+
+    tamanho = -(-len(dados) // processos)
+    blocos = [dados[i:i + tamanho] for i in range(0, len(dados), tamanho)]
+    with multiprocessing.Pool(processos) as pool:
+        ordenados = pool.map(_ordenar_bloco, blocos)
+
+    # A ordem dos blocos no desempate preserva a estabilidade
+    return list(intercalar(*ordenados))
+
+def main():
+    import random
+    from benchmark import medir, formatar_ns
+
+    print("=== MERGE SORT COM BUFFER ÚNICO ===\n")
+    for n in (1000, 10_000, 100_000):
+        dados = [random.randint(1, 1000) for _ in range(n)]
+        referencia = medir(sorted, dados, amostras=5)
+        print(f"n = {n} (sorted: {formatar_ns(referencia.mediana)})")
+        variantes = [
+            ("buffer único", merge_sort_buffer),
+            ("iterativo", merge_sort_iterativo),
+        ]
+        for nome, funcao in variantes:
+            assert funcao(dados) == sorted(dados)
+            tempo = medir(funcao, dados, amostras=5)
+            print(f"  {nome:20} {formatar_ns(tempo.mediana):>12} ({tempo.mediana / referencia.mediana:.1f}x sorted)")
+    print()
+
+    print("=== ORDENAÇÃO DE INTEIROS: PONTOS DE CRUZAMENTO ===\n")
+    for n in (1000, 10_000, 100_000):
+        for intervalo in (10, 1000, n // 2, n * 10):
+            dados = [random.randint(1, intervalo) for _ in range(n)]
+            timsort = medir(sorted, dados, amostras=5)
+            contagem = medir(ordenar_contagem, dados, amostras=5)
+            radix = medir(ordenar_radix, dados, amostras=5)
+            _, escolhido = ordenar_automatico(dados)
+            print(f"n={n:>6} intervalo={intervalo:>7}: timsort {formatar_ns(timsort.mediana):>10}, "
+                  f"contagem {formatar_ns(contagem.mediana):>10}, radix {formatar_ns(radix.mediana):>10} "
+                  f"-> escolhido: {escolhido}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+
+from ordenacao import intercalar
+
+# Formato padrão: um inteiro com sinal de 64 bits por registro (little-endian)
+FORMATO_PADRAO = "<q"
+MEMORIA_PADRAO = 64 * 1024 * 1024
+FAN_IN_PADRAO = 16
+BUFFER_IO = 1024 * 1024
+
+def _registros_por_bloco(estrutura, bytes_bloco):
+    return max(1, bytes_bloco // estrutura.size)
+
+def ler_registros(caminho, formato=FORMATO_PADRAO, bytes_bloco=BUFFER_IO):
+    """Lê registros de largura fixa sob demanda, em blocos - O(1) de memória extra"""
+    estrutura = struct.Struct(formato)
+    tamanho_bloco = _registros_por_bloco(estrutura, bytes_bloco) * estrutura.size
+    with open(caminho, "rb", buffering=0) as arquivo:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                return
+            if len(bloco) % estrutura.size:
+                raise ValueError(f"{caminho}: tamanho não é múltiplo de {estrutura.size} bytes")
+            yield from estrutura.iter_unpack(bloco)
+
+class _Escritor:
+    """Grava registros acumulando-os e empacotando em lote"""
+    def __init__(self, caminho, estrutura, bytes_bloco=BUFFER_IO):
+        self.arquivo = open(caminho, "wb", buffering=0)
+        self.estrutura = estrutura
+        self.limite = _registros_por_bloco(estrutura, bytes_bloco)
+        self.pendentes = []
+
+    def gravar(self, registro):
+        self.pendentes.append(registro)
+        if len(self.pendentes) >= self.limite:
+            self.descarregar()
+
+    def gravar_varios(self, registros):
+        for registro in registros:
+            self.gravar(registro)
+
+    def descarregar(self):
+        if self.pendentes:
+            pack = self.estrutura.pack
+            self.arquivo.write(b"".join([pack(*registro) for registro in self.pendentes]))
+            self.pendentes.clear()
+
+    def fechar(self):
+        self.descarregar()
+        self.arquivo.close()
+
+def _gerar_trechos(entrada, estrutura, chave, memoria, diretorio):
+    """Fase 1: ordena trechos que cabem em `memoria` e grava cada um em um temporário"""
+    # Cada registro desempacotado custa bem mais que seus bytes em disco
+    # (tupla + objetos int/float), então o orçamento em registros é dividido
+    # por uma estimativa conservadora de ~100 bytes de overhead por campo
+    campos = len(estrutura.unpack(bytes(estrutura.size)))
+    por_trecho = max(1, memoria // (estrutura.size + 100 * campos))
+    trechos = []
+    tamanho = os.path.getsize(entrada)
+    if tamanho % estrutura.size:
+        raise ValueError(f"{entrada}: tamanho não é múltiplo de {estrutura.size} bytes")
+    if tamanho == 0:
+        return trechos
+    with open(entrada, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        bytes_trecho = por_trecho * estrutura.size
+        for inicio in range(0, tamanho, bytes_trecho):
+            with memoryview(mapa)[inicio:inicio + bytes_trecho] as janela:
+                registros = list(estrutura.iter_unpack(janela))
+            # list.sort é estável: registros com chaves iguais mantêm a ordem do arquivo
+            registros.sort(key=chave)
+            descritor, caminho = tempfile.mkstemp(prefix="trecho_", suffix=".bin", dir=diretorio)
+            os.close(descritor)
+            escritor = _Escritor(caminho, estrutura)
+            escritor.gravar_varios(registros)
+            escritor.fechar()
+            trechos.append(caminho)
+    return trechos
+
+def _intercalar_arquivos(caminhos, destino, estrutura, chave):
+    escritor = _Escritor(destino, estrutura)
+    try:
+        fontes = [ler_registros(caminho, estrutura.format) for caminho in caminhos]
+        escritor.gravar_varios(intercalar(*fontes, chave=chave))
+    finally:
+        escritor.fechar()
+
+def ordenar_arquivo(entrada, saida, formato=FORMATO_PADRAO, chave=None,
+                    memoria=MEMORIA_PADRAO, fan_in=FAN_IN_PADRAO, diretorio=None):
+    """Ordena um arquivo de registros binários de largura fixa fora da memória
+
+    `formato` é um formato do módulo struct descrevendo um registro; a
+    ordenação usa `chave(registro)` (padrão: a tupla inteira). `memoria` é
+    o orçamento aproximado em bytes para cada trecho ordenado em memória e
+    `fan_in` o número máximo de arquivos intercalados por vez. A ordenação
+    é estável. Retorna o número de passadas de intercalação.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in deve ser pelo menos 2")
+    estrutura = struct.Struct(formato)
+    with tempfile.TemporaryDirectory(prefix="ordenacao_externa_", dir=diretorio) as temporario:
+        trechos = _gerar_trechos(entrada, estrutura, chave, memoria, temporario)
+        passadas = 0
+        while len(trechos) > fan_in:
+            passadas += 1
+            proximos = []
+            # Grupos contíguos preservam a estabilidade entre trechos
+            for inicio in range(0, len(trechos), fan_in):
+                grupo = trechos[inicio:inicio + fan_in]
+                descritor, caminho = tempfile.mkstemp(prefix="passada_", suffix=".bin", dir=temporario)
+                os.close(descritor)
+                _intercalar_arquivos(grupo, caminho, estrutura, chave)
+                for usado in grupo:
+                    os.remove(usado)
+                proximos.append(caminho)
+            trechos = proximos
+        _intercalar_arquivos(trechos, saida, estrutura, chave)
+        return passadas + 1
+
+def gerar_arquivo(caminho, quantidade, formato=FORMATO_PADRAO, seed=42, maximo=10**12):
+    """Gera `quantidade` registros aleatórios (cada campo em [0, maximo])"""
+    estrutura = struct.Struct(formato)
+    campos = len(estrutura.unpack(bytes(estrutura.size)))
+    gerador = random.Random(seed)
+    escritor = _Escritor(caminho, estrutura)
+    try:
+        for _ in range(quantidade):
+            escritor.gravar(tuple(gerador.randint(0, maximo) for _ in range(campos)))
+    finally:
+        escritor.fechar()
+
+def verificar_ordenado(caminho, formato=FORMATO_PADRAO, chave=None):
+    """Confere se o arquivo está ordenado; retorna o número de registros"""
+    chave = chave or (lambda registro: registro)
+    anterior = None
+    total = 0
+    for registro in ler_registros(caminho, formato):
+        atual = chave(registro)
+        if anterior is not None and atual < anterior:
+            raise ValueError(f"{caminho}: registro {total} fora de ordem")
+        anterior = atual
+        total += 1
+    return total
+
+def main(argv=None):
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Ordenação externa de registros binários de largura fixa")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    gerar = subcomandos.add_parser("gerar", help="gera um arquivo de registros aleatórios")
+    gerar.add_argument("arquivo")
+    gerar.add_argument("registros", type=int)
+    ordenar = subcomandos.add_parser("ordenar", help="ordena um arquivo")
+    ordenar.add_argument("entrada")
+    ordenar.add_argument("saida")
+    ordenar.add_argument("--memoria-mb", type=int, default=MEMORIA_PADRAO // 2**20)
+    ordenar.add_argument("--fan-in", type=int, default=FAN_IN_PADRAO)
+    verificar = subcomandos.add_parser("verificar", help="confere se um arquivo está ordenado")
+    verificar.add_argument("arquivo")
+    for subcomando in (gerar, ordenar, verificar):
+        subcomando.add_argument("--formato", default=FORMATO_PADRAO, help="formato struct de um registro")
+    opcoes = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    if opcoes.comando == "gerar":
+        gerar_arquivo(opcoes.arquivo, opcoes.registros, opcoes.formato)
+        print(f"{opcoes.registros} registros gravados em {opcoes.arquivo}")
+    elif opcoes.comando == "ordenar":
+        passadas = ordenar_arquivo(opcoes.entrada, opcoes.saida, opcoes.formato,
+                                   memoria=opcoes.memoria_mb * 2**20, fan_in=opcoes.fan_in)
+        print(f"{opcoes.entrada} -> {opcoes.saida} em {passadas} passada(s) de intercalação")
+    else:
+        total = verificar_ordenado(opcoes.arquivo, opcoes.formato)
+        print(f"{opcoes.arquivo}: {total} registros em ordem")
+    print(f"Tempo: {time.perf_counter() - inicio:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import math
+import multiprocessing
+from itertools import islice, permutations
+
+def _gerar_intervalo(prefixo, restantes, inicio, fim):
+    """Permutações de posição [inicio, fim) de `restantes`, precedidas de `prefixo`
+
+    As permutações com um mesmo primeiro elemento formam um bloco contíguo
+    de (n-1)! posições; blocos inteiros são delegados a itertools.permutations
+    (próxima permutação lexicográfica implementada em C) e só as bordas do
+    intervalo descem um nível na recursão (profundidade máxima n).
+    """
+    total = math.factorial(len(restantes))
+    if inicio == 0 and fim == total:
+        if prefixo:
+            for permutacao in permutations(restantes):
+                yield prefixo + permutacao
+        else:
+            yield from permutations(restantes)
+        return
+    bloco = total // len(restantes)
+    for i in range(inicio // bloco, (fim - 1) // bloco + 1):
+        yield from _gerar_intervalo(
+            prefixo + (restantes[i],),
+            restantes[:i] + restantes[i + 1:],
+            max(inicio - i * bloco, 0),
+            min(fim - i * bloco, bloco),
+        )
+
+def permutacoes_lazy(sequencia, inicio=0, fim=None):
+    """Gera as permutações de `sequencia` como tuplas, sob demanda - O(n) de memória
+
+    A ordem é a mesma de algoritmos.permutacoes (lexicográfica pelas
+    posições dos elementos). `inicio`/`fim` restringem a geração às
+    permutações de índice k com inicio <= k < fim.
+    """
+    elementos = tuple(sequencia)
+    total = math.factorial(len(elementos))
+    fim = total if fim is None else min(fim, total)
+    if inicio >= fim:
+        return
+    yield from _gerar_intervalo((), elementos, inicio, fim)
+
+def permutacao_por_posicao(sequencia, k):
+    """k-ésima permutação (unrank) pelo sistema de numeração fatorial - O(n²)"""
+    restantes = list(sequencia)
+    n = len(restantes)
+    if not 0 <= k < math.factorial(n):
+        raise IndexError("posição de permutação fora do intervalo")
+    resultado = []
+    for i in range(n, 0, -1):
+        bloco = math.factorial(i - 1)
+        indice, k = divmod(k, bloco)
+        resultado.append(restantes.pop(indice))
+    return resultado
+
+def posicao_da_permutacao(permutacao, sequencia=None):
+    """Índice lexicográfico (rank) de uma permutação de `sequencia` - O(n²)
+
+    Sem `sequencia`, a permutação é comparada com a própria versão ordenada.
+    """
+    restantes = list(sequencia) if sequencia is not None else sorted(permutacao)
+    if len(restantes) != len(permutacao):
+        raise ValueError("a permutação deve ter o mesmo tamanho da sequência")
+    posicao = 0
+    n = len(restantes)
+    for i, elemento in enumerate(permutacao):
+        indice = restantes.index(elemento)
+        posicao += indice * math.factorial(n - 1 - i)
+        restantes.pop(indice)
+    return posicao
+
+def dividir_intervalos(total, partes):
+    """Divide [0, total) em até `partes` intervalos contíguos e disjuntos"""
+    partes = max(1, min(partes, total))
+    tamanho, resto = divmod(total, partes)
+    intervalos = []
+    inicio = 0
+    for i in range(partes):
+        fim = inicio + tamanho + (1 if i < resto else 0)
+        intervalos.append((inicio, fim))
+        inicio = fim
+    return intervalos
+
+# Estado dos processos trabalhadores (definido pelo initializer do Pool)
+_parar = None
+
+def _iniciar_trabalhador(evento):
+    global _parar
+    _parar = evento
+
+def _aplicar_intervalo(tarefa):
+    funcao, sequencia, inicio, fim = tarefa
+    return funcao(permutacoes_lazy(sequencia, inicio, fim))
+
+def _buscar_intervalo(tarefa):
+    predicado, sequencia, inicio, fim = tarefa
+    for contador, permutacao in enumerate(permutacoes_lazy(sequencia, inicio, fim)):
+        # Consultar o evento tem custo de sincronização: checa a cada 1024 itens
+        if contador & 1023 == 0 and _parar.is_set():
+            return None
+        if predicado(permutacao):
+            _parar.set()
+            return inicio + contador, permutacao
+    return None
+
+def mapear_paralelo(sequencia, funcao, processos=None, blocos=None):
+    """Aplica funcao(iterador_de_permutações) a blocos disjuntos em paralelo
+
+    O espaço de n! permutações é dividido por posição (rank), então cada
+    processo gera só o seu intervalo. `funcao` precisa ser serializável
+    (definida no nível do módulo). Retorna a lista de resultados na ordem
+    dos blocos.
+    """
+    sequencia = list(sequencia)
+    processos = processos or multiprocessing.cpu_count()
+    blocos = blocos or processos * 4
+    tarefas = [(funcao, sequencia, inicio, fim)
+               for inicio, fim in dividir_intervalos(math.factorial(len(sequencia)), blocos)]
+    with multiprocessing.Pool(processos) as pool:
+        return pool.map(_aplicar_intervalo, tarefas)
+
+def buscar_paralelo(sequencia, predicado, processos=None, blocos=None):
+    """Primeira permutação encontrada que satisfaz `predicado`, com parada antecipada
+
+    Retorna (posição, permutação) ou None. Quando um processo encontra uma
+    resposta, os demais param na próxima verificação do evento compartilhado.
+    Com vários processos, a resposta não é necessariamente a de menor posição.
+    """
+    sequencia = list(sequencia)
+    processos = processos or multiprocessing.cpu_count()
+    blocos = blocos or processos * 4
+    tarefas = [(predicado, sequencia, inicio, fim)
+               for inicio, fim in dividir_intervalos(math.factorial(len(sequencia)), blocos)]
+    with multiprocessing.Manager() as gerenciador:
+        evento = gerenciador.Event()
+        with multiprocessing.Pool(processos, initializer=_iniciar_trabalhador, initargs=(evento,)) as pool:
+            for resultado in pool.imap_unordered(_buscar_intervalo, tarefas):
+                if resultado is not None:
+                    return resultado
+    return None
+
+def contar(iterador):
+    """Conta os itens de um iterador sem materializá-lo"""
+    return sum(1 for _ in iterador)
+
+def _ordem_decrescente(permutacao):
+    return all(a > b for a, b in zip(permutacao, permutacao[1:]))
+
+def main():
+    print("=== PERMUTAÇÕES SOB DEMANDA ===\n")
+    elementos = [1, 2, 3, 4]
+    print(f"Primeiras 6 permutações de {elementos}: {list(islice(permutacoes_lazy(elementos), 6))}")
+    print(f"Permutação de posição 17: {permutacao_por_posicao(elementos, 17)}")
+    print(f"Posição de [3, 4, 2, 1]: {posicao_da_permutacao([3, 4, 2, 1])}")
+
+    n = 10
+    contagens = mapear_paralelo(range(n), contar)
+    print(f"Permutações de {n} elementos (em paralelo): {sum(contagens)} = {n}! = {math.factorial(n)}")
+
+    resultado = buscar_paralelo(range(8), _ordem_decrescente)
+    print(f"Busca paralela pela permutação decrescente: {resultado}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#include <string.h>
+
+// Rotinas de tamanho genérico usadas pela ponte ctypes (ponte_c.py).
+// arrays.c e estruturas.c são compilados como bibliotecas sem mudanças;
+// aqui ficam só as versões que lá dependem de tamanho fixo: a matriz 3x3
+// e o Fibonacci memoizado de ../c/memoization.c, que devolve int (n <= 46)
+// e aloca o vetor memo a cada chamada.
+
+// Multiplicação de matrizes n×n em buffers contíguos (por linhas) - O(n³)
+void multiplicar_matrizes_n(const int *A, const int *B, int *resultado, int n) {
+    memset(resultado, 0, sizeof(int) * n * n);  // O(n²) - zera o resultado
+
+    // Ordem i-k-j: o laço interno percorre linhas de B e do resultado em sequência
+    for (int i = 0; i < n; i++) {  // O(n)
+        for (int k = 0; k < n; k++) {  // O(n)
+            int a = A[i * n + k];  // O(1)
+            for (int j = 0; j < n; j++) {  // O(n)
+                resultado[i * n + j] += a * B[k * n + j];  // O(1)
+            }
+        }
+    }
+}
+// COMPLEXIDADE FINAL: O(n³) - três laços aninhados até n
+
+// Cache do Fibonacci memoizado, mantido entre chamadas (limpar_memo o
+// esvazia): F(92) é o maior que cabe em long long
+#define MAX_FIBONACCI 92
+static long long memo[MAX_FIBONACCI + 1];
+
+// Esvazia o cache (para medições "frias") - O(1)
+void limpar_memo(void) {
+    memset(memo, 0, sizeof(memo));
+}
+
+// Fibonacci recursivo memoizado - O(n) na primeira chamada, O(1) depois
+long long fibonacci_memoizado(int n) {
+    if (n < 0 || n > MAX_FIBONACCI) {  // O(1) - fora do alcance de long long
+        return -1;
+    }
+    if (n <= 1) {  // O(1) - caso base
+        return n;
+    }
+    if (memo[n] == 0) {  // O(1) - consulta ao cache
+        memo[n] = fibonacci_memoizado(n - 1) + fibonacci_memoizado(n - 2);  // O(n) - cada valor calculado uma vez
+    }
+    return memo[n];
+}
+// COMPLEXIDADE FINAL: O(n) - cada F(k) é calculado uma única vez
@@ -0,0 +1,254 @@
+"""Ponte ctypes para comparar as rotinas em C com as versões em Python
+
+Compila arrays.c, estruturas.c, ponte.c e ../c/memoization.c como
+bibliotecas compartilhadas (uma por arquivo, então os símbolos repetidos
+como inserir_inicio e main não conflitam) e chama as funções pelo ctypes. Os vetores de inteiros são
+array('i') passados sem cópia: o ponteiro C aponta para o buffer do
+próprio array. As duas linguagens recebem exatamente as mesmas entradas e
+são medidas pelo mesmo benchmark.medir.
+"""
+
+import ctypes
+import os
+import shutil
+import subprocess
+import sys
+from array import array
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+DIRETORIO_SAIDA = os.path.join(DIRETORIO, "__pycache__", "ponte_c")
+# Fontes relativas a este diretório; a biblioteca leva o nome do arquivo
+FONTES = ("arrays.c", "estruturas.c", "ponte.c", os.path.join("..", "c", "memoization.c"))
+OPCOES_COMPILADOR = ("-O2", "-shared", "-fPIC")
+
+# F(46) é o maior Fibonacci que cabe no int de c/memoization.c
+MAX_FIBONACCI_INT = 46
+
+_bibliotecas = None
+
+def compilar(forcar=False, compilador=None):
+    """Compila cada fonte .c em uma biblioteca .so (se estiver desatualizada)
+
+    Retorna {nome: caminho}. O compilador vem de `compilador`, da variável
+    de ambiente CC ou é o gcc.
+    """
+    compilador = compilador or os.environ.get("CC", "gcc")
+    if shutil.which(compilador) is None:
+        raise RuntimeError(f"compilador C não encontrado: {compilador}")
+    os.makedirs(DIRETORIO_SAIDA, exist_ok=True)
+    caminhos = {}
+    for relativo in FONTES:
+        fonte = os.path.normpath(os.path.join(DIRETORIO, relativo))
+        nome = os.path.splitext(os.path.basename(fonte))[0]
+        destino = os.path.join(DIRETORIO_SAIDA, f"lib{nome}.so")
+        if forcar or not os.path.exists(destino) or os.path.getmtime(destino) < os.path.getmtime(fonte):
+            subprocess.run([compilador, *OPCOES_COMPILADOR, "-o", destino, fonte], check=True)
+        caminhos[nome] = destino
+    return caminhos
+
+def _assinar(funcao, argumentos, retorno):
+    funcao.argtypes = argumentos
+    funcao.restype = retorno
+    return funcao
+
+def carregar():
+    """Carrega (compilando se preciso) as bibliotecas e declara as assinaturas"""
+    global _bibliotecas
+    if _bibliotecas is None:
+        caminhos = compilar()
+        arrays = ctypes.CDLL(caminhos["arrays"])
+        estruturas = ctypes.CDLL(caminhos["estruturas"])
+        ponte = ctypes.CDLL(caminhos["ponte"])
+        memoization = ctypes.CDLL(caminhos["memoization"])
+        vetor = ctypes.POINTER(ctypes.c_int)
+        inteiro = ctypes.c_int
+        _assinar(arrays.quicksort, [vetor, inteiro, inteiro], None)
+        _assinar(arrays.busca_linear, [vetor, inteiro, inteiro], inteiro)
+        _assinar(estruturas.busca_binaria, [vetor, inteiro, inteiro, inteiro], inteiro)
+        _assinar(estruturas.fibonacci_recursivo, [inteiro], ctypes.c_longlong)
+        _assinar(estruturas.fibonacci_iterativo, [inteiro], ctypes.c_longlong)
+        _assinar(ponte.multiplicar_matrizes_n, [vetor, vetor, vetor, inteiro], None)
+        _assinar(ponte.fibonacci_memoizado, [inteiro], ctypes.c_longlong)
+        _assinar(ponte.limpar_memo, [], None)
+        _assinar(memoization.fibonacci_memoization, [inteiro], inteiro)
+        _bibliotecas = (arrays, estruturas, ponte, memoization)
+    return _bibliotecas
+
+def _vetor(dados):
+    """Visão ctypes (int *) do buffer de um array('i'), sem cópia"""
+    if not isinstance(dados, array) or dados.typecode != "i":
+        raise ValueError("as rotinas em C esperam array('i')")
+    return (ctypes.c_int * len(dados)).from_buffer(dados)
+
+def quicksort(dados):
+    """Ordena um array('i') no lugar com o quicksort de arrays.c"""
+    if dados:
+        carregar()[0].quicksort(_vetor(dados), 0, len(dados) - 1)
+    return dados
+
+def busca_linear(dados, valor):
+    """busca_linear de arrays.c: posição ou -1"""
+    return carregar()[0].busca_linear(_vetor(dados), len(dados), valor) if dados else -1
+
+def busca_binaria(dados, valor):
+    """busca_binaria (recursiva) de estruturas.c sobre um array('i') ordenado"""
+    return carregar()[1].busca_binaria(_vetor(dados), valor, 0, len(dados) - 1) if dados else -1
+
+def fibonacci_recursivo(n):
+    return carregar()[1].fibonacci_recursivo(n)
+
+def fibonacci_iterativo(n):
+    return carregar()[1].fibonacci_iterativo(n)
+
+def fibonacci_memoization(n):
+    """fibonacci_memoization de c/memoization.c (int: n <= 46); vetor memo novo a cada chamada"""
+    if not 0 <= n <= MAX_FIBONACCI_INT:
+        raise ValueError(f"n deve estar entre 0 e {MAX_FIBONACCI_INT} (resultado em int de 32 bits)")
+    return carregar()[3].fibonacci_memoization(n)
+
+def fibonacci_memoizado(n, frio=False):
+    """fibonacci_memoizado de ponte.c (n <= 92); `frio` esvazia o cache antes"""
+    ponte = carregar()[2]
+    if frio:
+        ponte.limpar_memo()
+    return ponte.fibonacci_memoizado(n)
+
+def multiplicar_matrizes(A, B, n):
+    """Produto de matrizes n×n em array('i') por linhas; retorna um novo array('i')"""
+    resultado = array("i", bytes(4 * n * n))
+    carregar()[2].multiplicar_matrizes_n(_vetor(A), _vetor(B), _vetor(resultado), n)
+    return resultado
+
+def casos(gerador):
+    """Gera (algoritmo, n, [(implementação, func, args)]) com as mesmas entradas
+
+    Em cada caso a primeira implementação é a de C (referência do
+    relatório); as demais são as funções Python dos dois módulos.
+    """
+    import algoritmos
+    import estruturas_avancadas as ea
+
+    for n in (1000, 10_000, 100_000):
+        lista = [gerador.randrange(1_000_000) for _ in range(n)]
+        vetor = array("i", lista)
+        yield "ordenação", n, [
+            ("C quicksort", lambda vetor=vetor: quicksort(array("i", vetor)), ()),
+            ("Python sorted", sorted, (lista,)),
+            ("Python merge_sort", ea.merge_sort, (lista,)),
+        ]
+    for n in (10_000, 100_000, 1_000_000):
+        lista = [gerador.randrange(1_000_000) for _ in range(n)]
+        vetor = array("i", lista)
+        yield "busca linear (ausente)", n, [
+            ("C busca_linear", busca_linear, (vetor, -1)),
+            ("Python busca_linear", algoritmos.busca_linear, (lista, -1)),
+        ]
+        lista.sort()
+        vetor = array("i", lista)
+        alvo = lista[n // 3]
+        yield "busca binária", n, [
+            ("C busca_binaria", busca_binaria, (vetor, alvo)),
+            ("Python busca_binaria", algoritmos.busca_binaria, (lista, alvo)),
+            ("Python busca_binaria_iterativa", ea.busca_binaria_iterativa, (lista, alvo)),
+        ]
+    for n in (20, 25):
+        yield "fibonacci recursivo", n, [
+            ("C fibonacci_recursivo", fibonacci_recursivo, (n,)),
+            ("Python fibonacci_recursivo", algoritmos.fibonacci_recursivo, (n,)),
+        ]
+    yield "fibonacci iterativo", 90, [
+        ("C fibonacci_iterativo", fibonacci_iterativo, (90,)),
+        ("Python fibonacci_iterativo", algoritmos.fibonacci_iterativo, (90,)),
+    ]
+    # As duas versões Python recursam pelo nome decorado, então .frio mede a
+    # recursão memoizada com o cache vazio (O(n)), como as de C
+    yield "fibonacci memoizado (frio)", MAX_FIBONACCI_INT, [
+        ("C fibonacci_memoization", fibonacci_memoization, (MAX_FIBONACCI_INT,)),
+        ("C fibonacci_memoizado", fibonacci_memoizado, (MAX_FIBONACCI_INT, True)),
+        ("Python fibonacci_recursivo_memoizado", algoritmos.fibonacci_recursivo_memoizado.frio, (MAX_FIBONACCI_INT,)),
+        ("Python fibonacci_com_memoizacao", ea.fibonacci_com_memoizacao.frio, (MAX_FIBONACCI_INT,)),
+    ]
+    yield "fibonacci memoizado (frio)", 90, [
+        ("C fibonacci_memoizado", fibonacci_memoizado, (90, True)),
+        ("Python fibonacci_recursivo_memoizado", algoritmos.fibonacci_recursivo_memoizado.frio, (90,)),
+        ("Python fibonacci_com_memoizacao", ea.fibonacci_com_memoizacao.frio, (90,)),
+    ]
+    for n in (50, 100, 200):
+        A = [[gerador.randrange(100) for _ in range(n)] for _ in range(n)]
+        B = [[gerador.randrange(100) for _ in range(n)] for _ in range(n)]
+        planas = (array("i", [x for linha in A for x in linha]), array("i", [x for linha in B for x in linha]))
+        yield "multiplicação de matrizes", n, [
+            ("C multiplicar_matrizes_n", multiplicar_matrizes, (*planas, n)),
+            ("Python multiplicar_matrizes", algoritmos.multiplicar_matrizes, (A, B)),
+            ("Python multiplicar_matrizes_otimizada", ea.multiplicar_matrizes_otimizada, (A, B)),
+        ]
+
+def _normalizar(resultado):
+    # Deixa os resultados de C e de Python comparáveis (array -> list, Matriz -> listas)
+    if isinstance(resultado, array):
+        return resultado.tolist()
+    if hasattr(resultado, "para_listas"):
+        resultado = resultado.para_listas()
+    if isinstance(resultado, list) and resultado and isinstance(resultado[0], list):
+        return [x for linha in resultado for x in linha]
+    return resultado
+
+def comparar(gerador=None, orcamento_ns=None):
+    """Mede cada caso nas duas linguagens e retorna as linhas do relatório
+
+    Cada linha é (algoritmo, n, implementação, Estatisticas, razão sobre C).
+    Antes de medir, confere que todas as implementações dão o mesmo
+    resultado para a mesma entrada.
+    """
+    import random
+    from benchmark import medir, ORCAMENTO_PADRAO_NS
+
+    gerador = gerador or random.Random(42)
+    linhas = []
+    for algoritmo, n, implementacoes in casos(gerador):
+        for indice, (nome, func, args) in enumerate(implementacoes):
+            resultado = _normalizar(func(*args))
+            if indice == 0:
+                referencia = resultado
+            elif resultado != referencia and algoritmo != "busca binária":
+                # (com valores repetidos, as buscas binárias podem achar posições diferentes)
+                raise AssertionError(f"{nome} diverge de {implementacoes[0][0]} em {algoritmo} (n={n})")
+            estatisticas = medir(func, *args, nome=f"{algoritmo}[n={n}] {nome}",
+                                 orcamento_ns=orcamento_ns or ORCAMENTO_PADRAO_NS)
+            if indice == 0:
+                base = estatisticas.mediana
+            linhas.append((algoritmo, n, nome, estatisticas, estatisticas.mediana / base))
+    return linhas
+
+def imprimir_relatorio(linhas):
+    """Um bloco por algoritmo e tamanho, com a razão de cada versão sobre a de C"""
+    from benchmark import formatar_ns
+
+    anterior = None
+    for algoritmo, n, nome, estatisticas, razao in linhas:
+        if (algoritmo, n) != anterior:
+            print(f"\n{algoritmo} (n = {n})")
+            anterior = (algoritmo, n)
+        print(f"  {nome:40} {formatar_ns(estatisticas.mediana):>12}  p95 {formatar_ns(estatisticas.p95):>12}  {razao:10.1f}x")
+
+def main(argv=None):
+    import argparse
+    from benchmark import salvar_json
+
+    parser = argparse.ArgumentParser(description="Compara as rotinas em C (via ctypes) com as versões em Python")
+    parser.add_argument("--saida", help="grava os resultados em JSON neste caminho")
+    parser.add_argument("--orcamento-ms", type=float, default=100, help="tempo aproximado de medição por caso")
+    parser.add_argument("--recompilar", action="store_true", help="recompila as bibliotecas mesmo se atualizadas")
+    opcoes = parser.parse_args(argv)
+
+    print("=== PYTHON × C (ctypes, mesmas entradas) ===")
+    compilar(forcar=opcoes.recompilar)
+    linhas = comparar(orcamento_ns=opcoes.orcamento_ms * 1e6)
+    imprimir_relatorio(linhas)
+    if opcoes.saida:
+        salvar_json([estatisticas for _, _, _, estatisticas, _ in linhas], opcoes.saida)
+        print(f"\nResultados gravados em {opcoes.saida}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+from array import array
+from collections.abc import MutableSequence
+
+CAPACIDADE_INICIAL = 8
+
+class BufferCircular(MutableSequence):
+    """Sequência com inserção e remoção O(1) amortizado nas duas pontas
+
+    Os elementos ficam em um buffer circular de capacidade potência de 2
+    (posição física = (inicio + i) & mascara), que dobra quando enche.
+    Acesso por índice é O(1), como em list, e `insert(0, x)` / `pop(0)` não
+    deslocam nada, ao contrário de list. Com `typecode` o buffer é um
+    array.array compacto (ex.: "q", "d"); sem ele, uma list de objetos.
+    Implementa a interface de MutableSequence, então serve no lugar de uma
+    list em código que só usa essa interface.
+    """
+    __slots__ = ("_dados", "_inicio", "_tamanho", "_mascara", "typecode")
+
+    def __init__(self, valores=(), typecode=None):
+        self.typecode = typecode
+        self._inicio = 0
+        self._tamanho = 0
+        self._alocar(CAPACIDADE_INICIAL)
+        self.extend(valores)
+
+    def _buffer(self, capacidade):
+        if self.typecode is None:
+            return [None] * capacidade
+        return array(self.typecode, bytes(array(self.typecode).itemsize * capacidade))
+
+    def _alocar(self, capacidade):
+        """Realoca com `capacidade` posições, deixando os elementos contíguos a partir de 0 - O(n)"""
+        novos = self._buffer(capacidade)
+        if self._tamanho:
+            novos[:self._tamanho] = self._fatia_contigua()
+        self._dados = novos
+        self._inicio = 0
+        self._mascara = capacidade - 1
+
+    def _fatia_contigua(self):
+        """Elementos em ordem, como list ou array (no máximo duas cópias de trechos)"""
+        dados, inicio, tamanho = self._dados, self._inicio, self._tamanho
+        fim = inicio + tamanho
+        if fim <= len(dados):
+            return dados[inicio:fim]
+        return dados[inicio:] + dados[:fim - len(dados)]
+
+    def _normalizar(self, indice):
+        if indice < 0:
+            indice += self._tamanho
+        if not 0 <= indice < self._tamanho:
+            raise IndexError("índice fora da sequência")
+        return indice
+
+    def _posicao(self, indice):
+        return (self._inicio + self._normalizar(indice)) & self._mascara
+
+    def __len__(self):
+        return self._tamanho
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return BufferCircular(self._fatia_contigua()[indice], self.typecode)
+        return self._dados[self._posicao(indice)]
+
+    def __setitem__(self, indice, valor):
+        if isinstance(indice, slice):
+            valores = self._fatia_contigua()
+            valores[indice] = valor if self.typecode is None else array(self.typecode, valor)
+            self.clear()
+            self.extend(valores)
+            return
+        self._dados[self._posicao(indice)] = valor
+
+    def __delitem__(self, indice):
+        if isinstance(indice, slice):
+            valores = self._fatia_contigua()
+            del valores[indice]
+            self.clear()
+            self.extend(valores)
+            return
+        indice = self._normalizar(indice)
+        dados, mascara = self._dados, self._mascara
+        # Desloca o lado mais curto: O(min(i, n - i))
+        if indice < self._tamanho // 2:
+            for k in range(indice, 0, -1):
+                dados[(self._inicio + k) & mascara] = dados[(self._inicio + k - 1) & mascara]
+            self._limpar(self._inicio)
+            self._inicio = (self._inicio + 1) & mascara
+        else:
+            for k in range(indice, self._tamanho - 1):
+                dados[(self._inicio + k) & mascara] = dados[(self._inicio + k + 1) & mascara]
+            self._limpar((self._inicio + self._tamanho - 1) & mascara)
+        self._tamanho -= 1
+
+    def _limpar(self, posicao):
+        # Solta a referência (só faz diferença no buffer de objetos)
+        if self.typecode is None:
+            self._dados[posicao] = None
+
+    def insert(self, indice, valor):
+        """Insere antes de `indice` - O(1) amortizado nas pontas, O(min(i, n - i)) no meio"""
+        tamanho = self._tamanho
+        if indice < 0:
+            indice = max(0, indice + tamanho)
+        indice = min(indice, tamanho)
+        if indice == 0:
+            self.inserir_inicio(valor)
+        elif indice == tamanho:
+            self.inserir_fim(valor)
+        elif indice < tamanho // 2:
+            self.inserir_inicio(self[0])
+            dados, mascara, inicio = self._dados, self._mascara, self._inicio
+            for k in range(1, indice):
+                dados[(inicio + k) & mascara] = dados[(inicio + k + 1) & mascara]
+            dados[(inicio + indice) & mascara] = valor
+        else:
+            self.inserir_fim(self[-1])
+            dados, mascara, inicio = self._dados, self._mascara, self._inicio
+            for k in range(tamanho - 1, indice, -1):
+                dados[(inicio + k) & mascara] = dados[(inicio + k - 1) & mascara]
+            dados[(inicio + indice) & mascara] = valor
+
+    def inserir_inicio(self, valor):
+        """Insere no início - O(1) amortizado"""
+        if self._tamanho > self._mascara:
+            self._alocar(2 * (self._mascara + 1))
+        self._inicio = (self._inicio - 1) & self._mascara
+        self._dados[self._inicio] = valor
+        self._tamanho += 1
+
+    def inserir_fim(self, valor):
+        """Insere no fim - O(1) amortizado"""
+        if self._tamanho > self._mascara:
+            self._alocar(2 * (self._mascara + 1))
+        self._dados[(self._inicio + self._tamanho) & self._mascara] = valor
+        self._tamanho += 1
+
+    append = inserir_fim
+
+    def remover_inicio(self):
+        """Remove e retorna o primeiro elemento - O(1)"""
+        if not self._tamanho:
+            raise IndexError("remoção de sequência vazia")
+        valor = self._dados[self._inicio]
+        self._limpar(self._inicio)
+        self._inicio = (self._inicio + 1) & self._mascara
+        self._tamanho -= 1
+        return valor
+
+    def remover_fim(self):
+        """Remove e retorna o último elemento - O(1)"""
+        if not self._tamanho:
+            raise IndexError("remoção de sequência vazia")
+        self._tamanho -= 1
+        posicao = (self._inicio + self._tamanho) & self._mascara
+        valor = self._dados[posicao]
+        self._limpar(posicao)
+        return valor
+
+    def pop(self, indice=-1):
+        """Remove e retorna o elemento em `indice` - O(1) nas pontas"""
+        if indice == 0:
+            return self.remover_inicio()
+        if indice == -1 or indice == self._tamanho - 1:
+            return self.remover_fim()
+        valor = self[indice]
+        del self[indice]
+        return valor
+
+    def extend(self, valores):
+        """Adiciona vários elementos no fim - O(k) amortizado, cópia em bloco"""
+        valores = list(valores)
+        necessario = self._tamanho + len(valores)
+        capacidade = self._mascara + 1
+        if necessario > capacidade:
+            while capacidade < necessario:
+                capacidade *= 2
+            self._alocar(capacidade)
+        if self.typecode is not None:
+            valores = array(self.typecode, valores)
+        # Até dois trechos: do fim ocupado até o fim do buffer e do início do buffer em diante
+        dados = self._dados
+        livre = (self._inicio + self._tamanho) & self._mascara
+        primeiro = min(len(valores), len(dados) - livre)
+        dados[livre:livre + primeiro] = valores[:primeiro]
+        dados[:len(valores) - primeiro] = valores[primeiro:]
+        self._tamanho = necessario
+
+    def clear(self):
+        self._tamanho = 0
+        self._alocar(CAPACIDADE_INICIAL)
+
+    def __iter__(self):
+        dados, inicio, tamanho = self._dados, self._inicio, self._tamanho
+        fim = inicio + tamanho
+        if fim <= len(dados):
+            yield from dados[inicio:fim]
+        else:
+            yield from dados[inicio:]
+            yield from dados[:fim - len(dados)]
+
+    def __eq__(self, outra):
+        if isinstance(outra, (BufferCircular, list)):
+            return len(self) == len(outra) and all(a == b for a, b in zip(self, outra))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"BufferCircular({list(self)!r})"
+
+def main():
+    import time
+    from collections import deque
+    from algoritmos import inserir_inicio
+
+    print("=== BUFFER CIRCULAR ===\n")
+    sequencia = BufferCircular([2, 3])
+    sequencia.insert(0, 1)
+    sequencia.append(4)
+    print(f"{sequencia}: [0] = {sequencia[0]}, [-1] = {sequencia[-1]}, pop(0) = {sequencia.pop(0)}\n")
+
+    print("Construção por inserção no início (algoritmos.inserir_inicio):")
+    for n in (10**4, 10**5, 10**6):
+        linha = f"  n = {n:>7}:"
+        estruturas = [("BufferCircular", BufferCircular), ("BufferCircular('q')", lambda: BufferCircular(typecode="q"))]
+        if n <= 10**5:
+            estruturas.insert(0, ("list", list))
+        for nome, criar in estruturas:
+            sequencia = criar()
+            inicio = time.perf_counter()
+            for valor in range(n):
+                inserir_inicio(sequencia, valor)
+            linha += f" {nome} {time.perf_counter() - inicio:.3f}s,"
+        fila = deque()
+        inicio = time.perf_counter()
+        for valor in range(n):
+            fila.appendleft(valor)
+        linha += f" deque.appendleft {time.perf_counter() - inicio:.3f}s"
+        print(linha)
+
+if __name__ == "__main__":
+    main()
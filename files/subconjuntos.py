@@ -0,0 +1,83 @@
+from array import array
+
+# Máscaras são guardadas em array('Q') (inteiros sem sinal de 64 bits)
+MAX_ELEMENTOS_BLOCO = 64
+
+def elementos(conjunto, mascara):
+    """Elementos de `conjunto` cujos bits estão ligados em `mascara` - O(n)"""
+    return [x for i, x in enumerate(conjunto) if mascara >> i & 1]
+
+def subconjuntos_gray(n):
+    """Percorre as 2^n máscaras em código de Gray - O(1) por passo
+
+    Gera (mascara, bit, entrou): entre um passo e o seguinte só o elemento
+    `bit` muda, entrando (True) ou saindo (False) do subconjunto. O primeiro
+    item é (0, None, None), o subconjunto vazio.
+    """
+    mascara = 0
+    yield mascara, None, None
+    for i in range(1, 1 << n):
+        bit = (i & -i).bit_length() - 1
+        mascara ^= 1 << bit
+        yield mascara, bit, bool(mascara >> bit & 1)
+
+def blocos_gray(n, tamanho=4096):
+    """Máscaras em ordem de Gray agrupadas em array('Q') de até `tamanho` itens
+
+    Cada bloco é um buffer compacto (8 bytes por subconjunto) em vez de
+    listas aninhadas. Requer n <= 64.
+    """
+    if n > MAX_ELEMENTOS_BLOCO:
+        raise ValueError(f"blocos compactos suportam no máximo {MAX_ELEMENTOS_BLOCO} elementos")
+    total = 1 << n
+    for inicio in range(0, total, tamanho):
+        # g(i) = i ^ (i >> 1) permite gerar o bloco de forma independente
+        yield array("Q", (i ^ (i >> 1) for i in range(inicio, min(inicio + tamanho, total))))
+
+def subconjuntos_podados(n, podar):
+    """Subconjuntos (máscaras) em busca em profundidade com poda
+
+    `podar(mascara, decididos)` é chamado para cada subconjunto parcial, em
+    que só os `decididos` primeiros elementos já foram incluídos ou
+    excluídos; se retornar True, toda a subárvore é descartada. Usa uma
+    pilha explícita (sem recursão) com O(n) itens.
+    """
+    pilha = [(0, 0)]
+    while pilha:
+        mascara, decididos = pilha.pop()
+        if podar(mascara, decididos):
+            continue
+        if decididos == n:
+            yield mascara
+            continue
+        # Empilha "com" antes de "sem" para visitar primeiro o ramo sem o elemento
+        pilha.append((mascara | 1 << decididos, decididos + 1))
+        pilha.append((mascara, decididos + 1))
+
+def subconjuntos_com_soma_ate(valores, limite):
+    """Subconjuntos de inteiros não negativos com soma <= limite, podando por soma parcial"""
+    def podar(mascara, decididos):
+        return sum(elementos(valores, mascara)) > limite
+
+    for mascara in subconjuntos_podados(len(valores), podar):
+        yield elementos(valores, mascara)
+
+def main():
+    print("=== SUBCONJUNTOS COM MÁSCARAS DE BITS ===\n")
+    conjunto = ["a", "b", "c"]
+    print(f"Conjunto: {conjunto} (ordem de Gray)")
+    for mascara, bit, entrou in subconjuntos_gray(len(conjunto)):
+        mudanca = "" if bit is None else f"{'+' if entrou else '-'}{conjunto[bit]}"
+        print(f"  {mascara:03b} {mudanca:3} {elementos(conjunto, mascara)}")
+
+    n = 24
+    total = sum(len(bloco) for bloco in blocos_gray(n, tamanho=1 << 16))
+    print(f"\n{n} elementos: {total} subconjuntos em blocos de {1 << 16} máscaras")
+
+    valores = [5, 8, 3, 12, 7, 1]
+    print(f"\nSubconjuntos de {valores} com soma <= 10:")
+    for subconjunto in subconjuntos_com_soma_ate(valores, 10):
+        print(f"  {subconjunto}")
+
+if __name__ == "__main__":
+    main()
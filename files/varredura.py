@@ -0,0 +1,293 @@
+import multiprocessing
+import os
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory, util
+
+try:
+    import numpy
+except ImportError:  # dependência opcional
+    numpy = None
+
+# Elementos por bloco nas varreduras em blocos: grande o bastante para
+# diluir o custo de cada chamada em C, pequeno o bastante para parar cedo
+BLOCO_PADRAO = 1 << 16
+
+# Formatos inteiros de array/struct: a igualdade de inteiros equivale à
+# igualdade dos bytes, então a busca pode ser feita com bytes.find (memchr)
+FORMATOS_INTEIROS = frozenset("bBhHiIlLqQ")
+
+def _e_numpy(dados):
+    return numpy is not None and isinstance(dados, numpy.ndarray)
+
+def _blocos(inicio, fim, bloco):
+    for i in range(inicio, fim, bloco):
+        yield i, min(i + bloco, fim)
+
+def _trecho(dados, i, j):
+    """dados[i:j] como algo com .index/.count em C (list, array ou ndarray)"""
+    if isinstance(dados, memoryview):
+        # Uma memoryview não tem index/count: copia só o bloco para um array
+        trecho = array(dados.format)
+        trecho.frombytes(dados[i:j].cast("B"))
+        return trecho
+    return dados[i:j]
+
+def _indice(trecho, valor):
+    """Primeira posição de valor no trecho, ou -1"""
+    if _e_numpy(trecho):
+        posicoes = numpy.flatnonzero(trecho == valor)
+        return int(posicoes[0]) if len(posicoes) else -1
+    try:
+        return trecho.index(valor)
+    except ValueError:
+        return -1
+
+def _padrao(dados, valor):
+    """Bytes de valor no formato de dados, se a busca por bytes se aplica"""
+    formato = dados.typecode if isinstance(dados, array) else getattr(dados, "format", None)
+    if formato not in FORMATOS_INTEIROS or type(valor) is not int:
+        return None
+    try:
+        return array(formato, [valor]).tobytes()
+    except OverflowError:
+        return None
+
+def _procurar(dados, valor, i, j):
+    """Primeira posição (absoluta) de valor em dados[i:j], ou -1"""
+    padrao = _padrao(dados, valor)
+    if padrao is None:
+        posicao = _indice(_trecho(dados, i, j), valor)
+        return -1 if posicao == -1 else i + posicao
+    largura = len(padrao)
+    with memoryview(dados).cast("B") as octetos:
+        trecho = octetos[i * largura:j * largura].tobytes()
+    k = trecho.find(padrao)
+    # Só valem ocorrências alinhadas ao início de um elemento
+    while k != -1 and k % largura:
+        k = trecho.find(padrao, k + 1)
+    return -1 if k == -1 else i + k // largura
+
+def buscar(dados, valor, inicio=0, fim=None, bloco=BLOCO_PADRAO):
+    """Primeira posição de valor em dados[inicio:fim], ou -1 - O(n) em C
+
+    Aceita list/tuple (list.index), array.array e memoryview de dados
+    numéricos (ex.: memoryview(buffer).cast("q")) e arrays NumPy. Os dados
+    compactos são varridos em blocos de `bloco` elementos, parando no
+    primeiro bloco com o valor; com inteiros, cada bloco é buscado como
+    bytes (bytes.find), sem criar um objeto int por elemento.
+    """
+    fim = len(dados) if fim is None else min(fim, len(dados))
+    if not isinstance(dados, (array, memoryview)) and not _e_numpy(dados):
+        try:
+            return dados.index(valor, inicio, fim)
+        except ValueError:
+            return -1
+    for i, j in _blocos(inicio, fim, bloco):
+        posicao = _procurar(dados, valor, i, j)
+        if posicao != -1:
+            return posicao
+    return -1
+
+def buscar_varios(dados, valores, bloco=BLOCO_PADRAO):
+    """Primeira posição de cada um de `valores` em uma única passada
+
+    Retorna {valor: posição ou -1}. Cada bloco é cruzado com o conjunto de
+    alvos ainda não encontrados (set.intersection / numpy.isin, em C); só
+    os blocos com algum alvo são percorridos com index. A varredura termina
+    quando todos os alvos forem encontrados. O(n + k · bloco).
+    """
+    resultado = dict.fromkeys(valores, -1)
+    alvos = set(resultado)
+    for i, j in _blocos(0, len(dados), bloco):
+        if not alvos:
+            break
+        trecho = _trecho(dados, i, j)
+        if _e_numpy(trecho):
+            mascara = numpy.isin(trecho, list(alvos))
+            presentes = set(trecho[mascara].tolist())
+        else:
+            presentes = alvos.intersection(trecho)
+        for valor in presentes:
+            resultado[valor] = i + _indice(trecho, valor)
+        alvos -= presentes
+    return resultado
+
+def ocorrencias(dados, valor, bloco=BLOCO_PADRAO):
+    """Todas as posições de valor, em ordem - O(n) em C
+
+    Em list/array, saltos sucessivos de index a partir da última posição
+    encontrada; em NumPy e memoryview, numpy.flatnonzero ou index por bloco.
+    """
+    if _e_numpy(dados):
+        return numpy.flatnonzero(dados == valor).tolist()
+    if isinstance(dados, memoryview):
+        trechos = ((i, _trecho(dados, i, j)) for i, j in _blocos(0, len(dados), bloco))
+    else:
+        trechos = [(0, dados)]
+    posicoes = []
+    for i, trecho in trechos:
+        posicao = _indice(trecho, valor)
+        while posicao != -1:
+            posicoes.append(i + posicao)
+            try:
+                posicao = trecho.index(valor, posicao + 1)
+            except ValueError:
+                posicao = -1
+    return posicoes
+
+def contar(dados, valor, bloco=BLOCO_PADRAO):
+    """Número de ocorrências de valor - O(n) em C"""
+    if _e_numpy(dados):
+        return int(numpy.count_nonzero(dados == valor))
+    if isinstance(dados, memoryview):
+        return sum(_trecho(dados, i, j).count(valor) for i, j in _blocos(0, len(dados), bloco))
+    return dados.count(valor)
+
+class _Melhor:
+    """Menor posição encontrada até agora, compartilhada entre threads"""
+    def __init__(self):
+        self.value = -1
+        self.trava = threading.Lock()
+
+    def get_lock(self):
+        return self.trava
+
+def _buscar_bloco(dados, valor, i, j, melhor, sub_bloco):
+    # Sub-blocos: entre um e outro, confere se alguém já achou o valor antes
+    # deste trecho (cancelamento); o bloco inteiro nunca é varrido à toa
+    for a, b in _blocos(i, j, sub_bloco):
+        atual = melhor.value
+        if atual != -1 and atual < a:
+            return -1
+        posicao = _procurar(dados, valor, a, b)
+        if posicao != -1:
+            with melhor.get_lock():
+                if melhor.value == -1 or posicao < melhor.value:
+                    melhor.value = posicao
+            return posicao
+    return -1
+
+# Estado de cada processo trabalhador (definido pelo initializer do Pool):
+# segmento compartilhado, visão tipada dos dados e a melhor posição global
+_trabalhador = None
+
+def _iniciar_trabalhador(nome, formato, tamanho, melhor):
+    global _trabalhador
+    segmento = shared_memory.SharedMemory(name=nome)
+    largura = array(formato).itemsize
+    visao = segmento.buf[:largura * tamanho].cast(formato)
+    _trabalhador = (segmento, visao, melhor)
+    # Fecha o segmento quando o processo termina (pool.close + join), como
+    # em matriz._iniciar_trabalhador
+    util.Finalize(None, _encerrar_trabalhador, exitpriority=10)
+
+def _encerrar_trabalhador():
+    global _trabalhador
+    segmento, visao, _ = _trabalhador
+    _trabalhador = None
+    # A visão precisa ser liberada antes de fechar o segmento
+    visao.release()
+    segmento.close()
+
+def _buscar_bloco_processo(tarefa):
+    valor, i, j, sub_bloco = tarefa
+    _, visao, melhor = _trabalhador
+    return _buscar_bloco(visao, valor, i, j, melhor, sub_bloco)
+
+def _formato(dados):
+    if isinstance(dados, array):
+        return dados.typecode
+    if isinstance(dados, memoryview):
+        return dados.format
+    if _e_numpy(dados):
+        return dados.dtype.char
+    raise ValueError("o modo 'processos' requer dados compactos (array, memoryview ou NumPy)")
+
+def buscar_paralelo(dados, valor, trabalhadores=None, bloco=BLOCO_PADRAO, modo="threads"):
+    """Primeira posição de valor (ou -1), dividindo a varredura entre trabalhadores
+
+    `modo` "threads" compartilha os dados direto (com o GIL, só o NumPy roda
+    de fato em paralelo; em list/array o ganho é o cancelamento). "processos"
+    copia dados compactos uma vez para multiprocessing.shared_memory, como
+    matriz.multiplicar_paralelo. Em ambos, quando um trabalhador encontra o
+    valor, os blocos posteriores à posição encontrada são cancelados (na
+    próxima verificação), e os anteriores continuam: o resultado é sempre a
+    menor posição, como em buscar.
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    n = len(dados)
+    # Cada tarefa é um bloco; os sub-blocos definem a frequência de checagem
+    tamanho = max(bloco, -(-n // (trabalhadores * 4)))
+    sub_bloco = bloco
+    faixas = list(_blocos(0, n, tamanho))
+    if modo == "threads":
+        melhor = _Melhor()
+        with ThreadPoolExecutor(trabalhadores) as executor:
+            list(executor.map(lambda faixa: _buscar_bloco(dados, valor, *faixa, melhor, sub_bloco), faixas))
+        return melhor.value
+    if modo != "processos":
+        raise ValueError(f"modo desconhecido: {modo}")
+
+    formato = _formato(dados)
+    origem = memoryview(dados).cast("B")
+    segmento = shared_memory.SharedMemory(create=True, size=max(origem.nbytes, 1))
+    try:
+        segmento.buf[:origem.nbytes] = origem
+        melhor = multiprocessing.Value("q", -1)
+        tarefas = [(valor, i, j, sub_bloco) for i, j in faixas]
+        with multiprocessing.Pool(trabalhadores, initializer=_iniciar_trabalhador,
+                                  initargs=(segmento.name, formato, n, melhor)) as pool:
+            for _ in pool.imap_unordered(_buscar_bloco_processo, tarefas):
+                pass
+            # Encerramento normal (e não terminate): os finalizadores dos
+            # trabalhadores fecham os segmentos
+            pool.close()
+            pool.join()
+        return melhor.value
+    finally:
+        origem.release()
+        segmento.close()
+        segmento.unlink()
+
+def main():
+    import random
+    from benchmark import medir, formatar_ns
+    from algoritmos import busca_linear
+
+    print("=== BUSCA LINEAR EM BLOCOS ===\n")
+    gerador = random.Random(42)
+    n = 10**7
+    lista = [gerador.randrange(10**9) for _ in range(n)]
+    compacto = array("q", lista)
+    visao = memoryview(compacto)
+    alvo = lista[-10]
+    print(f"n = {n}, alvo perto do fim (backend NumPy disponível: {numpy is not None})")
+    casos = [
+        ("algoritmos.busca_linear", lambda: busca_linear(lista, alvo)),
+        ("buscar (list)", lambda: buscar(lista, alvo)),
+        ("buscar (array)", lambda: buscar(compacto, alvo)),
+        ("buscar (memoryview)", lambda: buscar(visao, alvo)),
+    ]
+    if numpy is not None:
+        vetor = numpy.array(lista)
+        casos.append(("buscar (NumPy)", lambda: buscar(vetor, alvo)))
+    for nome, funcao in casos:
+        print(f"  {nome:24} {formatar_ns(medir(funcao, amostras=3).mediana)}")
+
+    alvos = [lista[i] for i in range(0, n, n // 100)] + [-1]
+    um_por_vez = medir(lambda: [buscar(lista, valor) for valor in alvos], amostras=1)
+    uma_passada = medir(buscar_varios, lista, alvos, amostras=3)
+    print(f"\n{len(alvos)} alvos: um por vez {formatar_ns(um_por_vez.mediana)}, "
+          f"uma passada {formatar_ns(uma_passada.mediana)}")
+    print(f"ocorrências de {lista[0]}: {ocorrencias(compacto, lista[0])}, contagem {contar(visao, lista[0])}")
+
+    print("\nVarredura paralela com cancelamento (alvo no início e no fim):")
+    for modo, dados in (("threads", lista), ("processos", compacto)):
+        for posicao in (n // 10, n - 10):
+            tempo = medir(buscar_paralelo, dados, lista[posicao], None, BLOCO_PADRAO, modo, amostras=3)
+            print(f"  {modo:9} posição {posicao:>8}: {formatar_ns(tempo.mediana)}")
+
+if __name__ == "__main__":
+    main()